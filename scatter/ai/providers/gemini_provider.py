@@ -24,6 +24,12 @@ from scatter.ai.base import (
 )
 
 
+# Shared by every summarization request; built once rather than per call.
+_SUMMARY_SAFETY_SETTINGS = (
+    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+)
+
+
 # --- Module-level functions (provider-agnostic) ---
 # These accept any object with generate_content() — genai model, MagicMock, etc.
 
@@ -115,10 +121,7 @@ def summarize_file_with_model(model_instance, csharp_code: str, file_path: str)
         )
 
         logging.info(f"Requesting summary for {file_path} from Gemini API...")
-        safety_settings = [
-            {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"}
-        ]
-        response = model_instance.generate_content(prompt, safety_settings=safety_settings)
+        response = model_instance.generate_content(prompt, safety_settings=_SUMMARY_SAFETY_SETTINGS)
         logging.debug(f"Received Gemini response for {file_path}.")
 
         if not response.parts:
@@ -12,9 +12,11 @@ import logging
 import re
 import types
 from collections import defaultdict
-from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
 
 if TYPE_CHECKING:
     from scatter.analyzers.graph_enrichment import GraphContext
@@ -23,13 +25,22 @@ from scatter.ai.base import AIProvider
 from scatter.config import ScatterConfig
 from scatter.core.models import (
     DEFAULT_MAX_WORKERS,
+    DEFAULT_SUMMARY_WORKERS,
+    DEFAULT_MAX_SUMMARIZE_BYTES,
     DEFAULT_CHUNK_SIZE,
+    GENERATED_CS_SUFFIXES,
+    STAGE_CLASS,
+    STAGE_METHOD,
+    STAGE_NAMESPACE,
     ConsumerResult,
     FilterPipeline,
+    FilterStage,
     PropsImpact,
     RawConsumerDict,
+    ReferenceIndex,
 )
 from scatter.pipeline.resolver import PipelineResolver
+from scatter.store.summary_cache import SummaryCache, get_summary_cache_path, summary_cache_key
 
 
 @dataclass
@@ -52,6 +63,9 @@ class ModeContext:
     method_name: Optional[str] = None
     target_namespace: Optional[str] = None
     summarize_consumers: bool = False
+    summarize_workers: int = DEFAULT_SUMMARY_WORKERS
+    use_summary_cache: bool = True
+    max_summarize_bytes: int = DEFAULT_MAX_SUMMARIZE_BYTES
     max_workers: int = DEFAULT_MAX_WORKERS
     chunk_size: int = DEFAULT_CHUNK_SIZE
     disable_multiprocessing: bool = False
@@ -59,6 +73,11 @@ class ModeContext:
     csproj_analysis_chunk_size: int = 25
     no_graph: bool = False
     discovered_files: Optional[Dict] = None
+    # (directory, glob) → files, shared by every find_consumers call in a run
+    file_listing_cache: Dict[Tuple[Path, str], List[Path]] = field(default_factory=dict)
+    # Reverse ProjectReference index, shared by every find_consumers call in a run
+    reference_index: ReferenceIndex = field(default_factory=ReferenceIndex)
+    summary_cache: Optional[SummaryCache] = None  # mutable, opened on first summarization
 
 
 @dataclass
@@ -71,6 +90,24 @@ class ModeResult:
     props_impacts: List[PropsImpact] = field(default_factory=list)
 
 
+def _rel_posix(path: Path, base: Path) -> str:
+    """POSIX path of ``path`` relative to ``base``, or absolute when outside it.
+
+    The usual case — a path under the search scope — is a string prefix test;
+    Path.relative_to only runs for the rare path that does not share the
+    prefix verbatim.
+    """
+    path_str = path.as_posix()
+    base_str = base.as_posix()
+    prefix = base_str if base_str.endswith("/") else base_str + "/"
+    if path_str.startswith(prefix):
+        return path_str[len(prefix) :]
+    try:
+        return path.relative_to(base).as_posix()
+    except ValueError:
+        return path_str
+
+
 def _summarize_consumer_files(
     final_consumers_data: List[RawConsumerDict],
     all_results: List[ConsumerResult],
@@ -79,6 +116,10 @@ def _summarize_consumer_files(
     results_start_index: int,
     class_name: Optional[str] = None,
     method_name: Optional[str] = None,
+    max_workers: int = DEFAULT_SUMMARY_WORKERS,
+    use_summary_cache: bool = True,
+    max_file_bytes: int = DEFAULT_MAX_SUMMARIZE_BYTES,
+    summary_cache: Optional[SummaryCache] = None,
 ) -> None:
     """Summarize relevant files for each consumer and inject into result dicts.
 
@@ -101,6 +142,16 @@ def _summarize_consumer_files(
             so we can match consumers to their result dicts.
         class_name: Optional class name for method-focused prompts.
         method_name: Optional method name — triggers method-focused analysis.
+        max_workers: Maximum concurrent provider calls. Transient rate-limit
+            errors are retried with backoff by the provider's model proxy.
+        use_summary_cache: Read and update the persistent summary cache under
+            ``{search_scope}/.scatter``. When False every file is re-sent.
+        max_file_bytes: Files larger than this are skipped without being read,
+            as are generated files (``.Designer.cs``, ``.g.cs``, ``.g.i.cs``).
+        summary_cache: An already-open cache shared by earlier calls in the
+            same run; the caller saves it once the run ends. When omitted, one
+            is loaded (or started empty when ``use_summary_cache`` is False)
+            for this call alone and saved before returning.
     """
     from scatter.ai.base import (
         AITaskType,
@@ -109,6 +160,7 @@ def _summarize_consumer_files(
         SUMMARIZATION_PROMPT_TEMPLATE,
         classify_file_type,
     )
+    from scatter.scanners._helpers import read_text_prefix
 
     if not ai_provider or not final_consumers_data:
         return
@@ -138,13 +190,29 @@ def _summarize_consumer_files(
         f"Summarizing {total_files} file(s) across {len(consumer_files_map)} consumer(s)..."
     )
 
-    # Summarize each file and build summaries dict per consumer path
-    summaries_by_path: Dict[Path, Dict[str, str]] = defaultdict(dict)
-    file_counter = 0
+    # Build prompts up front (local file reads), then fan the network-bound
+    # provider calls out over a thread pool.
+    jobs: List[Tuple[Path, str, str]] = []  # (consumer_path, rel_path, prompt)
+    skipped = 0
     for consumer_path, file_paths in consumer_files_map.items():
         for file_path in file_paths:
+            if file_path.name.lower().endswith(GENERATED_CS_SUFFIXES):
+                logging.debug("Skipping generated file %s", file_path)
+                skipped += 1
+                continue
+            try:
+                size = file_path.stat().st_size
+            except OSError as e:
+                logging.warning(f"Could not read {file_path}: {e}")
+                continue
+            if size > max_file_bytes:
+                logging.debug("Skipping %s (%d bytes > %d)", file_path, size, max_file_bytes)
+                skipped += 1
+                continue
+
+            # Only the prompt's prefix of the file is ever sent
             try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
+                content = read_text_prefix(file_path, MAX_SUMMARIZATION_CHARS)
             except OSError as e:
                 logging.warning(f"Could not read {file_path}: {e}")
                 continue
@@ -164,35 +232,190 @@ def _summarize_consumer_files(
                     class_name=class_name,
                     method_name=method_name,
                     file_type=file_type,
-                    code=content[:MAX_SUMMARIZATION_CHARS],
+                    code=content,
                 )
             else:
                 prompt = SUMMARIZATION_PROMPT_TEMPLATE.format(
                     filename=file_path.name,
-                    code=content[:MAX_SUMMARIZATION_CHARS],
+                    code=content,
                 )
+            jobs.append((consumer_path, rel_path, prompt))
+
+    if skipped:
+        logging.info(f"Skipped {skipped} generated or oversized file(s) for summarization.")
+
+    def _summarize(job: Tuple[Path, str, str]) -> Optional[str]:
+        _, rel_path, prompt = job
+        try:
+            result = ai_provider.analyze(prompt, "", AITaskType.SUMMARIZATION)
+        except Exception as e:
+            logging.warning(f"Summarization failed for {rel_path}: {e}")
+            return None
+        return result.response if result and result.response else None
+
+    # Unchanged files summarized on a previous run are served from disk
+    owns_cache = summary_cache is None
+    if summary_cache is None:
+        summary_cache = _open_summary_cache(search_scope, use_summary_cache)
+    provider_name = str(getattr(ai_provider, "name", ""))
+    model_name = str(getattr(ai_provider, "model_name", ""))
+    cache_keys = [summary_cache_key(provider_name, model_name, prompt) for _, _, prompt in jobs]
+    responses: List[Optional[str]] = [summary_cache.get(key) for key in cache_keys]
+    pending = [i for i, response in enumerate(responses) if response is None]
+    if len(pending) < len(jobs):
+        logging.info(f"Reusing {len(jobs) - len(pending)} cached summary(ies).")
+
+    # A file relevant to several consumers produces the same prompt; send it once
+    first_pending_by_key: Dict[str, int] = {}
+    for i in pending:
+        first_pending_by_key.setdefault(cache_keys[i], i)
+    unique_pending = list(first_pending_by_key.values())
+
+    workers = min(len(unique_pending), max_workers)
+    if workers < 2:
+        fresh = [_summarize(jobs[i]) for i in unique_pending]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fresh = list(executor.map(_summarize, [jobs[i] for i in unique_pending]))
+    fresh_by_key = {cache_keys[i]: response for i, response in zip(unique_pending, fresh)}
+    for i in pending:
+        response = fresh_by_key[cache_keys[i]]
+        responses[i] = response
+        if response:
+            summary_cache.put(cache_keys[i], response)
+    if use_summary_cache and owns_cache:
+        summary_cache.save()
+
+    # Collect in submission order so summaries dicts are deterministic
+    summaries_by_path: Dict[Path, Dict[str, str]] = defaultdict(dict)
+    for file_counter, ((consumer_path, rel_path, _), response) in enumerate(
+        zip(jobs, responses), start=1
+    ):
+        if response:
+            summaries_by_path[consumer_path][rel_path] = response
+            logging.info(f"  Summarized {file_counter}/{total_files}: {rel_path}")
+
+    # Inject summaries into ConsumerResult objects by matching consumer_project_path.
+    # Relative paths are computed once per consumer, not once per (result, consumer).
+    summaries_by_rel: Dict[str, Dict[str, str]] = {}
+    for consumer_abs, summaries in summaries_by_path.items():
+        expected_rel = _rel_posix(consumer_abs, search_scope)
+        summaries_by_rel.setdefault(expected_rel, summaries)
 
-            try:
-                result = ai_provider.analyze(prompt, "", AITaskType.SUMMARIZATION)
-                file_counter += 1
-                if result and result.response:
-                    summaries_by_path[consumer_path][rel_path] = result.response
-                    logging.info(f"  Summarized {file_counter}/{total_files}: {rel_path}")
-            except Exception as e:
-                file_counter += 1
-                logging.warning(f"Summarization failed for {rel_path}: {e}")
-
-    # Inject summaries into ConsumerResult objects by matching consumer_project_path
     for result in all_results[results_start_index:]:
-        consumer_rel = result.consumer_project_path
-        for consumer_abs, summaries in summaries_by_path.items():
-            try:
-                expected_rel = consumer_abs.relative_to(search_scope).as_posix()
-            except ValueError:
-                expected_rel = consumer_abs.as_posix()
-            if consumer_rel == expected_rel:
-                result.consumer_file_summaries = summaries
-                break
+        summaries = summaries_by_rel.get(result.consumer_project_path)
+        if summaries is not None:
+            result.consumer_file_summaries = summaries
+
+
+def _open_summary_cache(search_scope: Path, use_summary_cache: bool) -> SummaryCache:
+    """Load the on-disk summary cache, or start an in-memory one when bypassed."""
+    cache_path = get_summary_cache_path(search_scope)
+    return SummaryCache.load(cache_path) if use_summary_cache else SummaryCache(cache_path)
+
+
+def _save_summary_cache(ctx: ModeContext) -> None:
+    """Write the run's shared summary cache once, after its last summarization."""
+    if ctx.use_summary_cache and ctx.summary_cache is not None:
+        ctx.summary_cache.save()
+
+
+class _SummaryQueue:
+    """Background summarization for one mode run.
+
+    Jobs run on a single thread so the shared summary cache stays sequential,
+    while the caller scans the next target. Leaving the ``with`` block waits
+    for every job and re-raises the first failure; when the block itself
+    raised, jobs not yet started are cancelled and its exception wins. Given
+    the run's ``ctx``, the summary cache is saved once on exit either way.
+    """
+
+    def __init__(self, ctx: Optional[ModeContext] = None) -> None:
+        self._ctx = ctx
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scatter-summarize")
+        self._pending: List["Future[None]"] = []
+
+    def submit(self, fn: Callable[..., None], *args, **kwargs) -> None:
+        self._pending.append(self._executor.submit(fn, *args, **kwargs))
+
+    def __enter__(self) -> "_SummaryQueue":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+            if exc_type is None:
+                for future in self._pending:
+                    future.result()
+        finally:
+            if self._ctx is not None:
+                _save_summary_cache(self._ctx)
+
+
+def _emit_consumer_results(
+    ctx: ModeContext,
+    resolver: PipelineResolver,
+    final_consumers_data: List[RawConsumerDict],
+    all_results: List[ConsumerResult],
+    target_project_name: str,
+    target_rel_path: str,
+    triggering_info: str,
+    class_name: Optional[str],
+    method_name: Optional[str],
+    summaries: Optional[_SummaryQueue] = None,
+) -> None:
+    """Append ConsumerResults for one target/trigger and summarize them if enabled.
+
+    Shared by every analysis mode so result building and summarization stay
+    identical across target, git and sproc runs. With ``summaries``, the
+    summarization is queued there so its provider round-trips overlap the
+    consumer scan of the next target; without it, it runs inline and the
+    caller saves the summary cache with ``_save_summary_cache`` when done.
+    """
+    from scatter.compat.v1_bridge import _build_consumer_results
+
+    results_before = len(all_results)
+    _build_consumer_results(
+        target_project_name=target_project_name,
+        target_project_rel_path_str=target_rel_path,
+        triggering_info=triggering_info,
+        final_consumers_data=final_consumers_data,
+        all_results_list=all_results,
+        pipeline_map_dict=ctx.pipeline_map,
+        solution_file_cache=ctx.solution_file_cache,
+        batch_job_map=ctx.batch_job_map,
+        search_scope_path_abs=ctx.search_scope,
+        solution_index=ctx.solution_index,
+        pipeline_resolver=resolver,
+    )
+
+    if ctx.summarize_consumers and ctx.ai_provider:
+        # One cache per run: later targets reuse summaries of files already
+        # seen without re-reading or rewriting the cache file for every call;
+        # the run saves it once when it ends.
+        if ctx.summary_cache is None:
+            ctx.summary_cache = _open_summary_cache(ctx.search_scope, ctx.use_summary_cache)
+        # Hand over only this target's rows: later targets keep appending to
+        # all_results while a queued job waits.
+        job_args = (
+            final_consumers_data,
+            all_results[results_before:],
+            ctx.ai_provider,
+            ctx.search_scope,
+            0,
+        )
+        job_kwargs = dict(
+            max_workers=ctx.summarize_workers,
+            use_summary_cache=ctx.use_summary_cache,
+            max_file_bytes=ctx.max_summarize_bytes,
+            summary_cache=ctx.summary_cache,
+            class_name=class_name,
+            method_name=method_name,
+        )
+        if summaries is not None:
+            summaries.submit(_summarize_consumer_files, *job_args, **job_kwargs)
+        else:
+            _summarize_consumer_files(*job_args, **job_kwargs)
 
 
 def _ensure_graph_context(ctx: ModeContext) -> None:
@@ -272,7 +495,6 @@ def run_target_analysis(ctx: ModeContext, target_csproj: Path) -> ModeResult:
     """
     from scatter.scanners.project_scanner import derive_namespace
     from scatter.analyzers.consumer_analyzer import find_consumers
-    from scatter.compat.v1_bridge import _build_consumer_results
 
     resolver = PipelineResolver(ctx.pipeline_map)
 
@@ -305,6 +527,8 @@ def run_target_analysis(ctx: ModeContext, target_csproj: Path) -> ModeResult:
         csproj_analysis_chunk_size=ctx.csproj_analysis_chunk_size,
         graph=ctx.graph_ctx.graph if ctx.graph_ctx else None,
         analysis_config=ctx.config.analysis,
+        listing_cache=ctx.file_listing_cache,
+        reference_index=ctx.reference_index,
     )
 
     all_results: List[ConsumerResult] = []
@@ -319,36 +543,20 @@ def run_target_analysis(ctx: ModeContext, target_csproj: Path) -> ModeResult:
         elif ctx.class_name:
             trigger_level = ctx.class_name
 
-        try:
-            target_rel_path_for_report = target_csproj.relative_to(ctx.search_scope).as_posix()
-        except ValueError:
-            target_rel_path_for_report = target_csproj.as_posix()
-
-        results_before = len(all_results)
-        _build_consumer_results(
-            target_project_name=target_project_name,
-            target_project_rel_path_str=target_rel_path_for_report,
-            triggering_info=trigger_level,
-            final_consumers_data=final_consumers_data,
-            all_results_list=all_results,
-            pipeline_map_dict=ctx.pipeline_map,
-            solution_file_cache=ctx.solution_file_cache,
-            batch_job_map=ctx.batch_job_map,
-            search_scope_path_abs=ctx.search_scope,
-            solution_index=ctx.solution_index,
-            pipeline_resolver=resolver,
+        target_rel_path_for_report = _rel_posix(target_csproj, ctx.search_scope)
+
+        _emit_consumer_results(
+            ctx,
+            resolver,
+            final_consumers_data,
+            all_results,
+            target_project_name,
+            target_rel_path_for_report,
+            trigger_level,
+            class_name=ctx.class_name,
+            method_name=ctx.method_name,
         )
-
-        if ctx.summarize_consumers and ctx.ai_provider:
-            _summarize_consumer_files(
-                final_consumers_data,
-                all_results,
-                ctx.ai_provider,
-                ctx.search_scope,
-                results_before,
-                class_name=ctx.class_name,
-                method_name=ctx.method_name,
-            )
+        _save_summary_cache(ctx)
     else:
         logging.info(
             f"No consuming projects matching the criteria were found for target '{target_project_name}'."
@@ -379,7 +587,7 @@ def run_git_analysis(
     from scatter.scanners.type_scanner import extract_type_names_from_content
     from scatter.scanners.project_scanner import derive_namespace
     from scatter.analyzers.consumer_analyzer import find_consumers
-    from scatter.compat.v1_bridge import _build_consumer_results
+    from scatter.core.parallel import analyze_cs_files_parallel
 
     resolver = PipelineResolver(ctx.pipeline_map)
 
@@ -401,62 +609,95 @@ def run_git_analysis(
         logging.info("\nStep 2: Extracting type declarations from changed C# files...")
         types_by_project: Dict[str, Set[str]] = defaultdict(set)
         files_processed_count = 0
-        types_extracted_count = 0
 
+        use_hybrid = bool(enable_hybrid and ctx.ai_provider)
+        changed_files: List[Tuple[str, str, Path]] = []  # (project, cs_rel, cs_abs)
         for proj_rel_path_str, cs_rel_paths_str in changed_projects_dict.items():
-            logging.debug(f"Processing project for type extraction: {proj_rel_path_str}")
-            project_types: Set[str] = set()
             for cs_rel_path_str in cs_rel_paths_str:
-                cs_abs_path = (repo_path / cs_rel_path_str).resolve()
-                files_processed_count += 1
-                logging.debug(f"   Reading file: {cs_abs_path}")
-                if cs_abs_path.is_file():
-                    try:
-                        content = cs_abs_path.read_text(encoding="utf-8", errors="ignore")
-                        extracted = None
-
-                        if enable_hybrid and ctx.ai_provider:
-                            diff_text = get_diff_for_file(
-                                str(repo_path),
-                                cs_rel_path_str,
-                                branch_name,
-                                base_branch,
-                            )
-                            if diff_text:
-                                extracted = ctx.ai_provider.extract_affected_symbols(
-                                    content,
-                                    diff_text,
-                                    cs_rel_path_str,
-                                )
-                                if extracted is None:
-                                    logging.warning(
-                                        f"LLM analysis failed for {cs_rel_path_str}, "
-                                        f"falling back to regex extraction."
-                                    )
-                                    extracted = extract_type_names_from_content(content)
-                            else:
-                                logging.debug(
-                                    f"No diff found for {cs_rel_path_str}, using regex extraction."
-                                )
-                                extracted = extract_type_names_from_content(content)
-                        else:
-                            extracted = extract_type_names_from_content(content)
+                changed_files.append(
+                    (proj_rel_path_str, cs_rel_path_str, (repo_path / cs_rel_path_str).resolve())
+                )
 
-                        if extracted:
-                            logging.debug(
-                                f"     Found types in {cs_rel_path_str}: {', '.join(extracted)}"
-                            )
-                            project_types.update(extracted)
-                    except OSError as e:
-                        logging.warning(f"Could not read C# file {cs_abs_path}: {e}")
+        def _hybrid_extract(job: Tuple[str, Path]) -> Optional[Set[str]]:
+            cs_rel_path_str, cs_abs_path = job
+            try:
+                content = cs_abs_path.read_text(encoding="utf-8", errors="ignore")
+            except OSError as e:
+                logging.warning(f"Could not read C# file {cs_abs_path}: {e}")
+                return None
+
+            diff_text = get_diff_for_file(
+                str(repo_path),
+                cs_rel_path_str,
+                branch_name,
+                base_branch,
+            )
+            if not diff_text:
+                logging.debug("No diff found for %s, using regex extraction.", cs_rel_path_str)
+                return extract_type_names_from_content(content)
+
+            extracted = ctx.ai_provider.extract_affected_symbols(
+                content,
+                diff_text,
+                cs_rel_path_str,
+            )
+            if extracted is None:
+                logging.warning(
+                    f"LLM analysis failed for {cs_rel_path_str}, falling back to regex extraction."
+                )
+                extracted = extract_type_names_from_content(content)
+            return extracted
+
+        existing_files = [
+            (cs_rel_path_str, cs_abs_path)
+            for _, cs_rel_path_str, cs_abs_path in changed_files
+            if cs_abs_path.is_file()
+        ]
+        extracted_by_file: Dict[Path, Optional[Set[str]]] = {}
+        if use_hybrid:
+            # Per-file diff + AI calls are subprocess/network-bound — overlap
+            # them on threads, bounded like consumer summarization.
+            workers = min(len(existing_files), ctx.summarize_workers)
+            if workers < 2:
+                hybrid_results = [_hybrid_extract(job) for job in existing_files]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    hybrid_results = list(executor.map(_hybrid_extract, existing_files))
+            for (_, cs_abs_path), extracted in zip(existing_files, hybrid_results):
+                extracted_by_file[cs_abs_path] = extracted
+        else:
+            # Regex extraction is CPU-bound — run it over all changed files at
+            # once on the process pool.
+            regex_results = analyze_cs_files_parallel(
+                [cs_abs_path for _, cs_abs_path in existing_files],
+                {"analysis_type": "types"},
+                max_workers=ctx.max_workers,
+                cs_analysis_chunk_size=ctx.cs_analysis_chunk_size,
+                disable_multiprocessing=ctx.disable_multiprocessing,
+            )
+            for cs_abs_path, file_result in regex_results.items():
+                if file_result.get("error"):
+                    logging.warning(f"Could not read C# file {cs_abs_path}: {file_result['error']}")
+                    extracted_by_file[cs_abs_path] = None
                 else:
-                    logging.warning(
-                        f"Changed C# file not found on disk (might be deleted/moved): {cs_abs_path}"
+                    extracted_by_file[cs_abs_path] = set(file_result["matches"])
+
+        for proj_rel_path_str, cs_rel_path_str, cs_abs_path in changed_files:
+            files_processed_count += 1
+            if cs_abs_path not in extracted_by_file:
+                logging.warning(
+                    f"Changed C# file not found on disk (might be deleted/moved): {cs_abs_path}"
+                )
+                continue
+            extracted = extracted_by_file[cs_abs_path]
+            if extracted:
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug(
+                        "     Found types in %s: %s", cs_rel_path_str, ", ".join(extracted)
                     )
+                types_by_project[proj_rel_path_str].update(extracted)
 
-            if project_types:
-                types_by_project[proj_rel_path_str] = project_types
-                types_extracted_count += len(project_types)
+        types_extracted_count = sum(len(types) for types in types_by_project.values())
 
         logging.info(f"Processed {files_processed_count} changed C# files.")
         if not types_by_project:
@@ -472,122 +713,140 @@ def run_git_analysis(
 
             logging.info("\nStep 3: Analyzing consumers...")
             processed_targets_count = 0
-            for target_project_rel_path_str, extracted_types in types_by_project.items():
-                processed_targets_count += 1
-                target_csproj_abs = (repo_path / target_project_rel_path_str).resolve()
-                target_project_name = target_csproj_abs.stem
-
-                logging.info(
-                    f"\n--- Analyzing Target Project "
-                    f"{processed_targets_count}/{len(types_by_project)}: "
-                    f"{target_project_name} ({target_project_rel_path_str}) ---"
-                )
-
-                if not target_csproj_abs.is_file():
-                    logging.warning(
-                        f"Target project file '{target_csproj_abs}' not found on disk. Skipping."
-                    )
-                    continue
+            with _SummaryQueue(ctx) as summaries:
+                for target_project_rel_path_str, extracted_types in types_by_project.items():
+                    processed_targets_count += 1
+                    target_csproj_abs = (repo_path / target_project_rel_path_str).resolve()
+                    target_project_name = target_csproj_abs.stem
 
-                target_namespace_str = derive_namespace(target_csproj_abs)
-                if not target_namespace_str:
-                    logging.warning(
-                        f"Could not derive namespace for {target_project_name}. "
-                        f"Consumer analysis may be incomplete."
+                    logging.info(
+                        f"\n--- Analyzing Target Project "
+                        f"{processed_targets_count}/{len(types_by_project)}: "
+                        f"{target_project_name} ({target_project_rel_path_str}) ---"
                     )
-                    target_namespace_str = f"NAMESPACE_ERROR_{target_project_name}"
 
-                types_to_analyze: Set[str]
-                if ctx.class_name:
-                    if ctx.class_name in extracted_types:
-                        types_to_analyze = {ctx.class_name}
-                        logging.info(
-                            f"Filtering analysis to explicitly provided type "
-                            f"(found in changes): '{ctx.class_name}'"
+                    if not target_csproj_abs.is_file():
+                        logging.warning(
+                            f"Target project file '{target_csproj_abs}' not found on disk. Skipping."
+                        )
+                        continue
+
+                    target_proj_rel = _rel_posix(target_csproj_abs, repo_path)
+                    target_namespace_str = derive_namespace(target_csproj_abs)
+                    if not target_namespace_str:
+                        logging.warning(
+                            f"Could not derive namespace for {target_project_name}. "
+                            f"Consumer analysis may be incomplete."
                         )
+                        target_namespace_str = f"NAMESPACE_ERROR_{target_project_name}"
+
+                    types_to_analyze: Set[str]
+                    if ctx.class_name:
+                        if ctx.class_name in extracted_types:
+                            types_to_analyze = {ctx.class_name}
+                            logging.info(
+                                f"Filtering analysis to explicitly provided type "
+                                f"(found in changes): '{ctx.class_name}'"
+                            )
+                        else:
+                            logging.info(
+                                f"Explicitly provided type '{ctx.class_name}' "
+                                f"was NOT found in changed files. Skipping."
+                            )
+                            types_to_analyze = set()
                     else:
+                        types_to_analyze = extracted_types
                         logging.info(
-                            f"Explicitly provided type '{ctx.class_name}' "
-                            f"was NOT found in changed files. Skipping."
+                            f"Analyzing consumers for {len(types_to_analyze)} types "
+                            f"detected in changed files: "
+                            f"{', '.join(sorted(types_to_analyze))}"
                         )
-                        types_to_analyze = set()
-                else:
-                    types_to_analyze = extracted_types
-                    logging.info(
-                        f"Analyzing consumers for {len(types_to_analyze)} types "
-                        f"detected in changed files: "
-                        f"{', '.join(sorted(types_to_analyze))}"
-                    )
 
-                if not types_to_analyze:
-                    continue
-
-                for type_name_to_check in sorted(list(types_to_analyze)):
-                    logging.info(f"   Checking for consumers of type: '{type_name_to_check}'...")
-
-                    method_filter = (
-                        ctx.method_name if ctx.class_name == type_name_to_check else None
-                    )
-                    if method_filter:
-                        logging.info(f"     (Including method filter: '{method_filter}')")
+                    if not types_to_analyze:
+                        continue
+
+                    # Several changed types in one project: as in sproc mode, run
+                    # the namespace scan once and filter by each type locally
+                    # rather than repeating stages 1-3 per type.
+                    namespace_consumers: Optional[List[RawConsumerDict]] = None
+                    if len(types_to_analyze) > 1:
+                        namespace_consumers, ns_pipeline = find_consumers(
+                            target_csproj_abs,
+                            ctx.search_scope,
+                            target_namespace_str,
+                            None,
+                            None,
+                            max_workers=ctx.max_workers,
+                            chunk_size=ctx.chunk_size,
+                            disable_multiprocessing=ctx.disable_multiprocessing,
+                            cs_analysis_chunk_size=ctx.cs_analysis_chunk_size,
+                            csproj_analysis_chunk_size=ctx.csproj_analysis_chunk_size,
+                            graph=ctx.graph_ctx.graph if ctx.graph_ctx else None,
+                            analysis_config=ctx.config.analysis,
+                            listing_cache=ctx.file_listing_cache,
+                            reference_index=ctx.reference_index,
+                        )
 
-                    final_consumers_data, _pipeline = find_consumers(
-                        target_csproj_abs,
-                        ctx.search_scope,
-                        target_namespace_str,
-                        type_name_to_check,
-                        method_filter,
-                        max_workers=ctx.max_workers,
-                        chunk_size=ctx.chunk_size,
-                        disable_multiprocessing=ctx.disable_multiprocessing,
-                        cs_analysis_chunk_size=ctx.cs_analysis_chunk_size,
-                        csproj_analysis_chunk_size=ctx.csproj_analysis_chunk_size,
-                        graph=ctx.graph_ctx.graph if ctx.graph_ctx else None,
-                        analysis_config=ctx.config.analysis,
-                    )
+                    for type_name_to_check in sorted(types_to_analyze):
+                        logging.info(
+                            f"   Checking for consumers of type: '{type_name_to_check}'..."
+                        )
 
-                    # Keep the first pipeline that produced results; fall back to last
-                    if filter_pipeline is None or final_consumers_data:
-                        filter_pipeline = _pipeline
-
-                    if final_consumers_data:
-                        try:
-                            target_proj_rel = target_csproj_abs.relative_to(repo_path).as_posix()
-                        except ValueError:
-                            target_proj_rel = target_csproj_abs.as_posix()
-
-                        results_before = len(all_results)
-                        _build_consumer_results(
-                            target_project_name=target_project_name,
-                            target_project_rel_path_str=target_proj_rel,
-                            triggering_info=type_name_to_check,
-                            final_consumers_data=final_consumers_data,
-                            all_results_list=all_results,
-                            pipeline_map_dict=ctx.pipeline_map,
-                            solution_file_cache=ctx.solution_file_cache,
-                            batch_job_map=ctx.batch_job_map,
-                            search_scope_path_abs=ctx.search_scope,
-                            solution_index=ctx.solution_index,
-                            pipeline_resolver=resolver,
+                        method_filter = (
+                            ctx.method_name if ctx.class_name == type_name_to_check else None
                         )
+                        if method_filter:
+                            logging.info(f"     (Including method filter: '{method_filter}')")
+
+                        if namespace_consumers is not None:
+                            final_consumers_data, _pipeline = _filter_consumers_by_class(
+                                ctx,
+                                namespace_consumers,
+                                ns_pipeline,
+                                type_name_to_check,
+                                method_filter,
+                            )
+                        else:
+                            final_consumers_data, _pipeline = find_consumers(
+                                target_csproj_abs,
+                                ctx.search_scope,
+                                target_namespace_str,
+                                type_name_to_check,
+                                method_filter,
+                                max_workers=ctx.max_workers,
+                                chunk_size=ctx.chunk_size,
+                                disable_multiprocessing=ctx.disable_multiprocessing,
+                                cs_analysis_chunk_size=ctx.cs_analysis_chunk_size,
+                                csproj_analysis_chunk_size=ctx.csproj_analysis_chunk_size,
+                                graph=ctx.graph_ctx.graph if ctx.graph_ctx else None,
+                                analysis_config=ctx.config.analysis,
+                                listing_cache=ctx.file_listing_cache,
+                                reference_index=ctx.reference_index,
+                            )
+
+                        # Keep the first pipeline that produced results; fall back to last
+                        if filter_pipeline is None or final_consumers_data:
+                            filter_pipeline = _pipeline
 
-                        if ctx.summarize_consumers and ctx.ai_provider:
-                            _summarize_consumer_files(
+                        if final_consumers_data:
+                            _emit_consumer_results(
+                                ctx,
+                                resolver,
                                 final_consumers_data,
                                 all_results,
-                                ctx.ai_provider,
-                                ctx.search_scope,
-                                results_before,
+                                target_project_name,
+                                target_proj_rel,
+                                type_name_to_check,
                                 class_name=ctx.class_name,
                                 method_name=ctx.method_name,
+                                summaries=summaries,
+                            )
+                        else:
+                            logging.info(
+                                f"     No consumers found for type "
+                                f"'{type_name_to_check}' in project "
+                                f"'{target_project_name}'."
                             )
-
-                    else:
-                        logging.info(
-                            f"     No consumers found for type "
-                            f"'{type_name_to_check}' in project "
-                            f"'{target_project_name}'."
-                        )
 
     _apply_graph_enrichment(all_results, ctx)
 
@@ -629,6 +888,138 @@ def run_git_analysis(
     )
 
 
+@lru_cache(maxsize=256)
+def _class_filter_patterns(
+    class_name: str, method_name: Optional[str]
+) -> Tuple["re.Pattern[bytes]", Optional["re.Pattern[bytes]"]]:
+    """Bytes class and member-call patterns for _filter_consumers_by_class().
+
+    Used by git and sproc modes alike. The same class can be filtered for
+    several target projects in one run, so compiled patterns are cached per
+    (class, method) pair.
+    """
+    class_pattern = re.compile(rb"\b" + re.escape(class_name.encode()) + rb"\b")
+    method_pattern = (
+        re.compile(rb"\.\s*" + re.escape(method_name.encode()) + rb"\s*\(") if method_name else None
+    )
+    return class_pattern, method_pattern
+
+
+def _filter_consumers_by_class(
+    ctx: ModeContext,
+    namespace_consumers: List[RawConsumerDict],
+    namespace_pipeline: FilterPipeline,
+    class_name: str,
+    method_name: Optional[str],
+) -> Tuple[List[RawConsumerDict], FilterPipeline]:
+    """Narrow a class-less find_consumers() result to consumers of one class.
+
+    Used when several classes share a target project: the namespace scan runs
+    once and each class is then checked against just the namespace-matching
+    files, with the same fused scan find_consumers() runs for stages 4-5 —
+    including AST validation when hybrid mode is active.
+
+    Returns the matching consumers and a copy of ``namespace_pipeline``
+    extended with the class (and method) stages, so the funnel reads the same
+    as a per-class find_consumers() call would.
+    """
+    from scatter.core.parallel import analyze_cs_files_parallel
+
+    pipeline = replace(
+        namespace_pipeline,
+        stages=list(namespace_pipeline.stages),
+        class_filter=class_name,
+        method_filter=method_name,
+    )
+    # find_consumers() stops before the class stage when nothing passed the
+    # namespace check; a class-less call then returns the direct consumers.
+    namespace_stage = next((s for s in pipeline.stages if s.name == STAGE_NAMESPACE), None)
+    if namespace_stage is None or namespace_stage.output_count == 0:
+        return [], pipeline
+
+    consumer_to_files: Dict[Path, List[Path]] = {}
+    all_relevant_files: List[Path] = []
+    for consumer in namespace_consumers:
+        files = [f for f in consumer.get("relevant_files", []) if isinstance(f, Path)]
+        consumer_to_files[consumer["consumer_path"]] = files
+        all_relevant_files.extend(files)
+    pipeline.total_files_scanned += len(all_relevant_files)
+
+    filter_results: Dict[Path, Dict] = {}
+    if all_relevant_files:
+        use_ast = bool(ctx.config.analysis and ctx.config.analysis.parser_mode == "hybrid")
+        class_pattern, method_pattern = _class_filter_patterns(class_name, method_name)
+        filter_config = {
+            "analysis_type": "consumer",
+            "using_pattern": None,
+            "class_name": class_name,
+            "class_pattern": class_pattern,
+            "method_name": method_name,
+            "method_pattern": method_pattern,
+            "literals": {
+                "class": class_name.encode(),
+                "method": method_name.encode() if method_name else b"",
+            },
+            "use_ast": use_ast,
+        }
+        filter_results = analyze_cs_files_parallel(
+            all_relevant_files,
+            filter_config,
+            max_workers=ctx.max_workers,
+            cs_analysis_chunk_size=ctx.cs_analysis_chunk_size,
+            disable_multiprocessing=ctx.disable_multiprocessing,
+        )
+
+    class_filtered: List[RawConsumerDict] = []
+    for consumer in namespace_consumers:
+        consumer_path = consumer["consumer_path"]
+        class_files = [
+            f
+            for f in consumer_to_files.get(consumer_path, [])
+            if filter_results.get(f, {}).get("class_match")
+        ]
+        if class_files:
+            class_filtered.append(
+                RawConsumerDict(
+                    consumer_path=consumer_path,
+                    consumer_name=consumer["consumer_name"],
+                    relevant_files=class_files,
+                )
+            )
+    pipeline.stages.append(
+        FilterStage(
+            name=STAGE_CLASS,
+            input_count=len(namespace_consumers),
+            output_count=len(class_filtered),
+        )
+    )
+    if not method_name or not class_filtered:
+        return class_filtered, pipeline
+
+    method_filtered: List[RawConsumerDict] = []
+    for consumer in class_filtered:
+        pipeline.total_files_scanned += len(consumer["relevant_files"])
+        method_files = [
+            f for f in consumer["relevant_files"] if filter_results.get(f, {}).get("method_match")
+        ]
+        if method_files:
+            method_filtered.append(
+                RawConsumerDict(
+                    consumer_path=consumer["consumer_path"],
+                    consumer_name=consumer["consumer_name"],
+                    relevant_files=method_files,
+                )
+            )
+    pipeline.stages.append(
+        FilterStage(
+            name=STAGE_METHOD,
+            input_count=len(class_filtered),
+            output_count=len(method_filtered),
+        )
+    )
+    return method_filtered, pipeline
+
+
 def run_sproc_analysis(
     ctx: ModeContext,
     sproc_name: str,
@@ -640,9 +1031,9 @@ def run_sproc_analysis(
     classes across the search scope.
     """
     from scatter.scanners.project_scanner import derive_namespace
+    from scatter.core.parallel import extract_exclude_dirs
     from scatter.scanners.sproc_scanner import find_cs_files_referencing_sproc
     from scatter.analyzers.consumer_analyzer import find_consumers
-    from scatter.compat.v1_bridge import _build_consumer_results
 
     resolver = PipelineResolver(ctx.pipeline_map)
 
@@ -660,6 +1051,7 @@ def run_sproc_analysis(
         chunk_size=ctx.chunk_size,
         disable_multiprocessing=ctx.disable_multiprocessing,
         cs_analysis_chunk_size=ctx.cs_analysis_chunk_size,
+        exclude_dirs=extract_exclude_dirs(ctx.config.exclude_patterns),
     )
 
     if not project_class_sproc_map:
@@ -672,133 +1064,128 @@ def run_sproc_analysis(
         f"{len(project_class_sproc_map)} project(s) referencing sproc '{sproc_name}'."
     )
 
+    # Apply --class-name before the per-project loop so projects without the
+    # class never pay for namespace derivation (a .csproj parse).
+    if ctx.class_name:
+        project_class_sproc_map = {
+            proj: {ctx.class_name: classes[ctx.class_name]}
+            for proj, classes in project_class_sproc_map.items()
+            if ctx.class_name in classes
+        }
+        if not project_class_sproc_map:
+            logging.info(
+                f"Class '{ctx.class_name}' does not reference stored procedure '{sproc_name}'."
+            )
+            return ModeResult()
+        total_classes_found = len(project_class_sproc_map)
+
     all_results: List[ConsumerResult] = []
     filter_pipeline: Optional[FilterPipeline] = None
     processed_targets_count = 0
 
     graph = ctx.graph_ctx.graph if ctx.graph_ctx else None
 
-    for target_csproj_abs, classes_dict in project_class_sproc_map.items():
-        target_project_name = target_csproj_abs.stem
-        try:
-            target_project_rel_path_str = target_csproj_abs.relative_to(ctx.search_scope).as_posix()
-        except ValueError:
-            target_project_rel_path_str = target_csproj_abs.as_posix()
-
-        target_namespace_str = ctx.target_namespace or derive_namespace(target_csproj_abs)
-        if not target_namespace_str:
-            logging.warning(
-                f"Could not derive namespace for {target_project_name}. "
-                f"Consumer analysis may be incomplete."
-            )
-            target_namespace_str = f"NAMESPACE_ERROR_{target_project_name}"
-
-        # Filter classes by --class-name if specified
-        class_names_to_analyze = list(classes_dict.keys())
-        if ctx.class_name:
-            class_names_to_analyze = [c for c in class_names_to_analyze if c == ctx.class_name]
-            if not class_names_to_analyze:
-                processed_targets_count += len(classes_dict)
-                continue
+    with _SummaryQueue(ctx) as summaries:
+        for target_csproj_abs, classes_dict in project_class_sproc_map.items():
+            target_project_name = target_csproj_abs.stem
+            target_project_rel_path_str = _rel_posix(target_csproj_abs, ctx.search_scope)
 
-        # --- Early exit: skip if all graph consumers are test projects ---
-        if graph and ctx.config.analysis and ctx.config.analysis.exclude_test_projects:
-            from scatter.analyzers.consumer_analyzer import is_test_project
-
-            graph_consumers = graph.get_consumers(target_project_name)
-            test_patterns = ctx.config.analysis.test_project_patterns
-            non_test_consumers = [
-                c for c in graph_consumers if not is_test_project(c.name, test_patterns)
-            ]
-            if not non_test_consumers:
-                for cls in class_names_to_analyze:
-                    processed_targets_count += 1
-                    logging.info(
-                        f"\n--- Analyzing Consumers for Class {processed_targets_count}/"
-                        f"{total_classes_found}: '{cls}' in Project: "
-                        f"{target_project_name} ---"
-                    )
-                    logging.info(
-                        f"   No non-test consumers for target '{target_project_name}' "
-                        f"— skipping consumer analysis for '{cls}'."
-                    )
-                continue
-
-        # --- Deduplication: one find_consumers() call per project ---
-        # When a project has multiple classes referencing the sproc, run the
-        # namespace scan once (class_name=None) then filter by class locally.
-        # For single-class projects, pass class_name directly (no change).
-        # This avoids re-scanning 200+ consumer projects per extra class.
-        if len(class_names_to_analyze) == 1:
-            # Single class — existing path, no behavior change
-            class_containing_sproc = class_names_to_analyze[0]
-            processed_targets_count += 1
-
-            method_filter = (
-                ctx.method_name
-                if ctx.class_name and ctx.class_name == class_containing_sproc
-                else None
-            )
+            target_namespace_str = ctx.target_namespace or derive_namespace(target_csproj_abs)
+            if not target_namespace_str:
+                logging.warning(
+                    f"Could not derive namespace for {target_project_name}. "
+                    f"Consumer analysis may be incomplete."
+                )
+                target_namespace_str = f"NAMESPACE_ERROR_{target_project_name}"
+
+            class_names_to_analyze = list(classes_dict.keys())
+
+            # --- Early exit: skip if all graph consumers are test projects ---
+            if graph and ctx.config.analysis and ctx.config.analysis.exclude_test_projects:
+                from scatter.analyzers.consumer_analyzer import is_test_project
+
+                graph_consumers = graph.get_consumers(target_project_name)
+                test_patterns = ctx.config.analysis.test_project_patterns
+                non_test_consumers = [
+                    c for c in graph_consumers if not is_test_project(c.name, test_patterns)
+                ]
+                if not non_test_consumers:
+                    for cls in class_names_to_analyze:
+                        processed_targets_count += 1
+                        logging.info(
+                            f"\n--- Analyzing Consumers for Class {processed_targets_count}/"
+                            f"{total_classes_found}: '{cls}' in Project: "
+                            f"{target_project_name} ---"
+                        )
+                        logging.info(
+                            f"   No non-test consumers for target '{target_project_name}' "
+                            f"— skipping consumer analysis for '{cls}'."
+                        )
+                    continue
 
-            logging.info(
-                f"\n--- Analyzing Consumers for Class {processed_targets_count}/"
-                f"{total_classes_found}: '{class_containing_sproc}' in Project: "
-                f"{target_project_name} ---"
-            )
+            # --- Deduplication: one find_consumers() call per project ---
+            # When a project has multiple classes referencing the sproc, run the
+            # namespace scan once (class_name=None) then filter by class locally.
+            # For single-class projects, pass class_name directly (no change).
+            # This avoids re-scanning 200+ consumer projects per extra class.
+            if len(class_names_to_analyze) == 1:
+                # Single class — existing path, no behavior change
+                class_containing_sproc = class_names_to_analyze[0]
+                processed_targets_count += 1
 
-            report_trigger_info = f"{class_containing_sproc} (via Sproc: {sproc_name})"
-            if method_filter:
-                report_trigger_info = (
-                    f"{class_containing_sproc}.{method_filter} (via Sproc: {sproc_name})"
+                method_filter = (
+                    ctx.method_name
+                    if ctx.class_name and ctx.class_name == class_containing_sproc
+                    else None
                 )
 
-            try:
-                final_consumers_data, _pipeline = find_consumers(
-                    target_csproj_path=target_csproj_abs,
-                    search_scope_path=ctx.search_scope,
-                    target_namespace=target_namespace_str,
-                    class_name=class_containing_sproc,
-                    method_name=method_filter,
-                    max_workers=ctx.max_workers,
-                    chunk_size=ctx.chunk_size,
-                    disable_multiprocessing=ctx.disable_multiprocessing,
-                    cs_analysis_chunk_size=ctx.cs_analysis_chunk_size,
-                    csproj_analysis_chunk_size=ctx.csproj_analysis_chunk_size,
-                    graph=graph,
-                    analysis_config=ctx.config.analysis,
-                )
-            except Exception:
-                logging.exception(
-                    f"Consumer analysis failed for project '{target_project_name}', "
-                    f"class '{class_containing_sproc}' — skipping."
+                logging.info(
+                    f"\n--- Analyzing Consumers for Class {processed_targets_count}/"
+                    f"{total_classes_found}: '{class_containing_sproc}' in Project: "
+                    f"{target_project_name} ---"
                 )
-                continue
 
-            if filter_pipeline is None or final_consumers_data:
-                filter_pipeline = _pipeline
-
-            results_before = len(all_results)
-            _build_consumer_results(
-                target_project_name=target_project_name,
-                target_project_rel_path_str=target_project_rel_path_str,
-                triggering_info=report_trigger_info,
-                final_consumers_data=final_consumers_data,
-                all_results_list=all_results,
-                pipeline_map_dict=ctx.pipeline_map,
-                solution_file_cache=ctx.solution_file_cache,
-                batch_job_map=ctx.batch_job_map,
-                search_scope_path_abs=ctx.search_scope,
-                solution_index=ctx.solution_index,
-                pipeline_resolver=resolver,
-            )
+                report_trigger_info = f"{class_containing_sproc} (via Sproc: {sproc_name})"
+                if method_filter:
+                    report_trigger_info = (
+                        f"{class_containing_sproc}.{method_filter} (via Sproc: {sproc_name})"
+                    )
 
-            if ctx.summarize_consumers and ctx.ai_provider:
-                _summarize_consumer_files(
+                try:
+                    final_consumers_data, _pipeline = find_consumers(
+                        target_csproj_path=target_csproj_abs,
+                        search_scope_path=ctx.search_scope,
+                        target_namespace=target_namespace_str,
+                        class_name=class_containing_sproc,
+                        method_name=method_filter,
+                        max_workers=ctx.max_workers,
+                        chunk_size=ctx.chunk_size,
+                        disable_multiprocessing=ctx.disable_multiprocessing,
+                        cs_analysis_chunk_size=ctx.cs_analysis_chunk_size,
+                        csproj_analysis_chunk_size=ctx.csproj_analysis_chunk_size,
+                        graph=graph,
+                        analysis_config=ctx.config.analysis,
+                        listing_cache=ctx.file_listing_cache,
+                        reference_index=ctx.reference_index,
+                    )
+                except Exception:
+                    logging.exception(
+                        f"Consumer analysis failed for project '{target_project_name}', "
+                        f"class '{class_containing_sproc}' — skipping."
+                    )
+                    continue
+
+                if filter_pipeline is None or final_consumers_data:
+                    filter_pipeline = _pipeline
+
+                _emit_consumer_results(
+                    ctx,
+                    resolver,
                     final_consumers_data,
                     all_results,
-                    ctx.ai_provider,
-                    ctx.search_scope,
-                    results_before,
+                    target_project_name,
+                    target_project_rel_path_str,
+                    report_trigger_info,
                     class_name=class_containing_sproc,
                     # Only apply method filter when the user explicitly targeted
                     # this class via --class-name. Otherwise, sproc scanner found
@@ -807,183 +1194,90 @@ def run_sproc_analysis(
                     method_name=ctx.method_name
                     if ctx.class_name == class_containing_sproc
                     else None,
+                    summaries=summaries,
                 )
-        else:
-            # Multiple classes in the same project — run namespace scan once,
-            # then filter by each class locally. Saves re-scanning 200+ consumer
-            # projects per extra class (the 72% bottleneck from perf_runs/1.txt).
-            logging.info(
-                f"\n--- Analyzing Consumers for {len(class_names_to_analyze)} classes "
-                f"in Project: {target_project_name} (deduplicated namespace scan) ---"
-            )
-
-            try:
-                namespace_consumers, ns_pipeline = find_consumers(
-                    target_csproj_path=target_csproj_abs,
-                    search_scope_path=ctx.search_scope,
-                    target_namespace=target_namespace_str,
-                    class_name=None,
-                    method_name=None,
-                    max_workers=ctx.max_workers,
-                    chunk_size=ctx.chunk_size,
-                    disable_multiprocessing=ctx.disable_multiprocessing,
-                    cs_analysis_chunk_size=ctx.cs_analysis_chunk_size,
-                    csproj_analysis_chunk_size=ctx.csproj_analysis_chunk_size,
-                    graph=graph,
-                    analysis_config=ctx.config.analysis,
-                )
-            except Exception:
-                skipped_classes = ", ".join(f"'{c}'" for c in class_names_to_analyze)
-                logging.exception(
-                    f"Consumer analysis failed for project '{target_project_name}' "
-                    f"— skipping classes: {skipped_classes}."
-                )
-                processed_targets_count += len(class_names_to_analyze)
-                continue
-
-            if filter_pipeline is None or namespace_consumers:
-                filter_pipeline = ns_pipeline
-
-            # Collect all relevant files from namespace consumers for class filtering.
-            # Build a consumer-to-files map so we can partition results per class.
-            consumer_to_files: Dict[Path, List[Path]] = {}
-            all_relevant_files: List[Path] = []
-            for consumer in namespace_consumers:
-                files = [f for f in consumer.get("relevant_files", []) if isinstance(f, Path)]
-                consumer_to_files[consumer["consumer_path"]] = files
-                all_relevant_files.extend(files)
-
-            # Resolve AST mode once for all class filters
-            use_ast = False
-            if ctx.config.analysis:
-                use_ast = ctx.config.analysis.parser_mode == "hybrid"
-
-            for class_containing_sproc in class_names_to_analyze:
-                processed_targets_count += 1
+            else:
+                # Multiple classes in the same project — run namespace scan once,
+                # then filter by each class locally. Saves re-scanning 200+ consumer
+                # projects per extra class (the 72% bottleneck from perf_runs/1.txt).
                 logging.info(
-                    f"\n--- Filtering for Class {processed_targets_count}/"
-                    f"{total_classes_found}: '{class_containing_sproc}' in Project: "
-                    f"{target_project_name} ---"
+                    f"\n--- Analyzing Consumers for {len(class_names_to_analyze)} classes "
+                    f"in Project: {target_project_name} (deduplicated namespace scan) ---"
                 )
 
-                method_filter = (
-                    ctx.method_name
-                    if ctx.class_name and ctx.class_name == class_containing_sproc
-                    else None
-                )
+                try:
+                    namespace_consumers, ns_pipeline = find_consumers(
+                        target_csproj_path=target_csproj_abs,
+                        search_scope_path=ctx.search_scope,
+                        target_namespace=target_namespace_str,
+                        class_name=None,
+                        method_name=None,
+                        max_workers=ctx.max_workers,
+                        chunk_size=ctx.chunk_size,
+                        disable_multiprocessing=ctx.disable_multiprocessing,
+                        cs_analysis_chunk_size=ctx.cs_analysis_chunk_size,
+                        csproj_analysis_chunk_size=ctx.csproj_analysis_chunk_size,
+                        graph=graph,
+                        analysis_config=ctx.config.analysis,
+                        listing_cache=ctx.file_listing_cache,
+                        reference_index=ctx.reference_index,
+                    )
+                except Exception:
+                    skipped_classes = ", ".join(f"'{c}'" for c in class_names_to_analyze)
+                    logging.exception(
+                        f"Consumer analysis failed for project '{target_project_name}' "
+                        f"— skipping classes: {skipped_classes}."
+                    )
+                    processed_targets_count += len(class_names_to_analyze)
+                    continue
 
-                report_trigger_info = f"{class_containing_sproc} (via Sproc: {sproc_name})"
-                if method_filter:
-                    report_trigger_info = (
-                        f"{class_containing_sproc}.{method_filter} (via Sproc: {sproc_name})"
+                if filter_pipeline is None or namespace_consumers:
+                    filter_pipeline = ns_pipeline
+
+                for class_containing_sproc in class_names_to_analyze:
+                    processed_targets_count += 1
+                    logging.info(
+                        f"\n--- Filtering for Class {processed_targets_count}/"
+                        f"{total_classes_found}: '{class_containing_sproc}' in Project: "
+                        f"{target_project_name} ---"
                     )
 
-                # Class filter using analyze_cs_files_parallel — same path as
-                # find_consumers() stage 4, including AST validation when hybrid
-                # mode is active. Avoids the false-positive divergence that a
-                # plain regex would cause.
-                from scatter.core.parallel import analyze_cs_files_parallel
-
-                class_pattern = re.compile(rf"\b{re.escape(class_containing_sproc)}\b")
-                class_stage_config = {
-                    "analysis_type": "class",
-                    "class_name": class_containing_sproc,
-                    "class_pattern": class_pattern,
-                    "use_ast": use_ast,
-                }
-
-                class_results = analyze_cs_files_parallel(
-                    all_relevant_files,
-                    class_stage_config,
-                    max_workers=ctx.max_workers,
-                    cs_analysis_chunk_size=ctx.cs_analysis_chunk_size,
-                    disable_multiprocessing=ctx.disable_multiprocessing,
-                )
+                    method_filter = (
+                        ctx.method_name
+                        if ctx.class_name and ctx.class_name == class_containing_sproc
+                        else None
+                    )
 
-                class_filtered: List[RawConsumerDict] = []
-                for consumer in namespace_consumers:
-                    consumer_path = consumer["consumer_path"]
-                    matching_files = [
-                        f
-                        for f in consumer_to_files.get(consumer_path, [])
-                        if class_results.get(f, {}).get("has_match")
-                    ]
-                    if matching_files:
-                        class_filtered.append(
-                            RawConsumerDict(
-                                consumer_path=consumer_path,
-                                consumer_name=consumer["consumer_name"],
-                                relevant_files=matching_files,
-                            )
+                    report_trigger_info = f"{class_containing_sproc} (via Sproc: {sproc_name})"
+                    if method_filter:
+                        report_trigger_info = (
+                            f"{class_containing_sproc}.{method_filter} (via Sproc: {sproc_name})"
                         )
 
-                # Method filter — same approach, on class-filtered files only
-                if method_filter and class_filtered:
-                    method_pattern = re.compile(rf"\.\s*{re.escape(method_filter)}\s*\(")
-                    method_stage_config = {
-                        "analysis_type": "method",
-                        "method_pattern": method_pattern,
-                        "method_name": method_filter,
-                        "use_ast": use_ast,
-                    }
-                    method_files = [f for c in class_filtered for f in c["relevant_files"]]
-                    method_results = analyze_cs_files_parallel(
-                        method_files,
-                        method_stage_config,
-                        max_workers=ctx.max_workers,
-                        cs_analysis_chunk_size=ctx.cs_analysis_chunk_size,
-                        disable_multiprocessing=ctx.disable_multiprocessing,
+                    class_filtered, _ = _filter_consumers_by_class(
+                        ctx, namespace_consumers, ns_pipeline, class_containing_sproc, method_filter
                     )
-                    method_filtered: List[RawConsumerDict] = []
-                    for consumer in class_filtered:
-                        mfiles = [
-                            f
-                            for f in consumer["relevant_files"]
-                            if method_results.get(f, {}).get("has_match")
-                        ]
-                        if mfiles:
-                            method_filtered.append(
-                                RawConsumerDict(
-                                    consumer_path=consumer["consumer_path"],
-                                    consumer_name=consumer["consumer_name"],
-                                    relevant_files=mfiles,
-                                )
-                            )
-                    class_filtered = method_filtered
-
-                logging.info(
-                    f"   Found {len(class_filtered)} consumer(s) for target "
-                    f"'{target_project_name}' triggered by '{report_trigger_info}'."
-                )
 
-                results_before = len(all_results)
-                _build_consumer_results(
-                    target_project_name=target_project_name,
-                    target_project_rel_path_str=target_project_rel_path_str,
-                    triggering_info=report_trigger_info,
-                    final_consumers_data=class_filtered,
-                    all_results_list=all_results,
-                    pipeline_map_dict=ctx.pipeline_map,
-                    solution_file_cache=ctx.solution_file_cache,
-                    batch_job_map=ctx.batch_job_map,
-                    search_scope_path_abs=ctx.search_scope,
-                    solution_index=ctx.solution_index,
-                    pipeline_resolver=resolver,
-                )
+                    logging.info(
+                        f"   Found {len(class_filtered)} consumer(s) for target "
+                        f"'{target_project_name}' triggered by '{report_trigger_info}'."
+                    )
 
-                if ctx.summarize_consumers and ctx.ai_provider:
-                    _summarize_consumer_files(
+                    _emit_consumer_results(
+                        ctx,
+                        resolver,
                         class_filtered,
                         all_results,
-                        ctx.ai_provider,
-                        ctx.search_scope,
-                        results_before,
+                        target_project_name,
+                        target_project_rel_path_str,
+                        report_trigger_info,
                         class_name=class_containing_sproc,
                         # See comment above — only apply method filter when
                         # user explicitly targeted this class via --class-name.
                         method_name=ctx.method_name
                         if ctx.class_name == class_containing_sproc
                         else None,
+                        summaries=summaries,
                     )
 
     _apply_graph_enrichment(all_results, ctx)
@@ -3,6 +3,7 @@
 import fnmatch
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
@@ -12,6 +13,7 @@ from scatter.core.models import (
     FilterStage,
     FilterPipeline,
     RawConsumerDict,
+    ReferenceIndex,
     STAGE_DISCOVERY,
     STAGE_PROJECT_REFERENCE,
     STAGE_TEST_EXCLUSION,
@@ -20,6 +22,8 @@ from scatter.core.models import (
     STAGE_METHOD,
 )
 from scatter.core.parallel import (
+    collect_project_references_parallel,
+    find_files_in_directories,
     find_files_with_pattern_parallel,
     parse_csproj_files_parallel,
     analyze_cs_files_parallel,
@@ -30,6 +34,33 @@ if TYPE_CHECKING:
     from scatter.core.graph import DependencyGraph
 
 
+@lru_cache(maxsize=256)
+def _consumer_patterns(
+    target_namespace: str, class_name: Optional[str], method_name: Optional[str]
+) -> Tuple["re.Pattern[bytes]", Optional["re.Pattern[bytes]"], Optional["re.Pattern[bytes]"]]:
+    """Compile (once per target) the bytes patterns used by the fused consumer scan.
+
+    Patterns are bytes so the scan matches raw file contents without decoding.
+    Sproc and git-mode runs call find_consumers once per type against the same
+    target namespace, so the using pattern in particular is shared across calls.
+    """
+    using_pattern = re.compile(
+        rb"(?:^|;|\{)\s*(?:global\s+)?using\s+"
+        + re.escape(target_namespace.encode())
+        + rb"(?:\.[A-Za-z0-9_.]+)?\s*;",
+        re.MULTILINE,
+    )
+    class_pattern = (
+        re.compile(rb"\b" + re.escape(class_name.encode()) + rb"\b") if class_name else None
+    )
+    method_pattern = (
+        re.compile(rb"\.\s*" + re.escape(method_name.encode()) + rb"\s*\(")
+        if class_name and method_name
+        else None
+    )
+    return using_pattern, class_pattern, method_pattern
+
+
 def is_test_project(project_name: str, patterns: List[str]) -> bool:
     """Check whether a project name matches any test-project pattern.
 
@@ -55,7 +86,7 @@ def _lookup_consumers_from_graph(
     # Target not in graph → caller should fall back to filesystem.
     # This handles stale cache, scope mismatch, or new projects.
     if graph.get_node(target_name) is None:
-        logging.debug(f"Target '{target_name}' not found in graph, falling back to filesystem.")
+        logging.debug("Target '%s' not found in graph, falling back to filesystem.", target_name)
         return None
 
     direct_consumers: Dict[Path, Dict[str, Union[str, List[Path]]]] = {}
@@ -70,6 +101,38 @@ def _lookup_consumers_from_graph(
     return direct_consumers
 
 
+def _use_reference_index(
+    search_scope_path: Path,
+    csproj_files: List[Path],
+    reference_index: ReferenceIndex,
+    max_workers: int,
+    csproj_analysis_chunk_size: int,
+    disable_multiprocessing: bool,
+) -> bool:
+    """Make sure ``reference_index`` covers a scope, if it is worth indexing.
+
+    Returns False for the first target seen in a scope, which keeps the
+    parallel per-target parse. The second target indexes every project in
+    the scope on the worker pool, like that parse would.
+    """
+    if search_scope_path not in reference_index.seen:
+        reference_index.seen.add(search_scope_path)
+        return False
+    if search_scope_path not in reference_index.built:
+        references = collect_project_references_parallel(
+            csproj_files,
+            max_workers=max_workers,
+            csproj_analysis_chunk_size=csproj_analysis_chunk_size,
+            disable_multiprocessing=disable_multiprocessing,
+        )
+        for consumer_csproj_abs in csproj_files:
+            for ref in dict.fromkeys(references.get(str(consumer_csproj_abs), [])):
+                reference_index.referenced_by.setdefault(Path(ref), []).append(consumer_csproj_abs)
+        reference_index.built.add(search_scope_path)
+        logging.debug("Indexed ProjectReferences of %d project(s) in scope.", len(csproj_files))
+    return True
+
+
 def _discover_consumers_from_filesystem(
     target_csproj_path: Path,
     search_scope_path: Path,
@@ -77,27 +140,56 @@ def _discover_consumers_from_filesystem(
     chunk_size: int,
     disable_multiprocessing: bool,
     csproj_analysis_chunk_size: int,
+    listing_cache: Optional[Dict[Tuple[Path, str], List[Path]]] = None,
+    reference_index: Optional[ReferenceIndex] = None,
 ) -> Tuple[Dict[Path, Dict[str, Union[str, List[Path]]]], int, List[Path]]:
     """Stages 1-2 via filesystem scan + XML parsing.
 
     Returns (direct_consumers, total_scanned, potential_consumers).
     Raises OSError if the search scope cannot be scanned.
     """
-    all_csproj_files = find_files_with_pattern_parallel(
+    listing_key = (search_scope_path, "*.csproj")
+    all_csproj_files = listing_cache.get(listing_key) if listing_cache is not None else None
+    if all_csproj_files is None:
+        all_csproj_files = [
+            p.resolve()
+            for p in find_files_with_pattern_parallel(
+                search_scope_path,
+                "*.csproj",
+                max_workers=max_workers,
+                chunk_size=chunk_size,
+                disable_multiprocessing=disable_multiprocessing,
+            )
+        ]
+        if listing_cache is not None:
+            listing_cache[listing_key] = all_csproj_files
+    logging.debug("Found %d total .csproj files in scope.", len(all_csproj_files))
+    potential_consumers = [p for p in all_csproj_files if p != target_csproj_path]
+    logging.debug("Found %d potential consumer project(s) to check.", len(potential_consumers))
+
+    # --- step 2: identify direct consumers ---
+    logging.debug("Checking for direct project references to target...")
+    direct_consumers: Dict[Path, Dict[str, Union[str, List[Path]]]]
+    if reference_index is not None and _use_reference_index(
         search_scope_path,
-        "*.csproj",
-        max_workers=max_workers,
-        chunk_size=chunk_size,
-        disable_multiprocessing=disable_multiprocessing,
-    )
-    logging.debug(f"Found {len(all_csproj_files)} total .csproj files in scope.")
-    potential_consumers = [
-        p.resolve() for p in all_csproj_files if p.resolve() != target_csproj_path
-    ]
-    logging.debug(f"Found {len(potential_consumers)} potential consumer project(s) to check.")
+        all_csproj_files,
+        reference_index,
+        max_workers,
+        csproj_analysis_chunk_size,
+        disable_multiprocessing,
+    ):
+        referencing = set(reference_index.referenced_by.get(target_csproj_path.resolve(), []))
+        direct_consumers = {
+            consumer_csproj_abs: {
+                "consumer_name": consumer_csproj_abs.stem,
+                "relevant_files": [],
+            }
+            for consumer_csproj_abs in potential_consumers
+            if consumer_csproj_abs in referencing
+        }
+        logging.debug("Found %d direct consumer(s) via ProjectReference.", len(direct_consumers))
+        return direct_consumers, len(all_csproj_files), potential_consumers
 
-    # --- step 2: identify direct consumers (parallel csproj parsing) ---
-    logging.debug("Checking for direct project references to target...")
     csproj_parse_results = parse_csproj_files_parallel(
         potential_consumers,
         target_csproj_path,
@@ -106,7 +198,7 @@ def _discover_consumers_from_filesystem(
         disable_multiprocessing=disable_multiprocessing,
     )
 
-    direct_consumers: Dict[Path, Dict[str, Union[str, List[Path]]]] = {}
+    direct_consumers = {}
     for consumer_csproj_abs in potential_consumers:
         result = csproj_parse_results.get(str(consumer_csproj_abs))
         if result and result["is_consumer"]:
@@ -115,7 +207,7 @@ def _discover_consumers_from_filesystem(
                 "relevant_files": [],
             }
 
-    logging.debug(f"Found {len(direct_consumers)} direct consumer(s) via ProjectReference.")
+    logging.debug("Found %d direct consumer(s) via ProjectReference.", len(direct_consumers))
     return direct_consumers, len(all_csproj_files), potential_consumers
 
 
@@ -132,6 +224,8 @@ def find_consumers(
     csproj_analysis_chunk_size: int = 25,
     graph: Optional["DependencyGraph"] = None,
     analysis_config: Optional["AnalysisConfig"] = None,
+    listing_cache: Optional[Dict[Tuple[Path, str], List[Path]]] = None,
+    reference_index: Optional[ReferenceIndex] = None,
 ) -> Tuple[List[RawConsumerDict], FilterPipeline]:
     """
     Finds consuming projects based on ProjectReference, namespace usage,
@@ -141,6 +235,12 @@ def find_consumers(
     O(1) graph reverse lookup instead of filesystem scanning. Stages 3-5
     (namespace, class, method) still run on the candidate set.
 
+    ``listing_cache`` maps ``(directory, glob pattern)`` to the files found
+    there. Callers analyzing several targets in one run pass the same dict so
+    the scope-wide .csproj walk and each consumer's .cs listing happen once.
+    They pass one ``reference_index`` the same way, so stage 2 for later
+    targets is a lookup instead of another parse of every project in scope.
+
     Returns a tuple of (consumer_results, filter_pipeline).
     """
     logging.info(
@@ -173,7 +273,8 @@ def find_consumers(
     namespace_consumers: Dict[Path, Dict[str, Union[str, List[Path]]]] = {}
     class_consumers: Dict[Path, Dict[str, Union[str, List[Path]]]] = {}
     method_consumers: Dict[Path, Dict[str, Union[str, List[Path]]]] = {}
-    cs_file_cache: Dict[Path, List[Path]] = {}
+    if listing_cache is None:
+        listing_cache = {}
 
     # --- stages 1-2: discover consumers via graph or filesystem ---
     used_graph = False
@@ -214,6 +315,8 @@ def find_consumers(
                     chunk_size,
                     disable_multiprocessing,
                     csproj_analysis_chunk_size,
+                    listing_cache,
+                    reference_index,
                 )
             )
             pipeline.total_projects_scanned = total_scanned
@@ -262,6 +365,10 @@ def find_consumers(
         return [], pipeline
 
     # --- step 3: filter consumers by namespace ---
+    # The namespace, class and method checks share a single read of each file:
+    # the fused scan records how far each file got, and stages 4-5 below
+    # derive their consumer sets from those per-file results.
+    scan_results: Dict[Path, Dict] = {}
     if not target_namespace or target_namespace.startswith("NAMESPACE_ERROR_"):
         logging.warning(
             f"Target namespace is unreliable or missing ('{target_namespace}'). Skipping namespace usage check. All direct consumers will be considered."
@@ -269,38 +376,35 @@ def find_consumers(
         namespace_consumers = direct_consumers
     else:
         logging.debug(
-            f"Checking {len(direct_consumers)} direct consumers for 'using {target_namespace};' statements..."
+            "Checking %d direct consumers for 'using %s;' statements...",
+            len(direct_consumers),
+            target_namespace,
         )
-        using_pattern = re.compile(
-            rf"(?:^|;|\{{)\s*(?:global\s+)?using\s+{re.escape(target_namespace)}(?:\.[A-Za-z0-9_.]+)?\s*;",
-            re.MULTILINE,
+        using_pattern, class_pattern, method_pattern = _consumer_patterns(
+            target_namespace, class_name, method_name
         )
 
         all_cs_files_for_analysis = []
         consumer_to_files_map = {}
 
+        # List every consumer directory not already listed earlier in this run
+        # up front, concurrently — the walks are independent and syscall-bound.
+        unlisted_dirs = [
+            p.parent for p in direct_consumers if (p.parent, "*.cs") not in listing_cache
+        ]
+        if unlisted_dirs:
+            for consumer_dir_abs, files in find_files_in_directories(
+                unlisted_dirs,
+                "*.cs",
+                max_workers=max_workers,
+                disable_multiprocessing=disable_multiprocessing,
+            ).items():
+                listing_cache[(consumer_dir_abs, "*.cs")] = files
+
         for consumer_path_abs, consumer_data in direct_consumers.items():
             consumer_dir_abs = consumer_path_abs.parent
-
-            if consumer_dir_abs not in cs_file_cache:
-                try:
-                    cs_file_cache[consumer_dir_abs] = find_files_with_pattern_parallel(
-                        consumer_dir_abs,
-                        "*.cs",
-                        max_workers=max_workers,
-                        chunk_size=chunk_size,
-                        disable_multiprocessing=disable_multiprocessing,
-                    )
-                    logging.debug(
-                        f"Found {len(cs_file_cache[consumer_dir_abs])} C# files in {consumer_dir_abs}"
-                    )
-                except OSError as e:
-                    logging.warning(
-                        f"Could not list .cs files in {consumer_dir_abs} for project {consumer_data['consumer_name']}: {e}"
-                    )
-                    cs_file_cache[consumer_dir_abs] = []
-
-            consumer_files = cs_file_cache[consumer_dir_abs]
+            consumer_files = listing_cache.get((consumer_dir_abs, "*.cs"), [])
+            logging.debug("Found %d C# files in %s", len(consumer_files), consumer_dir_abs)
             consumer_to_files_map[consumer_path_abs] = consumer_files
             all_cs_files_for_analysis.extend(consumer_files)
 
@@ -308,12 +412,22 @@ def find_consumers(
 
         if all_cs_files_for_analysis:
             stage_config = {
-                "analysis_type": "namespace",
+                "analysis_type": "consumer",
                 "target_namespace": target_namespace,
                 "using_pattern": using_pattern,
+                "class_name": class_name,
+                "class_pattern": class_pattern,
+                "method_name": method_name,
+                "method_pattern": method_pattern,
+                "literals": {
+                    "namespace": target_namespace.encode(),
+                    "class": class_name.encode() if class_name else b"",
+                    "method": method_name.encode() if method_name else b"",
+                },
+                "use_ast": use_ast,
             }
 
-            analysis_results = analyze_cs_files_parallel(
+            scan_results = analyze_cs_files_parallel(
                 all_cs_files_for_analysis,
                 stage_config,
                 max_workers=max_workers,
@@ -325,7 +439,7 @@ def find_consumers(
                 namespace_match_files: List[Path] = []
 
                 for cs_file_path in consumer_to_files_map.get(consumer_path_abs, []):
-                    file_result = analysis_results.get(cs_file_path)
+                    file_result = scan_results.get(cs_file_path)
                     if file_result:
                         if file_result.get("error"):
                             logging.warning(
@@ -337,12 +451,15 @@ def find_consumers(
                 if namespace_match_files:
                     consumer_data["relevant_files"] = namespace_match_files
                     namespace_consumers[consumer_path_abs] = consumer_data
-                    logging.debug(
-                        f"  Namespace used in {consumer_data['consumer_name']} (Files: {[f.name for f in namespace_match_files]})"
-                    )
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug(
+                            "  Namespace used in %s (Files: %s)",
+                            consumer_data["consumer_name"],
+                            [f.name for f in namespace_match_files],
+                        )
 
         logging.debug(
-            f"Found {len(namespace_consumers)} consumer(s) using namespace '{target_namespace}'."
+            "Found %d consumer(s) using namespace '%s'.", len(namespace_consumers), target_namespace
         )
 
     pipeline.stages.append(
@@ -378,65 +495,36 @@ def find_consumers(
     if not class_name:
         return format_results(namespace_consumers), pipeline
 
-    # --- step 4: filter by class/type usage ---
+    # --- step 4: filter by class/type usage (from the fused scan) ---
     logging.debug(
-        f"Checking {len(namespace_consumers)} namespace consumers for usage of type '{class_name}'..."
+        "Checking %d namespace consumers for usage of type '%s'...",
+        len(namespace_consumers),
+        class_name,
     )
 
-    class_pattern = re.compile(rf"\b{re.escape(class_name)}\b")
-
-    all_relevant_files: List[Path] = []
-    consumer_to_relevant_files_map: Dict[Path, List[Path]] = {}
-
     for consumer_path_abs, consumer_data in namespace_consumers.items():
         raw_files = consumer_data["relevant_files"]
         files_to_check: List[Path] = raw_files if isinstance(raw_files, list) else []
-        consumer_to_relevant_files_map[consumer_path_abs] = files_to_check
-        all_relevant_files.extend(files_to_check)
-        logging.debug(
-            f"  Checking type '{class_name}' in {len(files_to_check)} relevant files for {consumer_data['consumer_name']}..."
-        )
-
-    pipeline.total_files_scanned += len(all_relevant_files)
-
-    if all_relevant_files:
-        stage_config = {
-            "analysis_type": "class",
-            "class_name": class_name,
-            "class_pattern": class_pattern,
-            "use_ast": use_ast,
-        }
-
-        analysis_results = analyze_cs_files_parallel(
-            all_relevant_files,
-            stage_config,
-            max_workers=max_workers,
-            cs_analysis_chunk_size=cs_analysis_chunk_size,
-            disable_multiprocessing=disable_multiprocessing,
-        )
-
-        for consumer_path_abs, consumer_data in namespace_consumers.items():
-            class_match_files: List[Path] = []
-
-            for cs_file_path in consumer_to_relevant_files_map.get(consumer_path_abs, []):
-                file_result = analysis_results.get(cs_file_path)
-                if file_result:
-                    if file_result.get("error"):
-                        logging.warning(
-                            f"Could not read {cs_file_path.name} in {consumer_data['consumer_name']} for type check: {file_result['error']}"
-                        )
-                    elif file_result.get("has_match"):
-                        class_match_files.append(cs_file_path)
-
-            if class_match_files:
-                consumer_data["relevant_files"] = class_match_files
-                class_consumers[consumer_path_abs] = consumer_data
+        pipeline.total_files_scanned += len(files_to_check)
+
+        class_match_files = [
+            cs_file_path
+            for cs_file_path in files_to_check
+            if scan_results.get(cs_file_path, {}).get("class_match")
+        ]
+        if class_match_files:
+            consumer_data["relevant_files"] = class_match_files
+            class_consumers[consumer_path_abs] = consumer_data
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
                 logging.debug(
-                    f"    Type '{class_name}' used in {consumer_data['consumer_name']} (Files: {[f.name for f in class_match_files]})"
+                    "    Type '%s' used in %s (Files: %s)",
+                    class_name,
+                    consumer_data["consumer_name"],
+                    [f.name for f in class_match_files],
                 )
 
     logging.debug(
-        f"Found {len(class_consumers)} consumer(s) potentially using type '{class_name}'."
+        "Found %d consumer(s) potentially using type '%s'.", len(class_consumers), class_name
     )
 
     pipeline.stages.append(
@@ -453,72 +541,40 @@ def find_consumers(
     if not method_name:
         return format_results(class_consumers), pipeline
 
-    # --- step 5: filter by method (parallel) ---
+    # --- step 5: filter by method (from the fused scan) ---
     logging.debug(
-        f"Checking {len(class_consumers)} class consumers for potential usage of method '{method_name}'..."
+        "Checking %d class consumers for potential usage of method '%s'...",
+        len(class_consumers),
+        method_name,
     )
 
-    method_pattern = re.compile(rf"\.\s*{re.escape(method_name)}\s*\(")
-
-    all_method_files: List[Path] = []
-    file_to_consumer_map: Dict[Path, Path] = {}
     for consumer_path_abs, consumer_data in class_consumers.items():
         method_raw_files = consumer_data["relevant_files"]
-        if isinstance(method_raw_files, list):
-            for cs_file_abs in method_raw_files:
-                all_method_files.append(cs_file_abs)
-                file_to_consumer_map[cs_file_abs] = consumer_path_abs
-
-    logging.debug(
-        f"  Scanning {len(all_method_files)} files across {len(class_consumers)} consumers for method '{method_name}'..."
-    )
-
-    pipeline.total_files_scanned += len(all_method_files)
-
-    method_stage_config = {
-        "analysis_type": "method",
-        "method_pattern": method_pattern,
-        "method_name": method_name,
-        "use_ast": use_ast,
-    }
-
-    method_results = analyze_cs_files_parallel(
-        all_method_files,
-        method_stage_config,
-        max_workers=max_workers,
-        cs_analysis_chunk_size=cs_analysis_chunk_size,
-        disable_multiprocessing=disable_multiprocessing,
-    )
-
-    for cs_file_abs, result in method_results.items():
-        if result.get("error"):
-            consumer_path_abs = file_to_consumer_map[cs_file_abs]
-            consumer_name = class_consumers[consumer_path_abs]["consumer_name"]
-            logging.warning(
-                f"Could not read {cs_file_abs.name} in {consumer_name} for method check: {result['error']}"
-            )
-            continue
-        if result["has_match"]:
-            consumer_path_abs = file_to_consumer_map[cs_file_abs]
-            consumer_data = class_consumers[consumer_path_abs]
-            if consumer_path_abs not in method_consumers:
-                method_consumers[consumer_path_abs] = {
-                    "consumer_name": consumer_data["consumer_name"],
-                    "relevant_files": [],
-                }
-            files_list = method_consumers[consumer_path_abs]["relevant_files"]
-            assert isinstance(files_list, list)
-            files_list.append(cs_file_abs)
-
-    for consumer_path_abs, consumer_data in method_consumers.items():
-        rel_files = consumer_data["relevant_files"]
-        assert isinstance(rel_files, list)
-        logging.debug(
-            f"    Method '{method_name}' used in {consumer_data['consumer_name']} (Files: {[f.name for f in rel_files]})"
-        )
+        class_files: List[Path] = method_raw_files if isinstance(method_raw_files, list) else []
+        pipeline.total_files_scanned += len(class_files)
+
+        method_match_files = [
+            cs_file_abs
+            for cs_file_abs in class_files
+            if scan_results.get(cs_file_abs, {}).get("method_match")
+        ]
+        if method_match_files:
+            method_consumers[consumer_path_abs] = {
+                "consumer_name": consumer_data["consumer_name"],
+                "relevant_files": method_match_files,
+            }
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(
+                    "    Method '%s' used in %s (Files: %s)",
+                    method_name,
+                    consumer_data["consumer_name"],
+                    [f.name for f in method_match_files],
+                )
 
     logging.debug(
-        f"Found {len(method_consumers)} consumer(s) potentially calling method '{method_name}'."
+        "Found %d consumer(s) potentially calling method '%s'.",
+        len(method_consumers),
+        method_name,
     )
 
     pipeline.stages.append(
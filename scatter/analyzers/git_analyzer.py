@@ -5,7 +5,7 @@ import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, NamedTuple, Optional, Tuple, cast
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple, cast
 
 try:
     import git
@@ -17,6 +17,12 @@ from scatter.core.models import ChangeKind, ChangedType, TypeKind
 from scatter.scanners.type_scanner import extract_type_declarations_with_kind
 
 
+# Pathspecs limiting branch diffs to the file types we analyze. ":(icase)"
+# keeps the case-insensitive extension matching done on the Python side.
+_CS_DIFF_PATHSPECS = (":(icase)*.cs",)
+_BRANCH_DIFF_PATHSPECS = _CS_DIFF_PATHSPECS + (":(icase)*.props", ":(icase)*.targets")
+
+
 @dataclass
 class ConfigFileChange:
     """A .props/.targets file changed in a git diff."""
@@ -69,144 +75,107 @@ def resolve_branch_shas(repo_path: str, feature_branch: str, base_branch: str) -
     return BranchSHAs(head_sha=head_sha, base_sha=base_sha, repo_id=repo_id)
 
 
+class _CommitProjectIndex(NamedTuple):
+    """Per-commit lookup tables for find_project_file()."""
+
+    csproj_by_dir: Dict[str, str]  # lowercase directory -> first .csproj name in it
+    tree_dirs: FrozenSet[str]  # lowercase directories that are trees, "." for the root
+
+
+# Per-commit project index, built from a single `git ls-tree -r` call (one
+# subprocess, no per-tree object parsing in Python); every find_project_file
+# call against the same commit is then a walk up the query path with one dict
+# lookup per level.
+_csproj_index_cache: Dict[str, _CommitProjectIndex] = {}
+
+
+def _csproj_index(commit: git.Commit) -> _CommitProjectIndex:
+    """Return (building once per commit) the directory → .csproj name index."""
+    index = _csproj_index_cache.get(commit.hexsha)
+    if index is None:
+        csproj_by_dir: Dict[str, str] = {}
+        tree_dirs: Set[str] = {"."}
+        listing = commit.repo.git.ls_tree("-r", "--name-only", "-z", commit.hexsha)
+        for path in listing.split("\0"):
+            if not path:
+                continue
+            dir_path, _, name = path.rpartition("/")
+            dir_key = dir_path.lower() or "."
+            if name.lower().endswith(".csproj"):
+                # ls-tree lists entries in tree order, so the first .csproj wins
+                csproj_by_dir.setdefault(dir_key, name)
+            # -r lists blobs and submodule commits, never trees, so the trees
+            # are exactly the ancestors of listed entries.
+            while dir_key not in tree_dirs:
+                tree_dirs.add(dir_key)
+                dir_key = dir_key.rpartition("/")[0] or "."
+        index = _CommitProjectIndex(csproj_by_dir, frozenset(tree_dirs))
+        _csproj_index_cache[commit.hexsha] = index
+        logging.debug(
+            "Indexed %d .csproj director(ies) in commit %s",
+            len(csproj_by_dir),
+            commit.hexsha[:7],
+        )
+    return index
+
+
 def find_project_file(
     repo: git.Repo, commit: git.Commit, cs_file_relative_path_str: str
 ) -> Optional[str]:
-    cs_file_rel_path = Path(cs_file_relative_path_str)
-    current_path = cs_file_rel_path.parent
+    """Find the nearest .csproj at or above a repo-relative .cs path in ``commit``.
 
-    logging.debug(f"Attempting to find project for: {cs_file_relative_path_str}")
-    logging.debug(f"Starting search directory relative to repo root: {current_path.as_posix()}")
-    logging.debug(f"Using Git repository root: {repo.working_tree_dir}")
+    Directory names are matched case-insensitively. Returns the repo-relative
+    POSIX path of the project file, or None if no ancestor directory has one.
+    As with a tree walk, the search stops with None when the file's directory
+    is not a tree in ``commit``: missing, a file, or inside a submodule.
+    """
+    try:
+        index = _csproj_index(commit)
+    except (git.exc.GitCommandError, ValueError) as e:
+        logging.warning(f"Could not index project files in commit {commit.hexsha}: {e}")
+        return None
 
+    current_path = Path(cs_file_relative_path_str).parent
+    if current_path.as_posix().lower() not in index.tree_dirs:
+        logging.debug(
+            "Directory of '%s' is not a tree in commit %s. Stopping upward search.",
+            cs_file_relative_path_str,
+            commit.hexsha[:7],
+        )
+        return None
     while True:
-        try:
-            dir_path_for_tree = current_path.as_posix() if str(current_path) != "." else "."
-            logging.debug(f"Searching in directory (relative path): {dir_path_for_tree}")
-
-            current_tree = commit.tree
-            logging.debug(f"Commit Tree Root Path: {current_tree.path}")
-            try:
-                logging.debug(
-                    f"Root tree children: {[(item.name, item.type) for item in current_tree]}"
-                )
-            except Exception as log_e:
-                logging.warning(f"Could not log root tree children: {log_e}")
-
-            # walk the tree
-            if dir_path_for_tree != ".":
-                logging.debug(f"Navigating tree for path parts: {current_path.parts}")
-                try:
-                    temp_tree = commit.tree
-                    for i, part in enumerate(current_path.parts):
-                        logging.debug(
-                            f"   Navigating part {i + 1}/{len(current_path.parts)}: '{part}'"
-                        )
-                        try:
-                            current_children = [(item.name, item.type) for item in temp_tree]
-                            logging.debug(
-                                f"       Children of '{temp_tree.path}' ({len(current_children)} items): {current_children}"
-                            )
-                        except Exception as log_e:
-                            logging.warning(
-                                f"       Could not log children of '{temp_tree.path}': {log_e}"
-                            )
-
-                        found_item = None
-                        for item in temp_tree:
-                            if item.name.lower() == part.lower():
-                                found_item = item
-                                logging.debug(
-                                    f"        Found matching item via case-insensitive search: '{item.name}', type is '{item.type}'"
-                                )
-                                break
-
-                        if found_item:
-                            if found_item.type == "tree":
-                                temp_tree = found_item
-                            elif found_item.type == "blob":
-                                logging.error(
-                                    f"       Path part '{part}' (matched as '{found_item.name}') is a blob (file), not a tree. Cannot descend."
-                                )
-                                raise KeyError(f"Path component {part} is not a tree")
-                            elif found_item.type == "commit":
-                                logging.warning(
-                                    f"       Path part '{part}' (matched as '{found_item.name}') is a commit object, likely a SUBMODULE. Standard tree traversal will stop here."
-                                )
-                                raise KeyError(f"Path component {part} is a submodule commit")
-                            else:
-                                logging.error(
-                                    f"       Found '{part}' (matched as '{found_item.name}'), but has unexpected type '{found_item.type}'. Stopping."
-                                )
-                                raise KeyError(
-                                    f"Path component {part} has unknown type {found_item.type}"
-                                )
-                        else:
-                            logging.error(
-                                f"       Path part '{part}' NOT FOUND (case-insensitive) in '{temp_tree.path}'."
-                            )
-                            current_children_final = [(item.name, item.type) for item in temp_tree]
-                            logging.debug(
-                                f"       Children of '{temp_tree.path}' before failing: {current_children_final}"
-                            )
-                            raise KeyError(f"Path component {part} not found")
-
-                    current_tree = temp_tree
-                    logging.debug(f"   Successfully navigated to tree: {current_tree.path}")
-
-                except KeyError as ke:
-                    logging.debug(
-                        f"Path '{dir_path_for_tree}' traversal failed in commit {commit.hexsha}: {ke}. Stopping upward search."
-                    )
-                    break  # stop searching upwards
-
-            logging.debug(f"Checking blobs in final directory tree: {current_tree.path}")
-            try:
-                dir_blobs = [(item.name, item.path) for item in current_tree.blobs]
-                logging.debug(f"   Blobs found: {dir_blobs}")
-                for item in current_tree.blobs:
-                    if item.name.lower().endswith(".csproj"):
-                        project_file_path = current_path / item.name
-                        project_file_rel_path_str = project_file_path.as_posix()
-                        logging.info(
-                            f"Found .csproj '{project_file_rel_path_str}' for '{cs_file_relative_path_str}'"
-                        )
-                        return project_file_rel_path_str
-            except Exception as blob_e:
-                logging.warning(f"Could not list blobs in '{current_tree.path}': {blob_e}")
-
-            logging.debug(f"No .csproj file found in directory: {current_path.as_posix()}")
-
-            if current_path == Path("."):
-                logging.debug("Reached repo root directory representation. Stopping upward search.")
-                break
-            parent_path = current_path.parent
-            logging.debug(f"Moving up search to parent directory: {parent_path.as_posix()}")
-            if parent_path == current_path:
-                logging.debug(
-                    "Parent path is same as current path (at root). Stopping upward search."
-                )
-                break
-            current_path = parent_path
-
-        except git.exc.GitCommandError as e:
-            logging.warning(
-                f"Git command error accessing tree for '{dir_path_for_tree}' in {commit.hexsha}: {e}. Stopping upward search."
-            )
-            break
-        except KeyError:
-            break
-        except Exception as e:
-            logging.error(
-                f"Unexpected error accessing tree for '{dir_path_for_tree}' in {commit.hexsha}: {e}. Stopping upward search.",
-                exc_info=True,
+        csproj_name = index.csproj_by_dir.get(current_path.as_posix().lower())
+        if csproj_name is not None:
+            project_file_rel_path_str = (current_path / csproj_name).as_posix()
+            logging.debug(
+                "Found .csproj '%s' for '%s'", project_file_rel_path_str, cs_file_relative_path_str
             )
+            return project_file_rel_path_str
+        if current_path == Path("."):
             break
+        current_path = current_path.parent
 
-    logging.debug(f"Finished search. No .csproj found upwards from '{cs_file_relative_path_str}'")
+    logging.debug("No .csproj found upwards from '%s'", cs_file_relative_path_str)
     return None
 
 
+def _resolve_projects_by_dir(
+    repo: git.Repo, commit: git.Commit, cs_file_paths: List[str]
+) -> Dict[str, Optional[str]]:
+    """Map each distinct parent directory of ``cs_file_paths`` to its .csproj.
+
+    Files in the same directory share a project, so each directory is resolved
+    once with the first file seen in it. Keys are the POSIX directory part
+    (``rpartition("/")[0]``) of the given paths.
+    """
+    project_by_dir: Dict[str, Optional[str]] = {}
+    for cs_file_rel_path_str in cs_file_paths:
+        dir_key = cs_file_rel_path_str.rpartition("/")[0]
+        if dir_key not in project_by_dir:
+            project_by_dir[dir_key] = find_project_file(repo, commit, cs_file_rel_path_str)
+    return project_by_dir
+
+
 def analyze_branch_changes(
     repo_path: str, feature_branch_name: str, base_branch_name: str = "main"
 ) -> BranchChanges:
@@ -258,17 +227,16 @@ def analyze_branch_changes(
 
         logging.info(f"Using commit '{merge_base_commit.hexsha[:7]}' as comparison base.")
 
-        diff_index = merge_base_commit.diff(feature_commit)
+        # Let git drop irrelevant paths before GitPython builds Diff objects
+        diff_index = merge_base_commit.diff(feature_commit, paths=list(_BRANCH_DIFF_PATHSPECS))
         logging.info(f"Found {len(diff_index)} changes between base and {feature_branch_name}.")
 
-        changed_cs_files_count = 0
-        project_not_found_count = 0
+        # Pass 1: classify diff entries without touching the project index
+        changed_cs_files: List[str] = []
         logging.info("Analyzing changed files to identify projects...")
         for diff_item in diff_index:
-            logging.debug(f"diff_item: {diff_item} - {diff_item.change_type}")
+            logging.debug("diff_item: %s - %s", diff_item, diff_item.change_type)
 
-            # Collect .props/.targets before .cs so a find_project_file
-            # failure on a later .cs item doesn't skip config files
             relevant_path = diff_item.a_path if diff_item.change_type == "D" else diff_item.b_path
             if relevant_path and (
                 relevant_path.lower().endswith(".props")
@@ -285,20 +253,21 @@ def analyze_branch_changes(
                 and diff_item.b_path
                 and diff_item.b_path.lower().endswith(".cs")
             ):
-                changed_cs_files_count += 1
-                cs_file_rel_path_str = Path(diff_item.b_path).as_posix()
-                logging.debug("Searching for project file...")
-                project_file_rel_path_str = find_project_file(
-                    repo, feature_commit, cs_file_rel_path_str
-                )
-                logging.debug(f"Found project: {project_file_rel_path_str}")
-                if project_file_rel_path_str:
-                    project_changes[project_file_rel_path_str].append(cs_file_rel_path_str)
-                else:
-                    project_not_found_count += 1
-                    logging.debug(
-                        f"Could not find .csproj for changed file: {cs_file_rel_path_str}"
-                    )
+                changed_cs_files.append(Path(diff_item.b_path).as_posix())
+
+        # Pass 2: resolve each distinct directory's project once
+        project_by_dir = _resolve_projects_by_dir(repo, feature_commit, changed_cs_files)
+
+        # Pass 3: group files under their project
+        changed_cs_files_count = len(changed_cs_files)
+        project_not_found_count = 0
+        for cs_file_rel_path_str in changed_cs_files:
+            project_file_rel_path_str = project_by_dir[cs_file_rel_path_str.rpartition("/")[0]]
+            if project_file_rel_path_str:
+                project_changes[project_file_rel_path_str].append(cs_file_rel_path_str)
+            else:
+                project_not_found_count += 1
+                logging.debug("Could not find .csproj for changed file: %s", cs_file_rel_path_str)
 
         if changed_cs_files_count == 0:
             logging.info("No changed C# (.cs) files found in the diff.")
@@ -352,14 +321,61 @@ def get_diff_for_file(
         return None
 
 
-def _read_blob_content(commit: git.Commit, path: str) -> Optional[str]:
-    """Read file content from a git tree object (not disk). Returns None if not found."""
+# Tree SHA → {child name → child object}, built per analysis call so the
+# objects (and the Repo they are bound to) do not outlive it.
+_TreeChildren = Dict[str, Dict[str, git.objects.base.IndexObject]]
+
+
+def _read_blob_content(
+    commit: git.Commit, path: str, tree_children: Optional[_TreeChildren] = None
+) -> Optional[str]:
+    """Read file content from a git tree object (not disk). Returns None if not found.
+
+    ``tree_children`` caches each tree's name → child map by SHA, so
+    directories shared by several paths or commits of one repository are
+    indexed once; omit it to resolve this path alone.
+    """
+    # GitPython's ``tree / path`` scans each tree's entries linearly per path
+    # component; resolve components through per-tree child maps instead.
+    if tree_children is None:
+        tree_children = {}
+    node = commit.tree
+    for part in path.split("/"):
+        if not isinstance(node, git.Tree):
+            return None
+        children = tree_children.get(node.hexsha)
+        if children is None:
+            children = {item.name: item for item in node}
+            tree_children[node.hexsha] = children
+        child = children.get(part)
+        if child is None:
+            return None
+        node = child
+    if not isinstance(node, git.Blob):
+        return None
+    raw: bytes = node.data_stream.read()
+    return raw.decode("utf-8", errors="ignore")
+
+
+def _read_diff_side(
+    blob: Optional[git.Blob],
+    commit: git.Commit,
+    path: str,
+    tree_children: Optional[_TreeChildren] = None,
+) -> Optional[str]:
+    """Read one side of a diff item, by blob SHA when the diff carries it.
+
+    Tree-to-tree diffs record the blob on each side, so the object can be read
+    directly from the object database without resolving ``path`` through the
+    commit's trees; fall back to the tree lookup when it is absent.
+    """
+    if blob is None:
+        return _read_blob_content(commit, path, tree_children)
     try:
-        blob = commit.tree / path
         raw: bytes = blob.data_stream.read()
-        return raw.decode("utf-8", errors="ignore")
-    except (KeyError, TypeError):
-        return None
+    except (ValueError, git.exc.GitCommandError):
+        return _read_blob_content(commit, path, tree_children)
+    return raw.decode("utf-8", errors="ignore")
 
 
 def _diff_type_sets(
@@ -445,8 +461,9 @@ def extract_pr_changed_types(
         )
     merge_base_commit = merge_bases[0]
 
-    diff_index = merge_base_commit.diff(feature_commit)
+    diff_index = merge_base_commit.diff(feature_commit, paths=list(_CS_DIFF_PATHSPECS))
     changed_types: List[ChangedType] = []
+    tree_children: _TreeChildren = {}
 
     for diff_item in diff_index:
         # Determine which paths to work with
@@ -471,14 +488,14 @@ def extract_pr_changed_types(
         # Find owning project
         owning_project_path = find_project_file(repo, project_lookup_commit, project_lookup_path)
         if not owning_project_path:
-            logging.debug(f"No .csproj found for {relevant_path}, skipping")
+            logging.debug("No .csproj found for %s, skipping", relevant_path)
             continue
 
         owning_project = Path(owning_project_path).stem
 
         if change_type == "D" and a_path:
             # Deleted file — all types are deleted
-            content = _read_blob_content(merge_base_commit, a_path)
+            content = _read_diff_side(diff_item.a_blob, merge_base_commit, a_path, tree_children)
             if content:
                 for name, kind in extract_type_declarations_with_kind(content):
                     changed_types.append(
@@ -494,7 +511,7 @@ def extract_pr_changed_types(
 
         elif change_type == "A" and b_path:
             # Added file — all types are added
-            content = _read_blob_content(feature_commit, b_path)
+            content = _read_diff_side(diff_item.b_blob, feature_commit, b_path, tree_children)
             if content:
                 for name, kind in extract_type_declarations_with_kind(content):
                     changed_types.append(
@@ -510,8 +527,10 @@ def extract_pr_changed_types(
 
         elif change_type in ("M", "R") and a_path and b_path:
             # Modified or renamed — diff type sets
-            base_content = _read_blob_content(merge_base_commit, a_path)
-            feat_content = _read_blob_content(feature_commit, b_path)
+            base_content = _read_diff_side(
+                diff_item.a_blob, merge_base_commit, a_path, tree_children
+            )
+            feat_content = _read_diff_side(diff_item.b_blob, feature_commit, b_path, tree_children)
 
             base_types = extract_type_declarations_with_kind(base_content) if base_content else []
             feat_types = extract_type_declarations_with_kind(feat_content) if feat_content else []
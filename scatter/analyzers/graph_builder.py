@@ -56,7 +56,7 @@ def _extract_file_data(cs_path: Path) -> Optional[_FileExtraction]:
     except OSError:
         return None
 
-    identifiers = {m.group() for m in _IDENT_PATTERN.finditer(content)} - _CSHARP_KEYWORDS
+    identifiers = set(_IDENT_PATTERN.findall(content)) - _CSHARP_KEYWORDS
     types = extract_type_names_from_content(content)
 
     return _FileExtraction(
@@ -319,10 +319,12 @@ def build_dependency_graph(
                 content_hash=ext.content_hash,
             )
 
-    logging.debug(
-        f"Identifier cache: {len(file_identifier_cache)} files, "
-        f"{sum(len(v) for v in file_identifier_cache.values())} total identifiers"
-    )
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(
+            "Identifier cache: %d files, %d total identifiers",
+            len(file_identifier_cache),
+            sum(len(v) for v in file_identifier_cache.values()),
+        )
 
     t2 = time.monotonic()
     logging.info(f"Graph build step 4 (file extraction): {t2 - t1:.1f}s")
@@ -4,7 +4,7 @@ import logging
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from scatter.config import AnalysisConfig
@@ -14,6 +14,7 @@ from scatter.core.models import (
     AnalysisTarget,
     EnrichedConsumer,
     RawConsumerDict,
+    ReferenceIndex,
     TargetImpact,
     ImpactReport,
     DEFAULT_MAX_DEPTH,
@@ -213,6 +214,10 @@ def run_impact_analysis(
 
     # Consumer cache — shared across targets to avoid rescanning the same csproj
     consumer_cache: Dict[Path, tuple] = {}
+    # File listings and the reverse ProjectReference index reused by every
+    # find_consumers call in this run
+    listing_cache: Dict[Tuple[Path, str], List[Path]] = {}
+    reference_index = ReferenceIndex()
 
     # Step 2: For each target, find consumers and trace transitively.
     # Root targets get full depth; affected targets get depth 0 (direct consumers only).
@@ -238,6 +243,8 @@ def run_impact_analysis(
             analysis_config=analysis_config,
             pipeline_resolver=resolver,
             consumer_cache=consumer_cache,
+            listing_cache=listing_cache,
+            reference_index=reference_index,
         )
         report.targets.append(target_impact)
 
@@ -529,6 +536,8 @@ def _analyze_single_target(
     analysis_config: Optional["AnalysisConfig"] = None,
     pipeline_resolver: Optional[PipelineResolver] = None,
     consumer_cache: Optional[Dict[Path, tuple]] = None,
+    listing_cache: Optional[Dict[Tuple[Path, str], List[Path]]] = None,
+    reference_index: Optional[ReferenceIndex] = None,
 ) -> TargetImpact:
     """Analyze a single target: find direct consumers, trace transitively."""
     impact = TargetImpact(target=target)
@@ -583,6 +592,8 @@ def _analyze_single_target(
                 csproj_analysis_chunk_size=csproj_analysis_chunk_size,
                 graph=graph,
                 analysis_config=analysis_config,
+                listing_cache=listing_cache,
+                reference_index=reference_index,
             )
             if can_cache and consumer_cache is not None:
                 consumer_cache[cache_key] = (direct_consumers_data, _pipeline)
@@ -619,6 +630,8 @@ def _analyze_single_target(
         analysis_config=analysis_config,
         pipeline_resolver=pipeline_resolver,
         consumer_cache=consumer_cache,
+        listing_cache=listing_cache,
+        reference_index=reference_index,
     )
 
     impact.consumers = all_consumers
@@ -645,6 +658,8 @@ def trace_transitive_impact(
     analysis_config: Optional["AnalysisConfig"] = None,
     pipeline_resolver: Optional[PipelineResolver] = None,
     consumer_cache: Optional[Dict[Path, tuple]] = None,
+    listing_cache: Optional[Dict[Tuple[Path, str], List[Path]]] = None,
+    reference_index: Optional[ReferenceIndex] = None,
 ) -> List[EnrichedConsumer]:
     """BFS transitive tracing with confidence decay and cycle detection.
 
@@ -725,31 +740,38 @@ def trace_transitive_impact(
                         )
                         for node in transitive_nodes
                     ]
+                elif consumer_cache is not None and consumer_path in consumer_cache:
+                    # Reuse a project-level scan from earlier in the run. Root
+                    # targets are cached with the namespace they were scanned
+                    # with: target.namespace (possibly AI-supplied) or the
+                    # NAMESPACE_ERROR_ fallback, not necessarily this path's
+                    # derived one. A hit also applies where derive_namespace()
+                    # returns None and no transitive scan would run.
+                    transitive_data, _t_pipeline = consumer_cache[consumer_path]
                 elif consumer_path.is_file():
                     ns = derive_namespace(consumer_path)
                     if ns:
-                        if consumer_cache is not None and consumer_path in consumer_cache:
-                            transitive_data, _t_pipeline = consumer_cache[consumer_path]
-                        else:
-                            transitive_data, _t_pipeline = find_consumers(
-                                target_csproj_path=consumer_path,
-                                search_scope_path=search_scope,
-                                target_namespace=ns,
-                                class_name=None,
-                                method_name=None,
-                                max_workers=max_workers,
-                                chunk_size=chunk_size,
-                                disable_multiprocessing=disable_multiprocessing,
-                                cs_analysis_chunk_size=cs_analysis_chunk_size,
-                                csproj_analysis_chunk_size=csproj_analysis_chunk_size,
-                                graph=graph,
-                                analysis_config=analysis_config,
+                        transitive_data, _t_pipeline = find_consumers(
+                            target_csproj_path=consumer_path,
+                            search_scope_path=search_scope,
+                            target_namespace=ns,
+                            class_name=None,
+                            method_name=None,
+                            max_workers=max_workers,
+                            chunk_size=chunk_size,
+                            disable_multiprocessing=disable_multiprocessing,
+                            cs_analysis_chunk_size=cs_analysis_chunk_size,
+                            csproj_analysis_chunk_size=csproj_analysis_chunk_size,
+                            graph=graph,
+                            analysis_config=analysis_config,
+                            listing_cache=listing_cache,
+                            reference_index=reference_index,
+                        )
+                        if consumer_cache is not None:
+                            consumer_cache[consumer_path] = (
+                                transitive_data,
+                                _t_pipeline,
                             )
-                            if consumer_cache is not None:
-                                consumer_cache[consumer_path] = (
-                                    transitive_data,
-                                    _t_pipeline,
-                                )
                 for td in transitive_data:
                     td_path = td["consumer_path"]
                     if td_path not in visited and td_path not in parent_map:
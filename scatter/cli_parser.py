@@ -3,12 +3,28 @@
 import argparse
 from typing import Any, Dict
 
-from scatter.core.models import DEFAULT_MAX_WORKERS, DEFAULT_CHUNK_SIZE
+from scatter.core.models import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_SUMMARIZE_BYTES,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_SUMMARY_WORKERS,
+)
 
 
 _REDACTED_CLI_KEYS = frozenset({"google_api_key", "wex_api_key"})
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts and sizes that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
 def _build_cli_overrides(args) -> Dict[str, Any]:
     """Extract CLI args that override config values.
 
@@ -252,6 +268,26 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enable summarization of relevant C# files in consuming projects using the configured AI provider.",
     )
+    ai_group.add_argument(
+        "--summarize-workers",
+        type=_positive_int,
+        default=DEFAULT_SUMMARY_WORKERS,
+        help=f"Maximum concurrent AI calls for consumer file summarization and hybrid git symbol extraction (default: {DEFAULT_SUMMARY_WORKERS}).",
+    )
+    ai_group.add_argument(
+        "--max-summarize-bytes",
+        type=_positive_int,
+        default=DEFAULT_MAX_SUMMARIZE_BYTES,
+        help="Skip summarizing consumer files larger than this many bytes "
+        f"(default: {DEFAULT_MAX_SUMMARIZE_BYTES}). Generated files such as "
+        "*.Designer.cs and *.g.cs are always skipped.",
+    )
+    ai_group.add_argument(
+        "--no-summary-cache",
+        action="store_true",
+        help="Ignore and do not update the on-disk cache of consumer file summaries "
+        "({search-scope}/.scatter/summary_cache.json).",
+    )
     ai_group.add_argument(
         "--ai-summary",
         action="store_true",
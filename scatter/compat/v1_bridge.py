@@ -1,7 +1,6 @@
 """V1 compatibility helpers — pipeline mapping, solution lookup, result processing."""
 
 import logging
-from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -25,7 +24,7 @@ def find_solutions_for_project(
         stem = csproj_path.stem
         matches = solution_index.get(stem, [])
         if matches:
-            logging.debug(f"  -> Found {len(matches)} solution(s) for '{stem}' via index")
+            logging.debug("  -> Found %d solution(s) for '%s' via index", len(matches), stem)
         return [si.path for si in matches]
 
     # Legacy path: substring text search
@@ -44,7 +43,7 @@ def find_solutions_for_project(
         try:
             content = sln_path.read_text(encoding="utf-8", errors="ignore")
             if project_filename in content:
-                logging.debug(f"  -> Found reference in: {sln_path.name}")
+                logging.debug("  -> Found reference in: %s", sln_path.name)
                 found_in_solutions.append(sln_path)
         except OSError as e:
             logging.warning(f"Could not read solution file {sln_path.name}: {e}")
@@ -108,8 +107,9 @@ def _build_consumer_results(
     pipeline_resolver: Optional[PipelineResolver] = None,
 ) -> None:
     """
-    Helper to process summaries for consumer files and append to the main results list.
-    Generates a row for EACH unique pipeline found for a consumer.
+    Helper to build consumer result rows and append them to the main results list.
+    Generates a row for EACH unique pipeline found for a consumer. File summaries
+    are attached afterwards, only when summarization is enabled.
     """
     if not final_consumers_data:
         logging.info(
@@ -120,8 +120,11 @@ def _build_consumer_results(
     logging.info(
         f"   Found {len(final_consumers_data)} consumer(s) for target '{target_project_name}' triggered by '{triggering_info}'."
     )
-    summaries_for_this_target: Dict[str, Dict[str, str]] = defaultdict(dict)
+    # Build the resolver's lookup indexes once, not once per consumer
+    resolver = pipeline_resolver or PipelineResolver(pipeline_map_dict)
 
+    # Rows for this target are collected locally and added with one extend()
+    new_results: List[ConsumerResult] = []
     for consumer_info in final_consumers_data:
         consumer_abs_path = consumer_info["consumer_path"]
         consumer_name_stem = consumer_info["consumer_name"]
@@ -135,12 +138,12 @@ def _build_consumer_results(
         )
         solutions_for_consumer_names = [p.name for p in solutions_for_consumer_paths]
         logging.debug(
-            f"   Found {len(solutions_for_consumer_names)} solutions for consumer '{consumer_name_stem}': {solutions_for_consumer_names}"
+            "   Found %d solutions for consumer '%s': %s",
+            len(solutions_for_consumer_names),
+            consumer_name_stem,
+            solutions_for_consumer_names,
         )
 
-        consumer_summaries_dict = summaries_for_this_target.get(consumer_rel_path_str, {})
-
-        resolver = pipeline_resolver or PipelineResolver(pipeline_map_dict)
         solution_stems = [Path(sn).stem for sn in solutions_for_consumer_names]
         probes = solution_stems + [consumer_name_stem]
         match = resolver.resolve(*probes)
@@ -155,7 +158,9 @@ def _build_consumer_results(
                 )
             else:
                 logging.debug(
-                    f"   Found mapping: '{match.matched_key}' -> Pipeline '{match.pipeline_name}'"
+                    "   Found mapping: '%s' -> Pipeline '%s'",
+                    match.matched_key,
+                    match.pipeline_name,
                 )
 
         if found_pipelines:
@@ -168,7 +173,7 @@ def _build_consumer_results(
                     else:
                         batch_job_verification = "Unverified"
 
-                all_results_list.append(
+                new_results.append(
                     ConsumerResult(
                         target_project_name=target_project_name,
                         target_project_path=target_project_rel_path_str,
@@ -178,7 +183,6 @@ def _build_consumer_results(
                         consuming_solutions=solutions_for_consumer_names,
                         pipeline_name=pipeline_name,
                         batch_job_verification=batch_job_verification,
-                        consumer_file_summaries=consumer_summaries_dict,
                     )
                 )
         else:
@@ -189,9 +193,10 @@ def _build_consumer_results(
                 )
             else:
                 logging.debug(
-                    f"   No pipeline mapping found for consumer '{consumer_name_stem}' via its solutions."
+                    "   No pipeline mapping found for consumer '%s' via its solutions.",
+                    consumer_name_stem,
                 )
-            all_results_list.append(
+            new_results.append(
                 ConsumerResult(
                     target_project_name=target_project_name,
                     target_project_path=target_project_rel_path_str,
@@ -199,6 +204,7 @@ def _build_consumer_results(
                     consumer_project_name=consumer_name_stem,
                     consumer_project_path=consumer_rel_path_str,
                     consuming_solutions=solutions_for_consumer_names,
-                    consumer_file_summaries=consumer_summaries_dict,
                 )
             )
+
+    all_results_list.extend(new_results)
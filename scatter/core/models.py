@@ -6,7 +6,7 @@ import re
 import multiprocessing
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, TypedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Set, TypedDict
 
 if TYPE_CHECKING:
     from scatter.core.risk_models import AggregateRisk, RiskProfile
@@ -16,6 +16,14 @@ DEFAULT_MAX_WORKERS = min(32, (multiprocessing.cpu_count() or 1) + 4)
 DEFAULT_CHUNK_SIZE = 75
 MULTIPROCESSING_ENABLED = True
 
+# AI summarization calls are network-bound; the GIL is released while waiting.
+DEFAULT_SUMMARY_WORKERS = 8
+
+# Files above this size are not sent for summarization (only a prefix would be
+# used anyway), nor are designer/source-generator output files.
+DEFAULT_MAX_SUMMARIZE_BYTES = 200_000
+GENERATED_CS_SUFFIXES = (".designer.cs", ".g.cs", ".g.i.cs")
+
 # --- regex for type extraction ---
 TYPE_DECLARATION_PATTERN = re.compile(
     r"^\s*(?:public|internal|private|protected)?\s*"  # Optional access modifier
@@ -64,12 +72,13 @@ class RawConsumerDict(TypedDict):
 # --- Consumer result data model ---
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsumerResult:
     """A consuming relationship between a target project and a consumer project.
 
     Constructed by v1_bridge._build_consumer_results().
     Graph enrichment fields are set by graph_enrichment.enrich_legacy_results().
+    Slotted because large scopes hold one instance per consuming relationship.
     """
 
     target_project_name: str
@@ -268,6 +277,21 @@ class FilterPipeline:
         }.get(stage_name)
 
 
+@dataclass
+class ReferenceIndex:
+    """Per-run reverse ProjectReference index shared by find_consumers() calls.
+
+    The first target analyzed in a scope keeps the parallel per-target parse,
+    which is cheaper for a single target. When a second target reuses the
+    scope, every project in it is indexed once, and stage 2 becomes a lookup.
+    """
+
+    seen: Set[Path] = field(default_factory=set)  # scopes a target has been analyzed in
+    built: Set[Path] = field(default_factory=set)  # scopes whose projects are indexed
+    # resolved referenced .csproj -> the .csproj files referencing it
+    referenced_by: Dict[Path, List[Path]] = field(default_factory=dict)
+
+
 # --- PR Risk data models ---
 
 
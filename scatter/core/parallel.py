@@ -1,13 +1,23 @@
 """Multiprocessing infrastructure for Scatter — workers and orchestrators."""
 
+import atexit
+import fnmatch
 import logging
 import os
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Any, List, Optional, Set, Tuple, Dict
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import AbstractSet, Any, Callable, Iterator, List, Optional, Set, Tuple, Dict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
 
 from scatter.core.models import DEFAULT_MAX_WORKERS, DEFAULT_CHUNK_SIZE, MULTIPROCESSING_ENABLED
+from scatter.scanners._helpers import nearest_project_file, read_bytes_cached
 
 
 # --- multiprocessing utilities ---
@@ -16,14 +26,91 @@ def chunk_list(items: List, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[List]:
     return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
 
 
-def find_files_with_pattern_chunk(args: Tuple[Path, str, List[Path]]) -> List[Path]:
-    """Worker function to find files matching a pattern in a list of directories."""
-    base_path, pattern, dirs_chunk = args
+def _scandir_walk(
+    root: str,
+    pattern: str,
+    exclude_dirs: AbstractSet[str] = frozenset(),
+    onerror: Optional[Callable[[OSError], None]] = None,
+) -> Iterator[str]:
+    """Yield paths under ``root`` whose file name matches ``pattern``.
+
+    os.scandir-based replacement for ``Path.rglob``: DirEntry caches the file
+    type from the directory listing, so no per-entry stat and no intermediate
+    Path objects are needed. Directories are visited in the same pre-order as
+    rglob, symlinked directories are not followed, and unreadable directories
+    are skipped — silently, unless ``onerror`` is given, which is then called
+    with the OSError as in os.walk. Subdirectories named in ``exclude_dirs``
+    are never entered.
+    """
+    # "*.ext" is by far the common case — plain endswith avoids fnmatch per entry
+    suffix = (
+        pattern[1:]
+        if pattern.startswith("*") and not any(c in pattern[1:] for c in "*?[")
+        else None
+    )
+    # Like fnmatch and rglob, fold case where the platform does (Windows)
+    fold_case = os.path.normcase("A") != "A"
+    if suffix is not None and fold_case:
+        suffix = os.path.normcase(suffix)
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in exclude_dirs:
+                                subdirs.append(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                    name = entry.name
+                    if suffix is not None:
+                        if (os.path.normcase(name) if fold_case else name).endswith(suffix):
+                            yield entry.path
+                    elif fnmatch.fnmatch(name, pattern):
+                        yield entry.path
+        except OSError as e:
+            if onerror is not None:
+                onerror(e)
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def _scandir_dirs(root: str, exclude_dirs: AbstractSet[str] = frozenset()) -> Iterator[str]:
+    """Yield every directory below ``root`` (excluding root) without following symlinks."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                subdirs = [
+                    e.path
+                    for e in it
+                    if e.is_dir(follow_symlinks=False) and e.name not in exclude_dirs
+                ]
+        except OSError:
+            continue
+        yield from subdirs
+        stack.extend(reversed(subdirs))
+
+
+def find_files_with_pattern_chunk(args: Tuple) -> List[Path]:
+    """Worker function to find files matching a pattern in a list of directories.
+
+    ``args`` is ``(base_path, pattern, dirs_chunk)``, optionally followed by
+    a set of directory names to skip.
+    """
+    base_path, pattern, dirs_chunk, *rest = args
+    exclude_dirs = rest[0] if rest else frozenset()
     results = []
     for directory in dirs_chunk:
         try:
             if directory.is_dir():
-                results.extend(list(directory.rglob(pattern)))
+                results.extend(
+                    Path(p) for p in _scandir_walk(str(directory), pattern, exclude_dirs)
+                )
         except (OSError, PermissionError) as e:
             logging.debug(f"Error scanning directory {directory}: {e}")
     return results
@@ -33,8 +120,9 @@ def map_cs_to_projects_batch(args: Tuple[List[str]]) -> Dict[str, Optional[str]]
     """
     Worker function to map a batch of .cs files to their parent .csproj files.
 
-    Walks upward from each file's directory, caching directory-to-csproj results
-    so multiple .cs files in the same project resolve without redundant filesystem walks.
+    Walks upward from each file's directory through the shared directory-to-csproj
+    cache, so .cs files in an already-walked tree resolve without redundant
+    filesystem walks.
 
     Args:
         args: Tuple containing:
@@ -45,48 +133,10 @@ def map_cs_to_projects_batch(args: Tuple[List[str]]) -> Dict[str, Optional[str]]
     """
     (cs_file_paths,) = args
     results = {}
-    dir_to_csproj: Dict[
-        str, Optional[str]
-    ] = {}  # Cache: str(directory) -> Optional[str(csproj_path)]
 
     for cs_file_str in cs_file_paths:
         try:
-            cs_file = Path(cs_file_str)
-            current_path = cs_file.parent
-
-            found_csproj = None
-            dirs_walked = []
-
-            while True:
-                dir_key = str(current_path)
-
-                if dir_key in dir_to_csproj:
-                    found_csproj = dir_to_csproj[dir_key]
-                    break
-
-                dirs_walked.append(dir_key)
-
-                try:
-                    csproj_files = list(current_path.glob("*.csproj"))
-                    if csproj_files:
-                        found_csproj = str(csproj_files[0].resolve())
-                        break
-                except Exception as e:
-                    logging.warning(
-                        f"Error searching for .csproj in '{current_path}' for '{cs_file.name}': {e}"
-                    )
-                    break
-
-                if current_path == current_path.parent:
-                    break
-                current_path = current_path.parent
-
-            # Cache all walked directories with the result
-            for d in dirs_walked:
-                dir_to_csproj[d] = found_csproj
-
-            results[cs_file_str] = found_csproj
-
+            results[cs_file_str] = nearest_project_file(Path(cs_file_str).parent)
         except Exception as e:
             logging.warning(f"Error mapping .cs file '{cs_file_str}' to project: {e}")
             results[cs_file_str] = None
@@ -111,9 +161,17 @@ def parse_csproj_files_batch(args: Tuple[List[Path], Path]) -> Dict[str, Dict]:
             'error': str or None
         }
     """
+    from scatter.scanners.project_scanner import read_csproj_summary
+
     csproj_batch, target_csproj_path = args
     results = {}
-    consumer_namespaces = {"msb": "http://schemas.microsoft.com/developer/msbuild/2003"}
+    # References are resolved the same way, so path equality replaces the
+    # exists()/exists()/samefile() stat calls per reference.
+    target_resolved = target_csproj_path.resolve()
+    # Most references name some other project; rejecting them on file name
+    # skips the per-component lstat calls of resolve(). Both the given and the
+    # resolved target names count, in case the target path is a symlink.
+    target_names = {target_csproj_path.name.lower(), target_resolved.name.lower()}
 
     for consumer_csproj_abs in csproj_batch:
         file_result = {
@@ -123,46 +181,35 @@ def parse_csproj_files_batch(args: Tuple[List[Path], Path]) -> Dict[str, Dict]:
         }
 
         try:
-            tree = ET.parse(consumer_csproj_abs)
-            root = tree.getroot()
-            refs = root.findall(".//msb:ProjectReference", consumer_namespaces)
-            if not refs:
-                refs = root.findall(".//ProjectReference")
-
-            for ref in refs:
-                include_ = ref.get("Include")
-                if include_:
-                    # normalize paths so we can run on windows and *nix
-                    include_ = include_.replace("\\", "/")
-
-                    # ignore stuff that might not be built yet
-                    if "$(" in include_ and ")" in include_:
-                        logging.debug(
-                            f"  Skipping ProjectReference with likely MSBuild property: '{include_}'"
-                        )
-                        continue
+            refs = read_csproj_summary(consumer_csproj_abs).project_references
 
-                    try:
-                        ref_path_abs = (consumer_csproj_abs.parent / include_).resolve(strict=False)
-
-                        if (
-                            ref_path_abs.exists()
-                            and target_csproj_path.exists()
-                            and ref_path_abs.samefile(target_csproj_path)
-                        ):
-                            file_result["is_consumer"] = True
-                            logging.debug(
-                                f"  MATCH: Found direct reference from {consumer_csproj_abs.name}"
-                            )
-                            break
-                    except OSError as e:
-                        logging.warning(
-                            f"Could not resolve or compare reference path '{include_}' in {consumer_csproj_abs.name}: {e}. Skipping reference."
-                        )
-                    except Exception as e:
-                        logging.warning(
-                            f"Error processing reference path '{include_}' in {consumer_csproj_abs.name}: {e}. Skipping reference."
+            for include_ in refs:
+                # ignore stuff that might not be built yet
+                if "$(" in include_ and ")" in include_:
+                    logging.debug(
+                        "  Skipping ProjectReference with likely MSBuild property: '%s'", include_
+                    )
+                    continue
+                if include_.rpartition("/")[2].lower() not in target_names:
+                    continue
+
+                try:
+                    ref_path_abs = (consumer_csproj_abs.parent / include_).resolve(strict=False)
+
+                    if ref_path_abs == target_resolved:
+                        file_result["is_consumer"] = True
+                        logging.debug(
+                            "  MATCH: Found direct reference from %s", consumer_csproj_abs.name
                         )
+                        break
+                except OSError as e:
+                    logging.warning(
+                        f"Could not resolve or compare reference path '{include_}' in {consumer_csproj_abs.name}: {e}. Skipping reference."
+                    )
+                except Exception as e:
+                    logging.warning(
+                        f"Error processing reference path '{include_}' in {consumer_csproj_abs.name}: {e}. Skipping reference."
+                    )
 
         except (ET.ParseError, OSError) as e:
             file_result["error"] = f"{type(e).__name__} - {e}"
@@ -258,6 +305,110 @@ def parse_csproj_files_parallel(
         return parse_csproj_files_batch((csproj_files, target_csproj_path))
 
 
+def collect_project_references_batch(args: Tuple[List[Path]]) -> Dict[str, List[str]]:
+    """
+    Worker function to read the resolved ProjectReferences of a batch of .csproj files.
+
+    Applies the same rules as ``parse_csproj_files_batch``: includes containing
+    MSBuild properties are skipped, and unreadable projects reference nothing.
+
+    Args:
+        args: Tuple containing:
+            - csproj_batch: List of .csproj file paths to read
+
+    Returns:
+        Dictionary mapping str(csproj_path) to the str paths of the projects it references
+    """
+    from scatter.scanners.project_scanner import read_csproj_summary
+
+    (csproj_batch,) = args
+    results: Dict[str, List[str]] = {}
+
+    for consumer_csproj_abs in csproj_batch:
+        references: List[str] = []
+        try:
+            refs = read_csproj_summary(consumer_csproj_abs).project_references
+        except (ET.ParseError, OSError) as e:
+            logging.warning(
+                f"Skipping reference check for {consumer_csproj_abs.name}: {type(e).__name__} - {e}"
+            )
+            refs = ()
+        for include_ in refs:
+            if "$(" in include_ and ")" in include_:
+                continue
+            try:
+                references.append(
+                    str((consumer_csproj_abs.parent / include_).resolve(strict=False))
+                )
+            except OSError as e:
+                logging.warning(
+                    f"Could not resolve reference path '{include_}' in {consumer_csproj_abs.name}: {e}. Skipping reference."
+                )
+        # Use string keys for cross-process serialization
+        results[str(consumer_csproj_abs)] = references
+
+    return results
+
+
+def collect_project_references_parallel(
+    csproj_files: List[Path],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    csproj_analysis_chunk_size: int = 25,
+    disable_multiprocessing: bool = False,
+) -> Dict[str, List[str]]:
+    """
+    Read the resolved ProjectReferences of many .csproj files in parallel.
+
+    Args:
+        csproj_files: List of .csproj file paths to read
+        max_workers: Maximum number of worker processes
+        csproj_analysis_chunk_size: Number of files per worker batch
+        disable_multiprocessing: Force sequential processing
+
+    Returns:
+        Dictionary mapping str(csproj_path) to the str paths of the projects it references
+    """
+    if (
+        disable_multiprocessing
+        or not MULTIPROCESSING_ENABLED
+        or len(csproj_files) < csproj_analysis_chunk_size
+    ):
+        logging.debug(f"Using sequential reference collection for {len(csproj_files)} files")
+        return collect_project_references_batch((csproj_files,))
+
+    logging.debug(
+        f"Using parallel reference collection for {len(csproj_files)} files with {max_workers} workers"
+    )
+
+    try:
+        file_chunks = chunk_list(csproj_files, csproj_analysis_chunk_size)
+        all_results: Dict[str, List[str]] = {}
+
+        if len(csproj_files) < 200:
+            scaled_workers = min(max_workers, 4)
+        elif len(csproj_files) < 1000:
+            scaled_workers = min(max_workers, 8)
+        else:
+            scaled_workers = max_workers
+
+        with ProcessPoolExecutor(max_workers=scaled_workers) as executor:
+            futures = [
+                executor.submit(collect_project_references_batch, (chunk,)) for chunk in file_chunks
+            ]
+            for future in as_completed(futures):
+                try:
+                    all_results.update(future.result(timeout=300))
+                except Exception as e:
+                    logging.warning(f"Error processing reference collection chunk: {e}")
+
+        logging.debug(f"Parallel reference collection completed: {len(all_results)} files read")
+        return all_results
+
+    except Exception as e:
+        logging.warning(f"Parallel reference collection failed: {e}. Falling back to sequential.")
+        return collect_project_references_batch((csproj_files,))
+
+
 def map_cs_to_projects_parallel(
     cs_files: List[Path],
     max_workers: int = DEFAULT_MAX_WORKERS,
@@ -344,24 +495,46 @@ def analyze_cs_files_batch(args: Tuple[List[Path], Dict[str, Any]]) -> Dict[Path
         args: Tuple containing:
             - files_batch: List of .cs file paths to analyze
             - analysis_config: Dictionary containing:
-                - 'analysis_type': 'namespace', 'class', 'sproc', or 'method'
+                - 'analysis_type': 'namespace', 'class', 'sproc', 'method', 'consumer'
+                  or 'types'
                 - 'target_namespace': For namespace analysis
                 - 'class_name': For class usage analysis
                 - 'method_pattern': Compiled regex pattern for method analysis
-                - 'sproc_pattern': Compiled regex pattern for sproc analysis
+                - 'sproc_pattern': Compiled regex pattern for sproc analysis; bytes
+                  patterns scan the raw file, str patterns the decoded text
+                - 'sproc_literal': Optional lowercased bytes name the sproc
+                  pattern requires, used as a cheap prefilter
+                - 'find_enclosing_type': When true, sproc results for matching
+                  files also carry 'enclosing_type', the type enclosing the
+                  first match (or None), resolved in the worker
                 - 'using_pattern': Compiled regex pattern for namespace analysis
                 - 'class_pattern': Compiled regex pattern for class analysis
 
+            The 'consumer' type fuses the namespace, class and method checks
+            into a single read of each file: the class pattern is only tried
+            when the using pattern hits, and the method pattern only when the
+            class check passes. Its patterns must be compiled from bytes;
+            'literals' optionally maps 'namespace'/'class'/'method' to bytes
+            substrings each pattern requires, used as a cheap prefilter. A
+            None 'using_pattern' skips the namespace check (every file passes).
+
     Returns:
         Dictionary mapping file paths to analysis results:
         {
             file_path: {
-                'matches': List of match objects or boolean,
+                'matches': List of matched strings (first match only for the
+                    namespace/class/method filters, which stop at the first hit;
+                    all (text, offset) pairs for sproc),
                 'has_match': boolean,
                 'error': str or None,
-                'content_preview': str (first 200 chars for debugging)
+                'content_preview': str (first 200 chars for debugging; empty
+                    for the consumer and sproc scans)
             }
         }
+        'consumer' results additionally carry 'class_match' and 'method_match'
+        booleans; 'has_match' reports the namespace check.
+        'types' results list the type names declared in the file (sorted) as
+        'matches'.
     """
     files_batch, analysis_config = args
     results = {}
@@ -371,24 +544,31 @@ def analyze_cs_files_batch(args: Tuple[List[Path], Dict[str, Any]]) -> Dict[Path
         file_result = {"matches": [], "has_match": False, "error": None, "content_preview": ""}
 
         try:
-            # Read file content
-            content = cs_file_path.read_text(encoding="utf-8", errors="ignore")
-            file_result["content_preview"] = content[:200].replace("\n", " ")
+            # Read file content. The fused consumer scan and the sproc scan
+            # match bytes patterns against the raw file and decode only what
+            # they report, so they skip the preview too — nothing in the file
+            # is decoded for the (common) files that fail the prefilter.
+            if analysis_type in ("consumer", "sproc"):
+                content_bytes = read_bytes_cached(cs_file_path)
+                content = ""
+            else:
+                content = cs_file_path.read_text(encoding="utf-8", errors="ignore")
+                file_result["content_preview"] = content[:200].replace("\n", " ")
 
             # Perform analysis based on type
             if analysis_type == "namespace":
                 using_pattern = analysis_config.get("using_pattern")
                 if using_pattern:
-                    matches = list(using_pattern.finditer(content))
-                    file_result["matches"] = [match.group() for match in matches]
-                    file_result["has_match"] = len(matches) > 0
+                    match = using_pattern.search(content)
+                    file_result["matches"] = [match.group()] if match else []
+                    file_result["has_match"] = match is not None
 
             elif analysis_type == "class":
                 class_pattern = analysis_config.get("class_pattern")
                 if class_pattern:
-                    matches = list(class_pattern.finditer(content))
-                    file_result["matches"] = [match.group() for match in matches]
-                    file_result["has_match"] = len(matches) > 0
+                    match = class_pattern.search(content)
+                    file_result["matches"] = [match.group()] if match else []
+                    file_result["has_match"] = match is not None
                     # AST confirmation: filter false positives in comments/strings
                     if file_result["has_match"] and analysis_config.get("use_ast"):
                         from scatter.parsers.ast_validator import validate_type_usage
@@ -400,17 +580,53 @@ def analyze_cs_files_batch(args: Tuple[List[Path], Dict[str, Any]]) -> Dict[Path
 
             elif analysis_type == "sproc":
                 sproc_pattern = analysis_config.get("sproc_pattern")
-                if sproc_pattern:
-                    matches = list(sproc_pattern.finditer(content))
-                    file_result["matches"] = [(match.group(), match.start()) for match in matches]
+                # Lowercased sproc name the pattern requires; the substring
+                # test skips the regex for files that never mention it.
+                sproc_literal = analysis_config.get("sproc_literal")
+                if sproc_pattern and (not sproc_literal or sproc_literal in content_bytes.lower()):
+                    # Offsets are reported in characters of the decoded file,
+                    # which is what find_enclosing_type_name indexes into.
+                    # Each gap between matches is decoded once, keeping this
+                    # linear in file size however many matches there are.
+                    matches = []
+                    first_prefix = ""
+                    if isinstance(sproc_pattern.pattern, str):
+                        # User patterns keep str semantics; match the decoded file
+                        content = content_bytes.decode("utf-8", errors="ignore")
+                        for match in sproc_pattern.finditer(content):
+                            if not matches:
+                                first_prefix = content[: match.start()]
+                            matches.append((match.group(), match.start()))
+                    else:
+                        char_offset = 0
+                        byte_offset = 0
+                        for match in sproc_pattern.finditer(content_bytes):
+                            gap = content_bytes[byte_offset : match.start()].decode(
+                                "utf-8", errors="ignore"
+                            )
+                            if not matches:
+                                first_prefix = gap
+                            char_offset += len(gap)
+                            byte_offset = match.start()
+                            matches.append(
+                                (match.group().decode("utf-8", errors="ignore"), char_offset)
+                            )
+                    file_result["matches"] = matches
                     file_result["has_match"] = len(matches) > 0
+                    if matches and analysis_config.get("find_enclosing_type"):
+                        from scatter.scanners.type_scanner import find_enclosing_type_name
+
+                        # Only the text before the first match is ever searched
+                        file_result["enclosing_type"] = find_enclosing_type_name(
+                            first_prefix, len(first_prefix)
+                        )
 
             elif analysis_type == "method":
                 method_pattern = analysis_config.get("method_pattern")
                 if method_pattern:
-                    matches = list(method_pattern.finditer(content))
-                    file_result["matches"] = [match.group() for match in matches]
-                    file_result["has_match"] = len(matches) > 0
+                    match = method_pattern.search(content)
+                    file_result["matches"] = [match.group()] if match else []
+                    file_result["has_match"] = match is not None
                     # AST confirmation: filter false positives in comments/strings
                     if file_result["has_match"] and analysis_config.get("use_ast"):
                         from scatter.parsers.ast_validator import validate_type_usage
@@ -420,6 +636,60 @@ def analyze_cs_files_batch(args: Tuple[List[Path], Dict[str, Any]]) -> Dict[Path
                             file_result["has_match"] = False
                             file_result["matches"] = []
 
+            elif analysis_type == "consumer":
+                file_result["class_match"] = False
+                file_result["method_match"] = False
+                # Optional literal needles: a plain substring test rejects the
+                # (common) files that never mention the identifier before any
+                # regex runs.
+                literals = analysis_config.get("literals", {})
+                # Without a using pattern every file passes the namespace check
+                using_pattern = analysis_config.get("using_pattern")
+                if using_pattern is None or (
+                    literals.get("namespace", b"") in content_bytes
+                    and using_pattern.search(content_bytes)
+                ):
+                    file_result["has_match"] = True
+                    use_ast = analysis_config.get("use_ast")
+                    class_pattern = analysis_config.get("class_pattern")
+                    if (
+                        class_pattern
+                        and literals.get("class", b"") in content_bytes
+                        and class_pattern.search(content_bytes)
+                    ):
+                        if use_ast:
+                            from scatter.parsers.ast_validator import validate_type_usage
+
+                            content = content_bytes.decode("utf-8", errors="ignore")
+                            class_name = analysis_config.get("class_name", "")
+                            file_result["class_match"] = validate_type_usage(content, class_name)
+                        else:
+                            file_result["class_match"] = True
+
+                    method_pattern = analysis_config.get("method_pattern")
+                    if (
+                        file_result["class_match"]
+                        and method_pattern
+                        and literals.get("method", b"") in content_bytes
+                        and method_pattern.search(content_bytes)
+                    ):
+                        method_name = analysis_config.get("method_name", "")
+                        if use_ast and method_name:
+                            from scatter.parsers.ast_validator import validate_type_usage
+
+                            file_result["method_match"] = validate_type_usage(
+                                content, f".{method_name}"
+                            )
+                        else:
+                            file_result["method_match"] = True
+
+            elif analysis_type == "types":
+                from scatter.scanners.type_scanner import extract_type_names_from_content
+
+                type_names = extract_type_names_from_content(content)
+                file_result["matches"] = sorted(type_names)
+                file_result["has_match"] = bool(type_names)
+
             else:
                 file_result["error"] = f"Unknown analysis type: {analysis_type}"
 
@@ -433,6 +703,35 @@ def analyze_cs_files_batch(args: Tuple[List[Path], Dict[str, Any]]) -> Dict[Path
     return results
 
 
+# Process pool for .cs analysis, kept for the life of the process and sized to
+# max_workers. Git and sproc modes call find_consumers once per changed type
+# or class; starting a fresh set of worker interpreters for every call cost
+# more than the scan itself on typical consumer sets. Smaller scans use fewer
+# of its workers by keeping fewer chunks in flight, not by a smaller pool.
+_cs_analysis_executor: Optional[ProcessPoolExecutor] = None
+_cs_analysis_workers = 0
+
+
+def _cs_analysis_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared analysis pool, replacing it if ``max_workers`` changed."""
+    global _cs_analysis_executor, _cs_analysis_workers
+    if _cs_analysis_executor is not None and _cs_analysis_workers != max_workers:
+        _discard_cs_analysis_pool()
+    if _cs_analysis_executor is None:
+        _cs_analysis_executor = ProcessPoolExecutor(max_workers=max_workers)
+        _cs_analysis_workers = max_workers
+    return _cs_analysis_executor
+
+
+@atexit.register
+def _discard_cs_analysis_pool() -> None:
+    """Shut the shared pool down; the next call starts a fresh one."""
+    global _cs_analysis_executor
+    pool, _cs_analysis_executor = _cs_analysis_executor, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def analyze_cs_files_parallel(
     cs_files: List[Path],
     analysis_config: Dict[str, Any],
@@ -469,33 +768,43 @@ def analyze_cs_files_parallel(
         f"Using parallel {analysis_type} analysis for {len(cs_files)} files with {max_workers} workers"
     )
 
+    # Adaptive worker scaling based on file count
+    if len(cs_files) < 200:
+        scaled_workers = min(max_workers, 4)
+    elif len(cs_files) < 1000:
+        scaled_workers = min(max_workers, 8)
+    else:
+        scaled_workers = max_workers
+
     try:
         # Split files into chunks
         file_chunks = chunk_list(cs_files, cs_analysis_chunk_size)
         all_results = {}
         completed_chunks = 0
 
-        # Adaptive worker scaling based on file count
-        if len(cs_files) < 200:
-            scaled_workers = min(max_workers, 4)
-        elif len(cs_files) < 1000:
-            scaled_workers = min(max_workers, 8)
-        else:
-            scaled_workers = max_workers
-
         logging.debug(f"Processing {len(file_chunks)} chunks with {scaled_workers} workers")
 
-        with ProcessPoolExecutor(max_workers=scaled_workers) as executor:
-            # Submit all chunks
-            future_to_chunk = {
-                executor.submit(analyze_cs_files_batch, (chunk, analysis_config)): chunk
-                for chunk in file_chunks
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_chunk):
+        executor = _cs_analysis_pool(max_workers)
+        # At most scaled_workers chunks are queued at a time, so a small scan
+        # occupies only that many of the pool's workers.
+        remaining = iter(file_chunks)
+        pending = set()
+
+        def _submit_next() -> None:
+            chunk = next(remaining, None)
+            if chunk is not None:
+                pending.add(executor.submit(analyze_cs_files_batch, (chunk, analysis_config)))
+
+        for _ in range(scaled_workers):
+            _submit_next()
+
+        # Collect results as they complete
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                _submit_next()
                 try:
-                    chunk_results = future.result(timeout=300)
+                    chunk_results = future.result()
                     all_results.update(chunk_results)
                     completed_chunks += 1
 
@@ -505,6 +814,8 @@ def analyze_cs_files_parallel(
                             f"{analysis_type} analysis progress: {completed_chunks}/{len(file_chunks)} chunks completed"
                         )
 
+                except BrokenProcessPool:
+                    raise
                 except Exception as e:
                     logging.warning(f"Error processing {analysis_type} analysis chunk: {e}")
                     completed_chunks += 1
@@ -515,6 +826,7 @@ def analyze_cs_files_parallel(
         return all_results
 
     except Exception as e:
+        _discard_cs_analysis_pool()
         logging.warning(
             f"Parallel {analysis_type} analysis failed: {e}. Falling back to sequential."
         )
@@ -534,24 +846,29 @@ def estimate_file_count(search_path: Path, pattern: str, sample_dirs: int = 5) -
         Estimated total file count
     """
     try:
-        # Get first few directories for sampling
-        dirs_to_sample = []
-        dirs_to_sample.append(search_path)
-
-        # Add a few subdirectories for sampling
-        for subdir in search_path.rglob("*"):
-            if subdir.is_dir() and len(dirs_to_sample) < sample_dirs:
-                dirs_to_sample.append(subdir)
+        # Sample the root and the first subdirectories found breadth-first.
+        # os.scandir reports entry types from the listing itself, so neither
+        # step needs a stat per entry or builds Path objects.
+        dirs_to_sample = [str(search_path)]
+        for sample_dir in dirs_to_sample:
             if len(dirs_to_sample) >= sample_dirs:
                 break
+            with os.scandir(sample_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs_to_sample.append(entry.path)
+                        if len(dirs_to_sample) >= sample_dirs:
+                            break
 
         # Count files in sample directories
         total_files_sampled = 0
         total_dirs_sampled = len(dirs_to_sample)
 
         for sample_dir in dirs_to_sample:
-            files_in_dir = len(list(sample_dir.glob(pattern)))
-            total_files_sampled += files_in_dir
+            with os.scandir(sample_dir) as it:
+                total_files_sampled += sum(
+                    1 for entry in it if fnmatch.fnmatch(entry.name, pattern)
+                )
 
         if total_dirs_sampled == 0:
             return 0
@@ -586,6 +903,7 @@ def find_files_with_pattern_parallel(
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     disable_multiprocessing: bool = False,
     parallel_threshold: int = 50,
+    exclude_dirs: Optional[Set[str]] = None,
 ) -> List[Path]:
     """
     Optimized parallel file discovery with intelligent threshold detection.
@@ -603,14 +921,17 @@ def find_files_with_pattern_parallel(
         chunk_size: Directories per worker chunk
         disable_multiprocessing: Force sequential processing
         parallel_threshold: Minimum estimated files to use parallel processing
+        exclude_dirs: Directory names (e.g. {'bin', 'obj'}) pruned from the walk
 
     Returns:
         List of matching file paths
     """
+    exclude_dirs = frozenset(exclude_dirs or ())
+
     # Force sequential if disabled
     if disable_multiprocessing or not MULTIPROCESSING_ENABLED:
         logging.debug(f"Using sequential file discovery for pattern '{pattern}' (disabled)")
-        return list(search_path.rglob(pattern))
+        return [Path(p) for p in _scandir_walk(str(search_path), pattern, exclude_dirs)]
 
     # Estimate file count efficiently
     estimated_files = estimate_file_count(search_path, pattern)
@@ -621,7 +942,7 @@ def find_files_with_pattern_parallel(
             f"Using sequential file discovery for pattern '{pattern}' - "
             f"estimated {estimated_files} files < {parallel_threshold} threshold"
         )
-        return list(search_path.rglob(pattern))
+        return [Path(p) for p in _scandir_walk(str(search_path), pattern, exclude_dirs)]
 
     # For larger file counts, use intelligent parallel processing
     logging.debug(
@@ -631,7 +952,7 @@ def find_files_with_pattern_parallel(
 
     try:
         # NOW enumerate directories (only when we know we'll use parallel)
-        all_dirs = [search_path] + [d for d in search_path.rglob("*") if d.is_dir()]
+        all_dirs = [search_path] + [Path(d) for d in _scandir_dirs(str(search_path), exclude_dirs)]
 
         # Adaptive worker scaling based on work size
         if estimated_files < 200:
@@ -657,7 +978,9 @@ def find_files_with_pattern_parallel(
         with ProcessPoolExecutor(max_workers=scaled_workers) as executor:
             # Submit all chunks
             future_to_chunk = {
-                executor.submit(find_files_with_pattern_chunk, (search_path, pattern, chunk)): chunk
+                executor.submit(
+                    find_files_with_pattern_chunk, (search_path, pattern, chunk, exclude_dirs)
+                ): chunk
                 for chunk in dir_chunks
             }
 
@@ -693,7 +1016,38 @@ def find_files_with_pattern_parallel(
 
     except Exception as e:
         logging.warning(f"Parallel file discovery failed: {e}. Falling back to sequential.")
-        return list(search_path.rglob(pattern))
+        return [Path(p) for p in _scandir_walk(str(search_path), pattern, exclude_dirs)]
+
+
+def find_files_in_directories(
+    directories: List[Path],
+    pattern: str,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    disable_multiprocessing: bool = False,
+) -> Dict[Path, List[Path]]:
+    """Enumerate files matching ``pattern`` under each of several directories.
+
+    Directory listing is syscall-bound and os.scandir releases the GIL, so the
+    walks run on a thread pool rather than spawning a process pool per
+    directory. Duplicate directories are walked once. Directories that cannot
+    be listed are logged at warning level and contribute no files.
+
+    Returns:
+        Dictionary mapping each directory to its matching file paths
+    """
+    unique_dirs = list(dict.fromkeys(directories))
+
+    def _walk(directory: Path) -> List[Path]:
+        def _warn(e: OSError) -> None:
+            logging.warning(f"Could not list {pattern} files in {directory}: {e}")
+
+        return [Path(p) for p in _scandir_walk(str(directory), pattern, onerror=_warn)]
+
+    if disable_multiprocessing or len(unique_dirs) <= 1:
+        return {d: _walk(d) for d in unique_dirs}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_dirs))) as executor:
+        return dict(zip(unique_dirs, executor.map(_walk, unique_dirs)))
 
 
 def extract_exclude_dirs(exclude_patterns: List[str]) -> Set[str]:
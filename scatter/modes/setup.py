@@ -2,6 +2,7 @@
 
 import csv
 import logging
+import stat
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -10,6 +11,7 @@ from typing import Dict, List, Optional, Tuple
 from scatter.analysis import ModeContext
 from scatter.cli_parser import _build_cli_overrides
 from scatter.config import ScatterConfig, load_config
+from scatter.scanners._helpers import clear_project_file_cache
 from scatter.scanners.solution_scanner import (
     SolutionInfo,
     scan_solutions,
@@ -131,10 +133,7 @@ def resolve_paths(args, parser) -> ResolvedPaths:
 
         if is_sproc_mode:
             if args.repo_path != "." or args.base_branch != "main":
-                if (
-                    args.repo_path != Path(args.search_scope).resolve(strict=True).as_posix()
-                    and args.branch_name is None
-                ):
+                if args.repo_path != search_scope_abs.as_posix() and args.branch_name is None:
                     logging.warning(
                         "Arguments --repo-path and --base-branch are not applicable in --stored-procedure mode and will be ignored."
                     )
@@ -145,7 +144,12 @@ def resolve_paths(args, parser) -> ResolvedPaths:
 
         if is_target_mode:
             target_path_input = Path(args.target_project).resolve()
-            if target_path_input.is_dir():
+            # One stat serves both the directory and the file check
+            try:
+                target_mode = target_path_input.stat().st_mode
+            except OSError:
+                target_mode = 0
+            if stat.S_ISDIR(target_mode):
                 try:
                     next(target_path_input.glob("*.csproj"))
                     logging.info(f"Found target project in directory: {target_path_input}")
@@ -153,7 +157,7 @@ def resolve_paths(args, parser) -> ResolvedPaths:
                     raise FileNotFoundError(
                         f"No .csproj file found in the target directory: {target_path_input}"
                     )
-            elif target_path_input.is_file() and target_path_input.suffix.lower() == ".csproj":
+            elif stat.S_ISREG(target_mode) and target_path_input.suffix.lower() == ".csproj":
                 logging.info(f"Using target project file: {target_path_input}")
             else:
                 raise ValueError(
@@ -294,8 +298,10 @@ def _read_one_pipeline_csv(csv_path: Path, pipeline_map: Dict[str, str], label:
     loaded = 0
     try:
         with open(csv_path, mode="r", newline="", encoding="utf-8-sig") as csvfile:
-            reader = csv.DictReader(csvfile)
-            fieldnames = set(reader.fieldnames or [])
+            # Plain reader + fixed column indices: no per-row dict construction
+            reader = csv.reader(csvfile)
+            header = next(reader, None) or []
+            fieldnames = set(header)
             # Accept both old ("Application Name") and new ("app_name") column names
             has_old = {"Application Name", "Pipeline Name"}.issubset(fieldnames)
             has_new = {"app_name", "pipeline_name"}.issubset(fieldnames)
@@ -307,12 +313,19 @@ def _read_one_pipeline_csv(csv_path: Path, pipeline_map: Dict[str, str], label:
                 return 0
             app_col = "app_name" if has_new else "Application Name"
             pipe_col = "pipeline_name" if has_new else "Pipeline Name"
+            # Last occurrence wins for duplicated headers, as with DictReader
+            column_index = {name: i for i, name in enumerate(header)}
+            app_idx = column_index[app_col]
+            pipe_idx = column_index[pipe_col]
+            min_len = max(app_idx, pipe_idx) + 1
             for row in reader:
-                app_name = row.get(app_col, "").strip()
-                pipe_name = row.get(pipe_col, "").strip()
+                if len(row) < min_len:
+                    continue
+                app_name = row[app_idx].strip()
+                pipe_name = row[pipe_idx].strip()
                 if app_name and pipe_name:
                     if app_name in pipeline_map:
-                        logging.debug(f"  {label}: overwriting '{app_name}' pipeline mapping")
+                        logging.debug("  %s: overwriting '%s' pipeline mapping", label, app_name)
                     pipeline_map[app_name] = pipe_name
                     loaded += 1
     except Exception as e:
@@ -389,6 +402,8 @@ def build_mode_context(
     discovered_files=None,
 ) -> ModeContext:
     """Assemble ModeContext from resolved components."""
+    # Directory -> .csproj lookups are remembered for one run only.
+    clear_project_file_cache()
     return ModeContext(
         search_scope=paths.search_scope,
         config=config,
@@ -404,6 +419,9 @@ def build_mode_context(
         method_name=args.method_name,
         target_namespace=args.target_namespace,
         summarize_consumers=args.summarize_consumers,
+        summarize_workers=args.summarize_workers,
+        use_summary_cache=not args.no_summary_cache,
+        max_summarize_bytes=args.max_summarize_bytes,
         max_workers=args.max_workers,
         chunk_size=args.chunk_size,
         disable_multiprocessing=args.disable_multiprocessing,
@@ -8,6 +8,7 @@ import logging
 import sys
 import time
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -82,11 +83,7 @@ def dispatch_legacy_output(
             f"Overall analysis complete. Found {len(all_results)} consuming relationship(s) matching the criteria."
         )
         all_results.sort(
-            key=lambda x: (
-                x.target_project_name,
-                x.triggering_type,
-                x.consumer_project_name,
-            )
+            key=attrgetter("target_project_name", "triggering_type", "consumer_project_name")
         )
 
     # Generate AI summary if requested (one call, all modes)
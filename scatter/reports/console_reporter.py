@@ -1,7 +1,9 @@
 """Console output formatting for analysis results."""
 
+import sys
 import textwrap
 from itertools import groupby
+from operator import attrgetter
 from typing import List, Optional
 
 from scatter.core.models import (
@@ -15,6 +17,11 @@ from scatter.core.models import (
 )
 from scatter.core.tree import build_adjacency, CONFIDENCE_LABEL_RANK
 
+# Built once: textwrap.fill() constructs a new TextWrapper on every call.
+_SUMMARY_WRAPPER = textwrap.TextWrapper(
+    width=76, initial_indent="        ", subsequent_indent="        "
+)
+
 
 def print_filter_pipeline(pipeline: FilterPipeline) -> None:
     """Print filter pipeline summary to console."""
@@ -37,6 +44,11 @@ def print_filter_pipeline(pipeline: FilterPipeline) -> None:
                 break
 
 
+def _write_lines(lines: List[str]) -> None:
+    """Write *lines* to stdout with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def print_console_report(
     all_results: List["ConsumerResult"],
     pipeline: Optional[FilterPipeline] = None,
@@ -47,16 +59,21 @@ def print_console_report(
     if pipeline is not None:
         print_filter_pipeline(pipeline)
 
-    print(f"\n{'=' * 60}")
-    print("  Consumer Analysis")
-    print(f"{'=' * 60}")
+    # Lines are collected and written once; per-line print() calls add up
+    # for reports with thousands of consumers.
+    out: List[str] = []
+    emit = out.append
+
+    emit(f"\n{'=' * 60}")
+    emit("  Consumer Analysis")
+    emit(f"{'=' * 60}")
 
     if not all_results:
-        print("  No consuming relationships found.")
+        emit("  No consuming relationships found.")
+        _write_lines(out)
         return
 
-    def group_key(r: "ConsumerResult") -> tuple:
-        return (r.target_project_name, r.target_project_path, r.triggering_type)
+    group_key = attrgetter("target_project_name", "target_project_path", "triggering_type")
 
     all_results = sorted(all_results, key=group_key)
     groups = []
@@ -64,92 +81,88 @@ def print_console_report(
         groups.append((key, list(members)))
 
     for (target_name, target_path, triggering_type), consumers in groups:
-        print(f"  Target: {target_name} ({target_path})")
-        print(f"  Consumers: {len(consumers)}")
+        emit(f"  Target: {target_name} ({target_path})")
+        emit(f"  Consumers: {len(consumers)}")
         if "N/A" not in triggering_type:
-            print(f"  Triggering type: {triggering_type}")
+            emit(f"  Triggering type: {triggering_type}")
 
         # Sort: by coupling score desc when graph metrics, else alphabetical
         if graph_metrics_requested:
             consumers.sort(key=lambda r: (r.coupling_score is None, -(r.coupling_score or 0)))
         else:
-            consumers.sort(key=lambda r: r.consumer_project_name)
+            consumers.sort(key=attrgetter("consumer_project_name"))
 
         # Dynamic column width for consumer name
         col_w = min(max((len(r.consumer_project_name) for r in consumers), default=40), 60)
         col_w = max(col_w, 40)
 
-        print()
+        emit("")
         if graph_metrics_requested:
-            print(
+            emit(
                 f"  {'Consumer':<{col_w}} {'Score':>7} {'Fan-In':>7} {'Fan-Out':>7} {'Instab.':>7} Solutions"
             )
-            print(f"  {'-' * col_w} {'-' * 7} {'-' * 7} {'-' * 7} {'-' * 7} {'-' * 25}")
+            emit(f"  {'-' * col_w} {'-' * 7} {'-' * 7} {'-' * 7} {'-' * 7} {'-' * 25}")
             for r in consumers:
                 solutions = ", ".join(r.consuming_solutions) if r.consuming_solutions else ""
                 if r.coupling_score is not None:
                     fi = r.fan_in or 0
                     fo = r.fan_out or 0
                     inst = r.instability or 0.0
-                    print(
+                    emit(
                         f"  {r.consumer_project_name:<{col_w}} {r.coupling_score:>7.1f} {fi:>7} {fo:>7} {inst:>7.2f} {solutions}"
                     )
                 else:
-                    print(
+                    emit(
                         f"  {r.consumer_project_name:<{col_w}} {'—':>7} {'—':>7} {'—':>7} {'—':>7} {solutions}"
                     )
         else:
-            print(f"  {'Consumer':<{col_w}} Solutions")
-            print(f"  {'-' * col_w} {'-' * 25}")
+            emit(f"  {'Consumer':<{col_w}} Solutions")
+            emit(f"  {'-' * col_w} {'-' * 25}")
             for r in consumers:
                 solutions = ", ".join(r.consuming_solutions) if r.consuming_solutions else ""
-                print(f"  {r.consumer_project_name:<{col_w}} {solutions}")
+                emit(f"  {r.consumer_project_name:<{col_w}} {solutions}")
 
         # Batch job status (minimal, beneath table)
         batch_results = [r for r in consumers if r.batch_job_verification]
         if batch_results:
-            print()
+            emit("")
             for r in batch_results:
-                print(f"    [{r.batch_job_verification}] {r.consumer_project_name}")
+                emit(f"    [{r.batch_job_verification}] {r.consumer_project_name}")
 
         # AI summaries (minimal, beneath table)
         summary_results = [r for r in consumers if r.consumer_file_summaries]
         if summary_results:
-            print()
+            emit("")
             for r in summary_results:
-                print(f"    {r.consumer_project_name}")
+                emit(f"    {r.consumer_project_name}")
                 for file_rel_path, summary in r.consumer_file_summaries.items():
-                    print(f"      {file_rel_path}")
-                    wrapped = textwrap.fill(
-                        summary, width=76, initial_indent="        ", subsequent_indent="        "
-                    )
-                    print(wrapped)
+                    emit(f"      {file_rel_path}")
+                    emit(_SUMMARY_WRAPPER.fill(summary))
 
-        print()
+        emit("")
 
     # Pipeline footer — grouped by pipeline when any result has one
     from scatter.reports.pipeline_reporter import group_by_pipeline
 
     pipeline_groups = group_by_pipeline(all_results)
     if pipeline_groups:
-        print(f"  Pipelines affected: {len(pipeline_groups)}")
+        emit(f"  Pipelines affected: {len(pipeline_groups)}")
         for g in pipeline_groups:
-            print(f"    {g['pipeline_name']} ({g['consumer_count']} project(s))")
+            emit(f"    {g['pipeline_name']} ({g['consumer_count']} project(s))")
             for name in g["consumers"]:
-                print(f"      • {name}")
-        print()
+                emit(f"      • {name}")
+        emit("")
 
     if ai_summary:
-        print(f"\n{'=' * 60}")
-        print("  AI Analysis")
-        print(f"{'=' * 60}\n")
+        emit(f"\n{'=' * 60}")
+        emit("  AI Analysis")
+        emit(f"{'=' * 60}\n")
         # Print markdown as-is — it contains headers, tables, and formatting
-        print(ai_summary)
-        print()
+        emit(ai_summary)
+        emit("")
 
-    print(
-        f"Analysis complete. {len(all_results)} consumer(s) found across {len(groups)} target(s)."
-    )
+    emit(f"Analysis complete. {len(all_results)} consumer(s) found across {len(groups)} target(s).")
+    _write_lines(out)
 
 
 def render_tree(consumers: List[EnrichedConsumer]) -> List[str]:
@@ -229,18 +242,22 @@ def render_tree(consumers: List[EnrichedConsumer]) -> List[str]:
 
 def print_impact_report(report: ImpactReport) -> None:
     """Print formatted impact analysis report to console."""
-    print("\n=== Impact Analysis Report ===")
+    # Written in one call: consumer trees can run to thousands of lines
+    out: List[str] = []
+    emit = out.append
+
+    emit("\n=== Impact Analysis Report ===")
     sow_display = report.sow_text[:200] + "..." if len(report.sow_text) > 200 else report.sow_text
-    print(f"Work Request: {sow_display}")
+    emit(f"Work Request: {sow_display}")
 
     risk_str = report.overall_risk or "Not assessed"
     complexity_str = report.complexity_rating or "Not assessed"
     effort_str = f" ({report.effort_estimate})" if report.effort_estimate else ""
-    print(f"Overall Risk: {risk_str} | Complexity: {complexity_str}{effort_str}")
+    emit(f"Overall Risk: {risk_str} | Complexity: {complexity_str}{effort_str}")
 
     if report.ambiguity_level:
         avg_conf = report.avg_target_confidence or 0.0
-        print(
+        emit(
             f"Target Quality: {report.ambiguity_level} "
             f"({len(report.targets or [])} targets, avg confidence {avg_conf:.2f})"
         )
@@ -248,25 +265,26 @@ def print_impact_report(report: ImpactReport) -> None:
     # Detect no-index scenario: no match_evidence on any target
     has_evidence = any(ti.target.match_evidence for ti in (report.targets or []))
     if report.targets and not has_evidence:
-        print("Note: Running without codebase index — results may be less accurate.")
+        emit("Note: Running without codebase index — results may be less accurate.")
 
     if not report.targets:
-        print("\nNo analysis targets were identified.")
+        emit("\nNo analysis targets were identified.")
+        _write_lines(out)
         return
 
     if report.key_consumers:
-        print("\nKey Consumers (likely to require changes):")
+        emit("\nKey Consumers (likely to require changes):")
         for kc in report.key_consumers:
             detail = f"direct consumer of {kc.appearances} root(s)"
             if kc.max_risk and kc.max_risk in ("High", "Critical"):
                 detail += f", {kc.max_risk} risk"
-            print(f"  {kc.consumer_name} — {detail}")
+            emit(f"  {kc.consumer_name} — {detail}")
 
     for ti in report.targets:
-        print(f"\n--- Target: {ti.target.name} ({ti.target.target_role}) ---")
+        emit(f"\n--- Target: {ti.target.name} ({ti.target.target_role}) ---")
         if ti.target.match_evidence:
-            print(f"Evidence: {ti.target.match_evidence}")
-        print(f"Direct Consumers: {ti.total_direct} | Transitive: {ti.total_transitive}")
+            emit(f"Evidence: {ti.target.match_evidence}")
+        emit(f"Direct Consumers: {ti.total_direct} | Transitive: {ti.total_transitive}")
 
         if ti.change_surface and ti.change_surface.get("changes"):
             changes = ti.change_surface["changes"]
@@ -275,20 +293,20 @@ def print_impact_report(report: ImpactReport) -> None:
             )
             if len(changes) > 6:
                 summary += f", +{len(changes) - 6} more"
-            print(f"Change Surface: {summary}")
+            emit(f"Change Surface: {summary}")
 
         if ti.consumers:
-            tree_lines = render_tree(ti.consumers)
-            for line in tree_lines:
-                print(line)
+            out.extend(render_tree(ti.consumers))
 
     if report.complexity_justification:
-        print("\n--- Complexity ---")
-        print(f"{report.complexity_rating}: {report.complexity_justification}")
+        emit("\n--- Complexity ---")
+        emit(f"{report.complexity_rating}: {report.complexity_justification}")
 
     if report.impact_narrative:
-        print("\n--- Impact Summary ---")
-        print(report.impact_narrative)
+        emit("\n--- Impact Summary ---")
+        emit(report.impact_narrative)
+
+    _write_lines(out)
 
 
 def print_scoping_report(report) -> None:
@@ -363,54 +381,58 @@ def print_pr_risk_report(report: PRRiskReport) -> None:
     score = report.aggregate.composite_score
     level_str = level.value
 
-    print(f"\n{'=' * 60}")
-    print(f"  PR Risk: {level_str} ({score:.2f})")
-    print(f"{'=' * 60}")
-    print(f"  Branch: {report.branch_name} (vs {report.base_branch})")
+    out: List[str] = []
+    emit = out.append
+
+    emit(f"\n{'=' * 60}")
+    emit(f"  PR Risk: {level_str} ({score:.2f})")
+    emit(f"{'=' * 60}")
+    emit(f"  Branch: {report.branch_name} (vs {report.base_branch})")
 
     n_types = len(report.changed_types)
     n_projects = len(report.profiles)
-    print(f"  Changed: {n_types} type(s) across {n_projects} project(s)")
+    emit(f"  Changed: {n_types} type(s) across {n_projects} project(s)")
 
     if not report.graph_available:
-        print("  Note: Graph not available — partial scoring only.")
+        emit("  Note: Graph not available — partial scoring only.")
         for w in report.warnings:
-            print(f"  {w}")
+            emit(f"  {w}")
 
     # Changed types table
     if report.changed_types:
-        print(f"\n  {'Type':<30} {'Kind':<12} {'Change':<10} Project")
-        print(f"  {'-' * 30} {'-' * 12} {'-' * 10} {'-' * 20}")
+        emit(f"\n  {'Type':<30} {'Kind':<12} {'Change':<10} Project")
+        emit(f"  {'-' * 30} {'-' * 12} {'-' * 10} {'-' * 20}")
         for ct in report.changed_types:
-            print(f"  {ct.name:<30} {ct.kind:<12} {ct.change_kind:<10} {ct.owning_project}")
+            emit(f"  {ct.name:<30} {ct.kind:<12} {ct.change_kind:<10} {ct.owning_project}")
 
     # Dimension table
     if report.graph_available:
-        print(f"\n  {'Dimension':<25} {'Score':>7} {'Severity':<10}")
-        print(f"  {'-' * 25} {'-' * 7} {'-' * 10}")
+        emit(f"\n  {'Dimension':<25} {'Score':>7} {'Severity':<10}")
+        emit(f"  {'-' * 25} {'-' * 7} {'-' * 10}")
         for dim in report.aggregate.dimensions:
             if not dim.data_available:
-                print(f"  {dim.label:<25} {'N/A':>7} {'—':<10}")
+                emit(f"  {dim.label:<25} {'N/A':>7} {'—':<10}")
             else:
-                print(f"  {dim.label:<25} {dim.score:>7.2f} {dim.severity:<10}")
+                emit(f"  {dim.label:<25} {dim.score:>7.2f} {dim.severity:<10}")
     else:
         cs = report.aggregate.change_surface
         if cs.data_available:
-            print(f"\n  Change surface: {cs.score:.2f} ({cs.severity})")
+            emit(f"\n  Change surface: {cs.score:.2f} ({cs.severity})")
 
     # Risk factors
     if report.risk_factors:
-        print("\n  Risk Factors:")
+        emit("\n  Risk Factors:")
         for f in report.risk_factors:
-            print(f"    • {f}")
+            emit(f"    • {f}")
 
     # Consumer summary
     if report.unique_consumers:
-        print(
+        emit(
             f"\n  Consumers: {report.total_direct_consumers} direct, "
             f"{report.total_transitive_consumers} transitive "
             f"({len(report.unique_consumers)} unique)"
         )
 
-    print(f"\n  Completed in {report.duration_ms}ms")
-    print()
+    emit(f"\n  Completed in {report.duration_ms}ms")
+    emit("")
+    _write_lines(out)
@@ -3,10 +3,14 @@
 import csv
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from scatter.core.models import FilterPipeline, ImpactReport
 
+# Reports for large scopes can be several MB; a 1 MiB buffer keeps the number
+# of write syscalls small compared to the 8 KiB default.
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
 def _build_filter_comment_header(pipeline: FilterPipeline) -> str:
     """Build comment header lines for CSV from a FilterPipeline."""
@@ -40,32 +44,45 @@ def write_csv_report(
     ]
     if graph_metrics_requested:
         report_fieldnames.extend(["CouplingScore", "FanIn", "FanOut", "Instability", "InCycle"])
-    # Stringify native types for CSV compatibility
-    csv_rows = []
-    for item in detailed_results:
-        row = dict(item)
-        solutions = row.get("ConsumingSolutions", [])
-        row["ConsumingSolutions"] = (
-            "; ".join(solutions) if isinstance(solutions, list) else (solutions or "")
-        )
-        row["PipelineName"] = row.get("PipelineName") or ""
-        row["BatchJobVerification"] = row.get("BatchJobVerification") or ""
-        if graph_metrics_requested:
-            row.setdefault("CouplingScore", "")
-            row.setdefault("FanIn", "")
-            row.setdefault("FanOut", "")
-            row.setdefault("Instability", "")
-            row["InCycle"] = str(row.get("InCycle", "")) if row.get("InCycle") is not None else ""
-        csv_rows.append(row)
+
+    def _csv_rows() -> Iterator[List]:
+        # Rows are built in header order and stringified for CSV one at a
+        # time, so neither a per-row dict copy nor a second list is made.
+        for item in detailed_results:
+            solutions = item.get("ConsumingSolutions", [])
+            row = [
+                item.get("TargetProjectName", ""),
+                item.get("TargetProjectPath", ""),
+                item.get("TriggeringType", ""),
+                item.get("ConsumerProjectName", ""),
+                item.get("ConsumerProjectPath", ""),
+                "; ".join(solutions) if isinstance(solutions, list) else (solutions or ""),
+                item.get("PipelineName") or "",
+                item.get("BatchJobVerification") or "",
+            ]
+            if graph_metrics_requested:
+                in_cycle = item.get("InCycle")
+                row.extend(
+                    (
+                        item.get("CouplingScore", ""),
+                        item.get("FanIn", ""),
+                        item.get("FanOut", ""),
+                        item.get("Instability", ""),
+                        str(in_cycle) if in_cycle is not None else "",
+                    )
+                )
+            yield row
+
     try:
         output_file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file_path, "w", newline="", encoding="utf-8") as csvfile:
+        with open(
+            output_file_path, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+        ) as csvfile:
             if pipeline is not None:
                 csvfile.write(_build_filter_comment_header(pipeline))
-            writer = csv.DictWriter(csvfile, fieldnames=report_fieldnames, extrasaction="ignore")
-            writer.writeheader()
-            if csv_rows:
-                writer.writerows(csv_rows)
+            writer = csv.writer(csvfile)
+            writer.writerow(report_fieldnames)
+            writer.writerows(_csv_rows())
         logging.info(f"Successfully wrote CSV report to: {output_file_path}")
     except Exception as e:
         logging.error(f"Failed to write output CSV file: {e}")
@@ -102,7 +119,9 @@ def write_scoping_csv_report(report, output_file_path: Path) -> None:
 
     try:
         output_file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file_path, "w", newline="", encoding="utf-8") as csvfile:
+        with open(
+            output_file_path, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+        ) as csvfile:
             # Header comment with confidence info
             conf = report.confidence
             csvfile.write(
@@ -171,7 +190,9 @@ def write_impact_csv_report(
             rows.append(row)
     try:
         output_file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file_path, "w", newline="", encoding="utf-8") as csvfile:
+        with open(
+            output_file_path, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+        ) as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             writer.writerows(rows)
@@ -360,4 +360,4 @@ def write_graph_json_report(
         bridge_projects=bridge_projects,
     )
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2)
+        f.write(json.dumps(report, indent=2))
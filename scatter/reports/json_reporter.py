@@ -83,7 +83,8 @@ def write_json_report(
     try:
         output_file_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_file_path, "w", encoding="utf-8") as jsonfile:
-            json.dump(json_output, jsonfile, indent=4, default=_default_serializer)
+            # Encode in one go: json.dump() issues a write() per encoded fragment
+            jsonfile.write(json.dumps(json_output, indent=4, default=_default_serializer))
         logging.info(f"Successfully wrote JSON report to: {output_file_path}")
     except Exception as e:
         logging.error(f"Failed to write output JSON file: {e}")
@@ -173,7 +174,7 @@ def write_impact_json_report(
     try:
         output_file_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_file_path, "w", encoding="utf-8") as jsonfile:
-            json.dump(report_dict, jsonfile, indent=4, default=_default_serializer)
+            jsonfile.write(json.dumps(report_dict, indent=4, default=_default_serializer))
         logging.info(f"Successfully wrote impact JSON report to: {output_file_path}")
     except Exception as e:
         logging.error(f"Failed to write impact JSON report: {e}")
@@ -261,7 +262,7 @@ def write_scoping_json_report(
     try:
         output_file_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_file_path, "w", encoding="utf-8") as jsonfile:
-            json.dump(report_dict, jsonfile, indent=4, default=_default_serializer)
+            jsonfile.write(json.dumps(report_dict, indent=4, default=_default_serializer))
         logging.info(f"Successfully wrote scoping JSON report to: {output_file_path}")
     except Exception as e:
         logging.error(f"Failed to write scoping JSON report: {e}")
@@ -334,7 +335,7 @@ def write_pr_risk_json_report(
     try:
         output_file_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_file_path, "w", encoding="utf-8") as jsonfile:
-            json.dump(report_dict, jsonfile, indent=4, default=_default_serializer)
+            jsonfile.write(json.dumps(report_dict, indent=4, default=_default_serializer))
         logging.info(f"Successfully wrote PR risk JSON report to: {output_file_path}")
     except Exception as e:
         logging.error(f"Failed to write PR risk JSON report: {e}")
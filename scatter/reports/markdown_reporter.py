@@ -1,7 +1,7 @@
 """Markdown output formatting for analysis results."""
 
 import logging
-from collections import Counter
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -174,64 +174,55 @@ def build_markdown(
     if not detailed_results:
         parts.append("No consuming relationships found.\n")
     else:
-        # Group by (TargetProjectName, TriggeringType) — same as console reporter
-        group_counts = Counter(
-            (item["TargetProjectName"], item["TriggeringType"]) for item in detailed_results
-        )
-        last_target_type = None
-        current_rows: List[List[str]] = []
-
         headers = ["Consumer", "Path", "Pipeline", "Solutions"]
         if graph_metrics_requested:
             headers.extend(["Coupling", "Fan-In", "Fan-Out", "Instability", "In Cycle"])
 
-        def _flush_table() -> None:
-            if current_rows:
-                parts.append(_md_table(headers, current_rows))
-                parts.append("")
-                current_rows.clear()
-
+        # Group in one pass, keeping sections in the caller's order of first
+        # appearance; rows of one target/type may arrive interleaved.
+        group_key = itemgetter("TargetProjectName", "TriggeringType")
+        groups: Dict[Tuple[str, str], List[Dict]] = {}
         for item in detailed_results:
-            current_target_type = (item["TargetProjectName"], item["TriggeringType"])
-            if current_target_type != last_target_type:
-                _flush_table()
-                count = group_counts[current_target_type]
-                parts.append(
-                    f"## {item['TargetProjectName']} ({item['TargetProjectPath']}) ({count} consumer(s))\n"
-                )
-                if "N/A" not in item["TriggeringType"]:
-                    parts.append(f"Type/Level: {item['TriggeringType']}\n")
-                last_target_type = current_target_type
-
-            pipeline_name = item.get("PipelineName") or "\u2014"
-            solutions = item.get("ConsumingSolutions", [])
-            solutions_str = ", ".join(solutions) if solutions else "\u2014"
-            row: List[str] = [
-                item["ConsumerProjectName"],
-                item["ConsumerProjectPath"],
-                pipeline_name,
-                solutions_str,
-            ]
-            if graph_metrics_requested:
-                cs = item.get("CouplingScore")
-                row.extend(
-                    [
-                        str(cs) if cs is not None else "\u2014",
-                        str(item.get("FanIn", "\u2014")),
-                        str(item.get("FanOut", "\u2014")),
-                        f"{item['Instability']:.3f}"
-                        if item.get("Instability") is not None
-                        else "\u2014",
-                        "yes"
-                        if item.get("InCycle")
-                        else "no"
-                        if item.get("InCycle") is not None
-                        else "\u2014",
-                    ]
-                )
-            current_rows.append(row)
+            groups.setdefault(group_key(item), []).append(item)
+        for (target_name, triggering_type), items in groups.items():
+            parts.append(
+                f"## {target_name} ({items[0]['TargetProjectPath']}) ({len(items)} consumer(s))\n"
+            )
+            if "N/A" not in triggering_type:
+                parts.append(f"Type/Level: {triggering_type}\n")
+
+            rows: List[List[str]] = []
+            for item in items:
+                pipeline_name = item.get("PipelineName") or "\u2014"
+                solutions = item.get("ConsumingSolutions", [])
+                solutions_str = ", ".join(solutions) if solutions else "\u2014"
+                row: List[str] = [
+                    item["ConsumerProjectName"],
+                    item["ConsumerProjectPath"],
+                    pipeline_name,
+                    solutions_str,
+                ]
+                if graph_metrics_requested:
+                    cs = item.get("CouplingScore")
+                    row.extend(
+                        [
+                            str(cs) if cs is not None else "\u2014",
+                            str(item.get("FanIn", "\u2014")),
+                            str(item.get("FanOut", "\u2014")),
+                            f"{item['Instability']:.3f}"
+                            if item.get("Instability") is not None
+                            else "\u2014",
+                            "yes"
+                            if item.get("InCycle")
+                            else "no"
+                            if item.get("InCycle") is not None
+                            else "\u2014",
+                        ]
+                    )
+                rows.append(row)
 
-        _flush_table()
+            parts.append(_md_table(headers, rows))
+            parts.append("")
 
         # Risk highlights and column legend (only when graph metrics present)
         if graph_metrics_requested and detailed_results:
@@ -1,7 +1,9 @@
 """Shared helpers for scanner modules."""
 
+import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 def find_owning_project(
@@ -17,3 +19,117 @@ def find_owning_project(
         if parent == current:
             return None
         current = parent
+
+
+def _first_csproj_name(directory: str) -> Optional[str]:
+    """Name of the first ``*.csproj`` entry in ``directory``, or None.
+
+    A single os.scandir pass that stops at the first hit, in place of
+    ``list(Path.glob("*.csproj"))``. As with glob, the extension matches
+    case-insensitively where the platform folds case (Windows), and missing
+    or unreadable directories have no project.
+    """
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if os.path.normcase(entry.name).endswith(os.path.normcase(".csproj")):
+                    return entry.name
+    except OSError:
+        pass
+    return None
+
+
+# str(directory) -> str(nearest .csproj at or above it), or None when there is
+# none. Shared by find_project_file_on_disk() and the map_cs_to_projects_batch()
+# worker; every directory a walk visits is recorded, so sibling files and
+# deeper files in an already-walked tree resolve with one dict lookup.
+# Each analysis run starts from an empty cache (clear_project_file_cache()).
+_project_file_by_dir: Dict[str, Optional[str]] = {}
+
+
+def clear_project_file_cache() -> None:
+    """Forget every directory -> .csproj lookup, so projects added or moved
+    since the last run are seen."""
+    _project_file_by_dir.clear()
+
+
+def nearest_project_file(directory: Path) -> Optional[str]:
+    """Absolute path of the first .csproj in ``directory`` or its nearest
+    ancestor that has one, or None when the walk reaches the root."""
+    walked: List[str] = []
+    current = directory
+    while True:
+        dir_key = str(current)
+        if dir_key in _project_file_by_dir:
+            found = _project_file_by_dir[dir_key]
+            break
+        walked.append(dir_key)
+        csproj_name = _first_csproj_name(dir_key)
+        if csproj_name is not None:
+            found = str((current / csproj_name).resolve())
+            break
+        if current == current.parent:
+            found = None
+            break
+        current = current.parent
+
+    for dir_key in walked:
+        _project_file_by_dir[dir_key] = found
+    return found
+
+
+# Larger files (typically generated code) are read fresh each time rather than
+# pinned in the cache, and the cache as a whole is bounded by total bytes, not
+# entry count: every pool worker holds its own copy, so a count limit alone
+# would let RSS grow with file size times worker count.
+_MAX_CACHED_FILE_BYTES = 1 << 20
+_BYTE_CACHE_BUDGET = 64 << 20
+
+# path -> (mtime_ns, size, bytes), least recently used first
+_byte_cache: "OrderedDict[str, Tuple[int, int, bytes]]" = OrderedDict()
+_byte_cache_total = 0
+
+
+def read_bytes_cached(file_path: Path) -> bytes:
+    """Read a source file's raw bytes, memoized per path, mtime and size.
+
+    Git and sproc modes scan the same consumer files once per changed type or
+    referencing class; the stat here is much cheaper than the read it saves,
+    and an edited file replaces its stale entry. Files over 1 MiB bypass the
+    cache, and least recently used entries are dropped once the cache holds
+    more than 64 MiB. Raises OSError like Path.read_bytes.
+    """
+    global _byte_cache_total
+
+    st = file_path.stat()
+    if st.st_size > _MAX_CACHED_FILE_BYTES:
+        return file_path.read_bytes()
+
+    path_str = str(file_path)
+    entry = _byte_cache.get(path_str)
+    if entry is not None:
+        if entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            _byte_cache.move_to_end(path_str)
+            return entry[2]
+        del _byte_cache[path_str]
+        _byte_cache_total -= len(entry[2])
+
+    data = file_path.read_bytes()
+    _byte_cache[path_str] = (st.st_mtime_ns, st.st_size, data)
+    _byte_cache_total += len(data)
+    while _byte_cache_total > _BYTE_CACHE_BUDGET:
+        _, (_, _, evicted) = _byte_cache.popitem(last=False)
+        _byte_cache_total -= len(evicted)
+    return data
+
+
+def read_text_prefix(file_path: Path, max_chars: int) -> str:
+    """Read at most the first ``max_chars`` characters of a UTF-8 source file.
+
+    Only enough bytes for ``max_chars`` characters (four per character, the
+    UTF-8 maximum) are read and decoded, so callers that truncate anyway do
+    not pay for the rest of a large file. Raises OSError like Path.read_text.
+    """
+    with open(file_path, "rb") as f:
+        data = f.read(max_chars * 4)
+    return data.decode("utf-8", errors="ignore")[:max_chars]
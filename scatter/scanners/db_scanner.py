@@ -20,7 +20,7 @@ from typing import Dict, List, Optional, Set, Tuple
 
 from scatter.core.graph import DependencyEdge, DependencyGraph
 from scatter.core.models import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_WORKERS
-from scatter.core.parallel import find_files_with_pattern_parallel
+from scatter.core.parallel import extract_exclude_dirs, find_files_with_pattern_parallel
 
 DEFAULT_SPROC_PREFIXES: List[str] = ["sp_", "usp_"]
 
@@ -190,6 +190,9 @@ _SQL_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# Type declarations, for mapping a match offset to its enclosing class
+_TYPE_POSITION_PATTERN = re.compile(r"\b(?:class|struct|interface|enum|record)\s+(\w+)")
+
 # Connection string patterns in string literals
 _CONN_STRING_PATTERN = re.compile(
     r"""["'][^"']*(?:Data\s+Source|Server|Database)\s*=\s*([^;'"]+)""",
@@ -219,8 +222,7 @@ class _FileIndex:
 
         # Build class position table: [(char_offset, class_name), ...] sorted
         self._class_positions: List[Tuple[int, str]] = [
-            (m.start(), m.group(1))
-            for m in re.finditer(r"\b(?:class|struct|interface|enum|record)\s+(\w+)", content)
+            (m.start(), m.group(1)) for m in _TYPE_POSITION_PATTERN.finditer(content)
         ]
 
     def line_number(self, offset: int) -> int:
@@ -502,6 +504,10 @@ def _discover_project_cs_map(
     """
     import fnmatch
 
+    # Directory-name patterns (*/bin/*) are pruned from the walk itself; the
+    # fnmatch filters below still apply any path-specific patterns.
+    exclude_dirs = extract_exclude_dirs(exclude_patterns)
+
     # Find all .csproj files
     all_csproj = find_files_with_pattern_parallel(
         search_scope,
@@ -509,6 +515,7 @@ def _discover_project_cs_map(
         max_workers=max_workers,
         chunk_size=chunk_size,
         disable_multiprocessing=disable_multiprocessing,
+        exclude_dirs=exclude_dirs,
     )
     csproj_files = [
         p for p in all_csproj if not any(fnmatch.fnmatch(str(p), pat) for pat in exclude_patterns)
@@ -527,6 +534,7 @@ def _discover_project_cs_map(
         max_workers=max_workers,
         chunk_size=chunk_size,
         disable_multiprocessing=disable_multiprocessing,
+        exclude_dirs=exclude_dirs,
     )
     cs_files = [
         p for p in all_cs if not any(fnmatch.fnmatch(str(p), pat) for pat in exclude_patterns)
@@ -2,8 +2,78 @@
 
 import logging
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from scatter.scanners._helpers import nearest_project_file
+
+_MSBUILD_NS_URI = "{http://schemas.microsoft.com/developer/msbuild/2003}"
+_SUMMARY_TAGS = frozenset({"RootNamespace", "AssemblyName", "ProjectReference"})
+# Elements whose first text value parse_csproj reports
+_PARSE_TEXT_TAGS = frozenset(
+    {"RootNamespace", "AssemblyName", "TargetFramework", "TargetFrameworkVersion", "OutputType"}
+)
+
+
+class CsprojSummary(NamedTuple):
+    """The few .csproj fields needed for namespace derivation and reference checks.
+
+    Each field prefers MSBuild-namespaced elements (legacy projects) and falls
+    back to un-namespaced ones (SDK-style), mirroring the lookups previously
+    done with ``root.find``/``root.findall``.
+    """
+
+    root_namespace: Optional[str]  # text of the first <RootNamespace>, stripped
+    assembly_name: Optional[str]  # text of the first <AssemblyName>, stripped
+    project_references: Tuple[str, ...]  # <ProjectReference Include>, "/"-normalized
+
+
+def read_csproj_summary(csproj_path: Path) -> CsprojSummary:
+    """Extract RootNamespace, AssemblyName and ProjectReference includes in one pass.
+
+    Uses ``ET.iterparse`` and clears each element once handled, so the full
+    document tree is never kept in memory. Results are cached per
+    (path, mtime), so derive_namespace and the ProjectReference check share
+    one parse of each file and an edited file is re-read. Raises
+    ET.ParseError or OSError.
+    """
+    return _read_csproj_summary_cached(str(csproj_path), csproj_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _read_csproj_summary_cached(csproj_path: str, mtime_ns: int) -> CsprojSummary:
+    first_text: Dict[Tuple[str, bool], Optional[str]] = {}
+    refs: Dict[bool, List[str]] = {True: [], False: []}
+
+    for _event, elem in ET.iterparse(csproj_path, events=("end",)):
+        tag = elem.tag
+        if tag.startswith(_MSBUILD_NS_URI):
+            tag, is_msb = tag[len(_MSBUILD_NS_URI) :], True
+        elif tag.startswith("{"):
+            elem.clear()
+            continue
+        else:
+            is_msb = False
+
+        if tag in _SUMMARY_TAGS:
+            if tag == "ProjectReference":
+                include = elem.get("Include")
+                if include:
+                    refs[is_msb].append(include.replace("\\", "/"))
+            elif (tag, is_msb) not in first_text:
+                first_text[(tag, is_msb)] = elem.text
+        elem.clear()
+
+    def _first(tag: str) -> Optional[str]:
+        text = first_text.get((tag, True), first_text.get((tag, False)))
+        return text.strip() if text else None
+
+    return CsprojSummary(
+        root_namespace=_first("RootNamespace"),
+        assembly_name=_first("AssemblyName"),
+        project_references=tuple(refs[True] or refs[False]),
+    )
 
 
 def find_project_file_on_disk(cs_file_abs_path: Path) -> Optional[Path]:
@@ -12,34 +82,15 @@ def find_project_file_on_disk(cs_file_abs_path: Path) -> Optional[Path]:
     in the directory tree from the C# file's location.
     Returns the absolute path to the first .csproj found, or None.
     """
-    logging.debug(f"Attempting to find project on disk for: {cs_file_abs_path}")
-    current_path = cs_file_abs_path.parent
-    while True:
-        try:
-            csproj_files = list(current_path.glob("*.csproj"))
-            if csproj_files:
-                project_file = csproj_files[0].resolve()
-                logging.debug(
-                    f"Found project file '{project_file.name}' in '{current_path}' for C# file '{cs_file_abs_path.name}'"
-                )
-                return project_file
-        except Exception as e:
-            logging.warning(
-                f"Error searching for .csproj in '{current_path}' for '{cs_file_abs_path.name}': {e}"
-            )
-            return None
-
-        if current_path == current_path.parent:
-            logging.debug(
-                f"Reached filesystem root without finding .csproj for '{cs_file_abs_path.name}'"
-            )
-            break
-        current_path = current_path.parent
-
-    logging.warning(
-        f"No .csproj file found upwards from C# file '{cs_file_abs_path.name}' in its directory tree."
-    )
-    return None
+    logging.debug("Attempting to find project on disk for: %s", cs_file_abs_path)
+    project_file = nearest_project_file(cs_file_abs_path.parent)
+    if project_file is None:
+        logging.warning(
+            f"No .csproj file found upwards from C# file '{cs_file_abs_path.name}' in its directory tree."
+        )
+        return None
+    logging.debug("Found project file '%s' for C# file '%s'", project_file, cs_file_abs_path.name)
+    return Path(project_file)
 
 
 def derive_namespace(csproj_path: Path) -> Optional[str]:
@@ -47,35 +98,29 @@ def derive_namespace(csproj_path: Path) -> Optional[str]:
     Attempts to derive the primary namespace from a .csproj file.
     checks <RootNamespace>, then <AssemblyName> or falls back to filename stem.
     """
-    if not csproj_path.is_file():
-        logging.error(f"Target project file not found for namespace derivation: {csproj_path}")
-        return None
     try:
-        namespaces = {"msb": "http://schemas.microsoft.com/developer/msbuild/2003"}
-        tree = ET.parse(csproj_path)
-        root = tree.getroot()
+        # The summary's own (cached) stat doubles as the existence check
+        summary = read_csproj_summary(csproj_path)
 
         tags_to_check = ["RootNamespace", "AssemblyName"]
 
-        for tag in tags_to_check:
-            xpath_query = f".//msb:{tag}"
-            elem = root.find(xpath_query, namespaces)
-            if elem is None:
-                elem = root.find(f".//{tag}")
-
-            if elem is not None and elem.text:
-                namespace_value = elem.text.strip()
-                if namespace_value:
-                    logging.debug(
-                        f"Derived namespace '{namespace_value}' from <{tag}> in {csproj_path.name}"
-                    )
-                    return namespace_value
+        for tag, namespace_value in zip(
+            tags_to_check, (summary.root_namespace, summary.assembly_name)
+        ):
+            if namespace_value:
+                logging.debug(
+                    "Derived namespace '%s' from <%s> in %s", namespace_value, tag, csproj_path.name
+                )
+                return namespace_value
 
         logging.warning(
             f"<{'> or <'.join(tags_to_check)}> tags not found or empty in {csproj_path.name}. Falling back to filename stem '{csproj_path.stem}' as namespace."
         )
         return csproj_path.stem
 
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        logging.error(f"Target project file not found for namespace derivation: {csproj_path}")
+        return None
     except ET.ParseError as e:
         logging.error(f"Failed to parse XML for namespace derivation in {csproj_path}: {e}")
         return None
@@ -111,39 +156,49 @@ def parse_csproj(
         logging.warning(f"Could not parse {csproj_path}: {e}")
         return None
 
-    msb_ns = {"msb": "http://schemas.microsoft.com/developer/msbuild/2003"}
-    msb_ns_uri = "{http://schemas.microsoft.com/developer/msbuild/2003}"
+    msb_ns_uri = _MSBUILD_NS_URI
 
     # Detect project style: SDK-style has Sdk attribute on <Project> element
     project_style = "sdk" if root.get("Sdk") else "framework"
 
+    # One walk over the tree collects everything below. Each lookup keeps the
+    # old root.find/findall precedence: un-namespaced elements win, and the
+    # MSBuild-namespaced ones are the fallback.
+    first_elem: Dict[Tuple[str, bool], ET.Element] = {}
+    refs_by_ns: Dict[bool, List[str]] = {False: [], True: []}
+    imports_by_ns: Dict[bool, List[ET.Element]] = {False: [], True: []}
+    for elem in root.iter():
+        tag = elem.tag
+        if elem is root or not isinstance(tag, str):
+            continue
+        namespaced = tag.startswith(msb_ns_uri)
+        local = tag[len(msb_ns_uri) :] if namespaced else tag
+        if local == "ProjectReference":
+            include = elem.get("Include")
+            if include:
+                refs_by_ns[namespaced].append(include.replace("\\", "/"))
+        elif local == "Import":
+            imports_by_ns[namespaced].append(elem)
+        elif local in _PARSE_TEXT_TAGS:
+            first_elem.setdefault((local, namespaced), elem)
+
     def _find_text(tag: str) -> Optional[str]:
-        """Find element text, trying without and with MSBuild namespace."""
-        elem = root.find(f".//{tag}")
+        """First element's text, preferring the un-namespaced element."""
+        elem = first_elem.get((tag, False))
         if elem is None:
-            elem = root.find(f".//msb:{tag}", msb_ns)
+            elem = first_elem.get((tag, True))
         if elem is not None and elem.text:
             return elem.text.strip()
         return None
 
-    # Extract ProjectReferences
-    refs: List[str] = []
-    for ref in root.findall(".//ProjectReference"):
-        include = ref.get("Include")
-        if include:
-            refs.append(include.replace("\\", "/"))
-    if not refs:
-        for ref in root.findall(".//msb:ProjectReference", msb_ns):
-            include = ref.get("Include")
-            if include:
-                refs.append(include.replace("\\", "/"))
+    refs = refs_by_ns[False] or refs_by_ns[True]
 
     # Extract explicit <Import> elements (same XML tree, no re-parse)
     explicit_imports: List[Path] = []
     if search_scope is not None:
         try:
             explicit_imports = _extract_explicit_imports(
-                root, msb_ns_uri, csproj_path, search_scope
+                imports_by_ns[False] + imports_by_ns[True], csproj_path, search_scope
             )
         except Exception as e:
             logging.warning(
@@ -182,14 +237,12 @@ _DIRECTORY_BUILD_NAMES = frozenset({"Directory.Build.props", "Directory.Build.ta
 
 
 def _extract_explicit_imports(
-    root: ET.Element, msb_ns_uri: str, csproj_path: Path, search_scope: Path
+    import_elems: List[ET.Element], csproj_path: Path, search_scope: Path
 ) -> List[Path]:
-    """Extract <Import Project="..."> elements from an already-parsed XML tree."""
+    """Resolve local .props/.targets paths from already-parsed <Import> elements."""
     imports: List[Path] = []
 
-    for import_elem in list(root.findall(".//Import")) + list(
-        root.findall(f".//{msb_ns_uri}Import")
-    ):
+    for import_elem in import_elems:
         project_attr = import_elem.get("Project", "")
         if not project_attr or any(m in project_attr for m in _SYSTEM_IMPORT_MARKERS):
             continue
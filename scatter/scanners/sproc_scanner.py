@@ -3,6 +3,7 @@
 import logging
 import re
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Set
 
@@ -12,7 +13,20 @@ from scatter.core.parallel import (
     analyze_cs_files_parallel,
     map_cs_to_projects_parallel,
 )
-from scatter.scanners.type_scanner import find_enclosing_type_name
+
+
+@lru_cache(maxsize=256)
+def _compile_sproc_pattern(pattern_str: str, as_bytes: bool) -> "re.Pattern":
+    """Compile a sproc search pattern once per distinct pattern string.
+
+    The built-in pattern for an ASCII sproc name is compiled as bytes, so
+    workers scan raw file contents without decoding them. Anything else is
+    compiled as str, keeping Unicode ``\\w``/``\\s``/``\\b`` and case folding
+    for user patterns; workers decode the file before matching those.
+    """
+    if as_bytes:
+        return re.compile(pattern_str.encode(), re.IGNORECASE)
+    return re.compile(pattern_str, re.IGNORECASE)
 
 
 def find_cs_files_referencing_sproc(
@@ -23,10 +37,12 @@ def find_cs_files_referencing_sproc(
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     disable_multiprocessing: bool = False,
     cs_analysis_chunk_size: int = 50,
+    exclude_dirs: Optional[Set[str]] = None,
 ) -> Dict[Path, Dict[str, Set[Path]]]:
     """
     Scans all .cs files within the search_path for the given stored procedure name
-    and identifies the containing class.
+    and identifies the containing class. Directories named in exclude_dirs
+    (build output such as bin/obj) are not walked.
     """
     projects_classes_sproc_refs: Dict[Path, Dict[str, Set[Path]]] = defaultdict(
         lambda: defaultdict(set)
@@ -49,9 +65,11 @@ def find_cs_files_referencing_sproc(
             r'["\'](?:[a-zA-Z_][a-zA-Z0-9_]*\.)?' + escaped_base_sproc_name + r'["\']'
         )
 
+    # Only the built-in pattern is known to mean the same in bytes and str
+    scan_bytes = sproc_pattern_str.isascii() and not custom_sproc_regex_pattern
     try:
-        sproc_pattern = re.compile(sproc_pattern_str, re.IGNORECASE)
-        logging.debug(f"Using sproc search pattern: {sproc_pattern.pattern}")
+        sproc_pattern = _compile_sproc_pattern(sproc_pattern_str, scan_bytes)
+        logging.debug(f"Using sproc search pattern: {sproc_pattern_str}")
     except re.error as e:
         logging.error(
             f"Invalid regex pattern for sproc search ('{sproc_pattern_str}'): {e}. Aborting sproc search."
@@ -65,6 +83,7 @@ def find_cs_files_referencing_sproc(
             max_workers=max_workers,
             chunk_size=chunk_size,
             disable_multiprocessing=disable_multiprocessing,
+            exclude_dirs=exclude_dirs,
         )
     except OSError as e:
         logging.error(f"Error scanning for .cs files in '{search_path}': {e}")
@@ -82,6 +101,10 @@ def find_cs_files_referencing_sproc(
             "analysis_type": "sproc",
             "sproc_name": sproc_name_input,
             "sproc_pattern": sproc_pattern,
+            # bytes.lower() only folds ASCII, so only bytes scans prefilter
+            "sproc_literal": base_sproc_name.lower().encode() if scan_bytes else None,
+            # Resolve the enclosing class in the worker, while the file is in memory
+            "find_enclosing_type": True,
         }
 
         analysis_results = analyze_cs_files_parallel(
@@ -121,9 +144,14 @@ def find_cs_files_referencing_sproc(
                     continue
 
                 files_with_ref_count += 1
-                logging.debug(
-                    f"  Potential reference(s) to sproc '{sproc_name_input}' found in: {cs_file_abs.relative_to(search_path) if search_path in cs_file_abs.parents else cs_file_abs.name}"
-                )
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug(
+                        "  Potential reference(s) to sproc '%s' found in: %s",
+                        sproc_name_input,
+                        cs_file_abs.relative_to(search_path)
+                        if search_path in cs_file_abs.parents
+                        else cs_file_abs.name,
+                    )
 
                 csproj_str = cs_to_csproj_map.get(str(cs_file_abs))
                 if not csproj_str:
@@ -139,8 +167,7 @@ def find_cs_files_referencing_sproc(
                 if matches:
                     first_match_index = matches[0][1] if isinstance(matches[0], tuple) else 0
 
-                    content = cs_file_abs.read_text(encoding="utf-8", errors="ignore")
-                    enclosing_class = find_enclosing_type_name(content, first_match_index)
+                    enclosing_class = file_result.get("enclosing_type")
 
                     if enclosing_class:
                         is_new_class_for_project = (
@@ -156,7 +183,10 @@ def find_cs_files_referencing_sproc(
                             classes_found_count += 1
 
                         logging.debug(
-                            f"    Mapped sproc ref in '{cs_file_abs.name}' to Project '{project_file_abs.name}' and Class '{enclosing_class}'"
+                            "    Mapped sproc ref in '%s' to Project '%s' and Class '%s'",
+                            cs_file_abs.name,
+                            project_file_abs.name,
+                            enclosing_class,
                         )
                     else:
                         logging.warning(
@@ -35,6 +35,9 @@ _CREATE_PROC_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# Whitespace a regex capture may leave around the schema/name dot
+_DOT_SPACING_PATTERN = re.compile(r"\s*\.\s*")
+
 
 def normalize_sproc_name(raw_name: str) -> str:
     """Normalize a sproc name: strip brackets, lowercase schema, preserve name.
@@ -50,8 +53,7 @@ def normalize_sproc_name(raw_name: str) -> str:
     teams use casing as a convention signal.
     """
     name = raw_name.strip().replace("[", "").replace("]", "")
-    # Strip whitespace that regex capture may leave around the dot
-    name = re.sub(r"\s*\.\s*", ".", name)
+    name = _DOT_SPACING_PATTERN.sub(".", name)
     parts = name.split(".", 1)
     if len(parts) == 2:
         schema, proc = parts
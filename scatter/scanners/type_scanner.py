@@ -6,6 +6,21 @@ from typing import List, Optional, Set, Tuple
 
 from scatter.core.models import DELEGATE_DECLARATION_PATTERN, TYPE_DECLARATION_PATTERN
 
+# Literal keywords the declaration patterns require. A substring check is far
+# cheaper than running the multiline patterns, so files without any of them
+# skip the regex entirely.
+_TYPE_KEYWORDS = ("class", "struct", "interface", "enum", "record")
+_DELEGATE_KEYWORD = "delegate"
+
+
+def _may_declare_types(content: str) -> bool:
+    return any(kw in content for kw in _TYPE_KEYWORDS)
+
+
+def _base_type_name(type_name_full: str) -> str:
+    """Strip generic parameters and anything after a comma from a captured name."""
+    return type_name_full.partition("<")[0].partition(",")[0].strip()
+
 
 def extract_type_declarations_with_kind(content: str) -> List[Tuple[str, str]]:
     """Extract (type_name, kind) pairs from C# content.
@@ -15,15 +30,17 @@ def extract_type_declarations_with_kind(content: str) -> List[Tuple[str, str]]:
     results: List[Tuple[str, str]] = []
     seen: Set[str] = set()
     try:
-        for match in TYPE_DECLARATION_PATTERN.finditer(content):
-            kind = match.group("keyword")
-            type_name_full = match.group("type_name").strip()
-            type_name_base = re.sub(r"<.*", "", type_name_full).strip()
-            type_name_base = type_name_base.split(",")[0].strip()
-            if type_name_base and type_name_base not in seen:
-                seen.add(type_name_base)
-                results.append((type_name_base, kind))
+        if _may_declare_types(content):
+            for match in TYPE_DECLARATION_PATTERN.finditer(content):
+                kind = match.group("keyword")
+                type_name_full = match.group("type_name").strip()
+                type_name_base = _base_type_name(type_name_full)
+                if type_name_base and type_name_base not in seen:
+                    seen.add(type_name_base)
+                    results.append((type_name_base, kind))
 
+        if _DELEGATE_KEYWORD not in content:
+            return results
         for match in DELEGATE_DECLARATION_PATTERN.finditer(content):
             type_name = match.group(1).strip()
             if type_name and type_name not in seen:
@@ -38,17 +55,21 @@ def extract_type_names_from_content(content: str) -> Set[str]:
     """
     extracts declared type names (class, struct, interface, enum) from c# file content.
     """
-    found_types = set()
+    found_types: Set[str] = set()
+    patterns = []
+    if _may_declare_types(content):
+        patterns.append(TYPE_DECLARATION_PATTERN)
+    if _DELEGATE_KEYWORD in content:
+        patterns.append(DELEGATE_DECLARATION_PATTERN)
     try:
-        for pattern in (TYPE_DECLARATION_PATTERN, DELEGATE_DECLARATION_PATTERN):
+        for pattern in patterns:
             for match in pattern.finditer(content):
                 # Use named group for TYPE_DECLARATION_PATTERN, positional for DELEGATE
                 try:
                     type_name_full = match.group("type_name").strip()
                 except IndexError:
                     type_name_full = match.group(1).strip()
-                type_name_base = re.sub(r"<.*", "", type_name_full).strip()
-                type_name_base = type_name_base.split(",")[0].strip()
+                type_name_base = _base_type_name(type_name_full)
                 if type_name_base:
                     found_types.add(type_name_base)
     except Exception as e:
@@ -56,39 +77,33 @@ def extract_type_names_from_content(content: str) -> Set[str]:
     return found_types
 
 
+# Type declaration at the start of a line. The name group stops at the
+# identifier: generic parameters, base lists and constraints never need to be
+# consumed, and keeping whitespace out of the name class leaves the engine
+# nothing to backtrack through.
+_ENCLOSING_TYPE_PATTERN = re.compile(
+    r"^\s*(?:(?:public|internal|private|protected)\s+)?(?:(?:static|abstract|sealed|partial|record|readonly|ref)\s+)*"
+    r"(class|struct|interface|enum|record)\s+([A-Za-z_][A-Za-z0-9_]*)",
+    re.MULTILINE,
+)
+
+
 def find_enclosing_type_name(content: str, match_start_index: int) -> Optional[str]:
     """
     Tries to find the name of the immediately enclosing type (class, struct, interface, enum)
     for a given position within the code content by searching backwards using regex.
     """
-    enclosing_type_pattern = re.compile(
-        r"^\s*(?:(?:public|internal|private|protected)\s+)?(?:(?:static|abstract|sealed|partial|record|readonly|ref)\s+)*"
-        r"(class|struct|interface|enum|record)\s+([A-Za-z_][A-Za-z0-9_<>,\s]*)",
-        re.MULTILINE,
-    )
-
     last_found_type_name: Optional[str] = None
-    last_match_start = -1
 
     try:
-        for match in enclosing_type_pattern.finditer(content, 0, match_start_index):
-            if match.start() > last_match_start:
-                last_match_start = match.start()
-                type_name_full = match.group(2).strip()
-                type_name_base = re.sub(r"<.*", "", type_name_full).strip()
-                type_name_base = type_name_base.split(",")[0].strip()
-                if type_name_base:
-                    last_found_type_name = type_name_base
-                    logging.debug(
-                        f"  Found potential enclosing type '{last_found_type_name}' at index {match.start()} before index {match_start_index}"
-                    )
-
+        for match in _ENCLOSING_TYPE_PATTERN.finditer(content, 0, match_start_index):
+            last_found_type_name = match.group(2)
     except Exception as e:
         logging.warning(f"Regex error during enclosing type search: {e}")
         return None
 
     if last_found_type_name:
-        logging.debug(f"  Determined closest enclosing type name: {last_found_type_name}")
+        logging.debug("  Determined closest enclosing type name: %s", last_found_type_name)
         return last_found_type_name
     else:
         logging.warning(f"  Could not determine enclosing type name near index {match_start_index}")
@@ -0,0 +1,119 @@
+"""Persistent cache of AI file summaries keyed by prompt content hash.
+
+Summaries live in {search_scope}/.scatter/summary_cache.json next to the
+graph cache. Keys hash the provider name and model together with the full
+prompt, which embeds the (truncated) file content, file name and prompt
+template — so an edited file, a changed template or a different provider or
+model all miss naturally, while unchanged files are never re-sent across runs.
+Entries are kept least-recently-used first and trimmed to MAX_ENTRIES on save,
+so summaries of files long since edited or deleted do not pile up forever.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from itertools import islice
+from typing import Dict, Optional
+
+CACHE_VERSION = 2
+MAX_ENTRIES = 10_000
+
+
+def get_summary_cache_path(search_scope: Path) -> Path:
+    """Return default cache location: {search_scope}/.scatter/summary_cache.json"""
+    return search_scope / ".scatter" / "summary_cache.json"
+
+
+def summary_cache_key(provider_name: str, model_name: str, prompt: str) -> str:
+    """SHA-256 over provider name, model identifier and prompt text."""
+    digest = hashlib.sha256(provider_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(model_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SummaryCache:
+    """In-memory view of the on-disk summary cache. Never raises on I/O errors."""
+
+    def __init__(self, path: Path, entries: Optional[Dict[str, str]] = None) -> None:
+        self.path = path
+        self.entries: Dict[str, str] = entries or {}
+        self._dirty = False
+        self._used: Dict[str, None] = {}  # keys read or written since the last save, in order
+
+    @classmethod
+    def load(cls, path: Path) -> "SummaryCache":
+        """Load the cache, starting empty if the file is missing, corrupt or outdated."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                envelope = json.load(f)
+            if envelope.get("version") == CACHE_VERSION and isinstance(
+                envelope.get("summaries"), dict
+            ):
+                return cls(path, envelope["summaries"])
+            logging.debug(f"Ignoring summary cache with unexpected format: {path}")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read summary cache {path}: {e}")
+        return cls(path)
+
+    def get(self, key: str) -> Optional[str]:
+        summary = self.entries.get(key)
+        if summary is not None:
+            self._used[key] = None
+        return summary
+
+    def put(self, key: str, summary: str) -> None:
+        self._used[key] = None
+        if self.entries.get(key) != summary:
+            self.entries[key] = summary
+            self._dirty = True
+
+    def _refresh_recency(self) -> None:
+        """Move entries used since the last save to the end and drop the oldest overflow."""
+        used = [key for key in self._used if key in self.entries]
+        if used and list(self.entries)[-len(used) :] != used:
+            for key in used:
+                self.entries[key] = self.entries.pop(key)
+            self._dirty = True
+        self._used.clear()
+        excess = len(self.entries) - MAX_ENTRIES
+        if excess > 0:
+            for key in list(islice(self.entries, excess)):
+                del self.entries[key]
+            self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the cache if anything changed, evicting the least recently used."""
+        self._refresh_recency()
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=str(self.path.parent), suffix=".tmp", prefix="summary_cache_"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(
+                        {"version": CACHE_VERSION, "summaries": self.entries},
+                        f,
+                        separators=(",", ":"),
+                    )
+                os.replace(tmp_path, str(self.path))
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            self._dirty = False
+            logging.debug(f"Summary cache saved: {len(self.entries)} entries → {self.path}")
+        except OSError as e:
+            logging.warning(f"Could not write summary cache {self.path}: {e}")
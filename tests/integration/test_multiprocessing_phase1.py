@@ -125,6 +125,169 @@ class TestMultiprocessingPhase1(unittest.TestCase):
         chunks = scatter.chunk_list([], 5)
         self.assertEqual(chunks, [])
 
+    def test_sequential_discovery_matches_rglob(self):
+        """scandir-based discovery returns the same files, in the same order, as rglob."""
+        for pattern in ("*.csproj", "*.cs"):
+            discovered = scatter.find_files_with_pattern_parallel(
+                self.test_root, pattern, disable_multiprocessing=True
+            )
+            self.assertEqual(discovered, list(self.test_root.rglob(pattern)))
+
+    def test_suffix_fast_path_folds_case_like_fnmatch(self):
+        """'*.ext' matching agrees with fnmatch on upper-case extensions, per platform."""
+        import ntpath
+        import tempfile
+        from unittest.mock import patch
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for name in ("Lower.cs", "Upper.CS", "App.CSPROJ"):
+                (root / name).write_text("", encoding="utf-8")
+
+            def discover(pattern):
+                return sorted(
+                    p.name
+                    for p in scatter.find_files_with_pattern_parallel(
+                        root, pattern, disable_multiprocessing=True
+                    )
+                )
+
+            # "*.[c]s" has no plain suffix, so it takes the fnmatch path
+            self.assertEqual(discover("*.cs"), discover("*.[c]s"))
+            # Simulate Windows, where normcase folds case
+            with patch("os.path.normcase", ntpath.normcase):
+                self.assertEqual(discover("*.cs"), ["Lower.cs", "Upper.CS"])
+                self.assertEqual(discover("*.cs"), discover("*.[c]s"))
+                self.assertEqual(discover("*.csproj"), ["App.CSPROJ"])
+
+    def test_discovery_prunes_excluded_directories(self):
+        """Directories named in exclude_dirs are skipped in both discovery paths."""
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for rel in ("App/Service.cs", "App/obj/Debug/Generated.cs", "bin/Stale.cs"):
+                (root / rel).parent.mkdir(parents=True, exist_ok=True)
+                (root / rel).write_text("class C {}", encoding="utf-8")
+
+            sequential = scatter.find_files_with_pattern_parallel(
+                root, "*.cs", disable_multiprocessing=True, exclude_dirs={"bin", "obj"}
+            )
+            parallel = scatter.find_files_with_pattern_parallel(
+                root, "*.cs", max_workers=2, parallel_threshold=0, exclude_dirs={"bin", "obj"}
+            )
+
+        self.assertEqual(sequential, [root / "App" / "Service.cs"])
+        self.assertEqual(parallel, sequential)
+
+    def test_find_files_in_directories_threaded(self):
+        """Threaded per-directory listing matches a sequential walk and dedupes dirs."""
+        from scatter.core.parallel import find_files_in_directories
+
+        dirs = [self.consumer1_project.parent, self.consumer2_project.parent]
+        threaded = find_files_in_directories(dirs + dirs[:1], "*.cs", max_workers=2)
+        sequential = find_files_in_directories(dirs, "*.cs", disable_multiprocessing=True)
+        self.assertEqual(list(threaded), dirs)
+        self.assertEqual(threaded, sequential)
+        for d in dirs:
+            self.assertEqual(threaded[d], list(d.rglob("*.cs")))
+
+    def test_find_files_in_directories_warns_on_unlistable_dir(self):
+        """A directory that cannot be listed is logged at warning level, threaded or not."""
+        from scatter.core.parallel import find_files_in_directories
+
+        missing = self.test_root / "NoSuchConsumer"
+        dirs = [self.consumer1_project.parent, missing]
+        for disable in (False, True):
+            with self.assertLogs(level="WARNING") as logs:
+                found = find_files_in_directories(
+                    dirs, "*.cs", max_workers=2, disable_multiprocessing=disable
+                )
+            self.assertEqual(found[missing], [])
+            self.assertTrue(found[dirs[0]])
+            self.assertTrue(any(str(missing) in line for line in logs.output))
+
+    def test_type_extraction_parallel_matches_sequential(self):
+        """'types' batch analysis agrees with direct extraction, in both modes."""
+        from scatter.core.parallel import analyze_cs_files_parallel
+        from scatter.scanners.type_scanner import extract_type_names_from_content
+
+        cs_files = list((self.test_root / "GalaxyWorks.Data").rglob("*.cs"))
+        parallel = analyze_cs_files_parallel(
+            cs_files, {"analysis_type": "types"}, max_workers=2, cs_analysis_chunk_size=1
+        )
+        sequential = analyze_cs_files_parallel(
+            cs_files, {"analysis_type": "types"}, disable_multiprocessing=True
+        )
+        self.assertEqual(parallel, sequential)
+        for cs_file in cs_files:
+            expected = extract_type_names_from_content(cs_file.read_text(encoding="utf-8"))
+            self.assertEqual(set(parallel[cs_file]["matches"]), expected)
+
+    def test_analysis_pool_reused_across_calls(self):
+        """Repeated parallel scans share one worker pool instead of spawning anew."""
+        from scatter.core import parallel
+
+        cs_files = list((self.test_root / "GalaxyWorks.Data").rglob("*.cs"))
+        config = {"analysis_type": "types"}
+        parallel.analyze_cs_files_parallel(
+            cs_files, config, max_workers=2, cs_analysis_chunk_size=1
+        )
+        pool = parallel._cs_analysis_executor
+        parallel.analyze_cs_files_parallel(
+            cs_files, config, max_workers=2, cs_analysis_chunk_size=1
+        )
+        self.assertIs(parallel._cs_analysis_executor, pool)
+
+    def test_analysis_pool_sized_to_max_workers(self):
+        """Small scans throttle in-flight chunks instead of adding smaller pools."""
+        from unittest.mock import patch
+
+        from scatter.core import parallel
+
+        cs_files = list((self.test_root / "GalaxyWorks.Data").rglob("*.cs"))
+        config = {"analysis_type": "types"}
+        parallel.analyze_cs_files_parallel(
+            cs_files, config, max_workers=6, cs_analysis_chunk_size=1
+        )
+        pool = parallel._cs_analysis_executor
+        self.assertEqual(parallel._cs_analysis_workers, 6)
+
+        # Fewer than 200 files scales to 4 workers, but keeps the same pool.
+        in_flight = []
+        real_submit = pool.submit
+
+        def counting_submit(*args, **kwargs):
+            future = real_submit(*args, **kwargs)
+            in_flight.append(future)
+            busy = sum(1 for f in in_flight if not f.done())
+            self.assertLessEqual(busy, 4)
+            return future
+
+        with patch.object(pool, "submit", side_effect=counting_submit):
+            result = parallel.analyze_cs_files_parallel(
+                cs_files, config, max_workers=6, cs_analysis_chunk_size=1
+            )
+        self.assertIs(parallel._cs_analysis_executor, pool)
+        self.assertEqual(len(result), len(cs_files))
+
+    def test_byte_cache_stays_within_budget(self):
+        """Least recently used file bytes are dropped once the byte budget is exceeded."""
+        import tempfile
+        from unittest.mock import patch
+
+        from scatter.scanners import _helpers
+
+        with tempfile.TemporaryDirectory() as tmp, patch.object(_helpers, "_BYTE_CACHE_BUDGET", 25):
+            files = [Path(tmp) / f"F{i}.cs" for i in range(3)]
+            for f in files:
+                f.write_bytes(b"x" * 10)
+                self.assertEqual(_helpers.read_bytes_cached(f), b"x" * 10)
+
+            self.assertNotIn(str(files[0]), _helpers._byte_cache)
+            self.assertIn(str(files[2]), _helpers._byte_cache)
+            self.assertLessEqual(_helpers._byte_cache_total, 25)
+
     def test_error_handling_in_worker_function(self):
         """Test error handling in the worker function."""
 
@@ -225,6 +388,130 @@ class TestTargetSymbolSearch(unittest.TestCase):
                         f"Should find same consumers for {class_name}",
                     )
 
+    def test_shared_listing_cache_skips_repeat_walks(self):
+        """A second target in the same run reuses the first run's file listings."""
+        from unittest.mock import patch
+
+        listing_cache = {}
+        first, _pipeline = scatter.find_consumers(
+            target_csproj_path=self.galaxy_works_project,
+            search_scope_path=self.test_root,
+            target_namespace="GalaxyWorks.Data",
+            class_name="PortalDataService",
+            method_name=None,
+            disable_multiprocessing=True,
+            listing_cache=listing_cache,
+        )
+        self.assertIn((self.test_root, "*.csproj"), listing_cache)
+
+        with (
+            patch(
+                "scatter.analyzers.consumer_analyzer.find_files_with_pattern_parallel",
+                side_effect=AssertionError("scope walked twice"),
+            ),
+            patch(
+                "scatter.analyzers.consumer_analyzer.find_files_in_directories",
+                side_effect=AssertionError("consumer dir walked twice"),
+            ),
+        ):
+            second, _pipeline = scatter.find_consumers(
+                target_csproj_path=self.galaxy_works_project,
+                search_scope_path=self.test_root,
+                target_namespace="GalaxyWorks.Data",
+                class_name="PortalConfiguration",
+                method_name=None,
+                disable_multiprocessing=True,
+                listing_cache=listing_cache,
+            )
+
+        self.assertIsInstance(second, list)
+        self.assertTrue(first)
+
+    def test_shared_listing_answers_later_targets_from_reference_index(self):
+        """From the second target on, ProjectReferences come from one reverse index."""
+        from unittest.mock import patch
+
+        from scatter.core.models import ReferenceIndex
+
+        reference_index = ReferenceIndex()
+        kwargs = dict(
+            target_csproj_path=self.galaxy_works_project,
+            search_scope_path=self.test_root,
+            target_namespace="GalaxyWorks.Data",
+            class_name=None,
+            method_name=None,
+            disable_multiprocessing=True,
+            listing_cache={},
+            reference_index=reference_index,
+        )
+        first, _pipeline = scatter.find_consumers(**kwargs)
+        self.assertEqual(reference_index.built, set())
+
+        with patch(
+            "scatter.analyzers.consumer_analyzer.parse_csproj_files_parallel",
+            side_effect=AssertionError("references re-parsed"),
+        ):
+            second, _pipeline = scatter.find_consumers(**kwargs)
+
+        self.assertTrue(first)
+        self.assertEqual(reference_index.built, {self.test_root})
+        self.assertEqual(
+            sorted(c["consumer_name"] for c in first),
+            sorted(c["consumer_name"] for c in second),
+        )
+
+    def test_reference_index_is_built_per_run(self):
+        """Each run indexes its own listing; nothing carries over from an earlier run."""
+        from unittest.mock import patch
+
+        from scatter.analyzers import consumer_analyzer
+        from scatter.core.models import ReferenceIndex
+
+        kwargs = dict(
+            target_csproj_path=self.galaxy_works_project,
+            search_scope_path=self.test_root,
+            target_namespace="GalaxyWorks.Data",
+            class_name=None,
+            method_name=None,
+            disable_multiprocessing=True,
+        )
+        earlier = ReferenceIndex()
+        for _ in range(2):
+            scatter.find_consumers(listing_cache={}, reference_index=earlier, **kwargs)
+        earlier_rows = {ref: list(users) for ref, users in earlier.referenced_by.items()}
+
+        listing_cache = {}
+        later = ReferenceIndex()
+        with patch.object(
+            consumer_analyzer,
+            "collect_project_references_parallel",
+            wraps=consumer_analyzer.collect_project_references_parallel,
+        ) as collect:
+            for _ in range(2):
+                scatter.find_consumers(listing_cache=listing_cache, reference_index=later, **kwargs)
+
+        collect.assert_called_once()
+        self.assertIs(collect.call_args.args[0], listing_cache[(self.test_root, "*.csproj")])
+        self.assertEqual(later.referenced_by, earlier_rows)
+        self.assertEqual(earlier.referenced_by, earlier_rows)
+
+    def test_reference_collection_parallel_matches_sequential(self):
+        """The worker pool reads the same resolved ProjectReferences as one batch."""
+        from scatter.core.parallel import (
+            collect_project_references_batch,
+            collect_project_references_parallel,
+        )
+
+        csproj_files = sorted(p.resolve() for p in self.test_root.rglob("*.csproj"))
+        parallel = collect_project_references_parallel(
+            csproj_files, max_workers=2, csproj_analysis_chunk_size=1
+        )
+        self.assertEqual(parallel, collect_project_references_batch((csproj_files,)))
+        consumer = str(
+            (self.test_root / "MyGalaxyConsumerApp" / "MyGalaxyConsumerApp.csproj").resolve()
+        )
+        self.assertIn(str(self.galaxy_works_project.resolve()), parallel[consumer])
+
 
 class TestBackwardsCompatibility(unittest.TestCase):
     """Test that the multiprocessing implementation maintains backwards compatibility."""
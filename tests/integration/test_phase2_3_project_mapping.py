@@ -156,6 +156,17 @@ class TestMapCsToProjectsBatch(unittest.TestCase):
         self.assertIsNotNone(mapped)
         self.assertTrue(mapped.endswith(".csproj"))
 
+    def test_walked_directories_reused_across_batches(self):
+        """A later batch resolves already-walked directories without rescanning them."""
+        first = scatter.map_cs_to_projects_batch(([str(self.cs_a3)],))
+
+        with patch("os.scandir", side_effect=AssertionError("directory re-scanned")):
+            second = scatter.map_cs_to_projects_batch(([str(self.cs_a1), str(self.cs_a2)],))
+
+        resolved = str(self.proj_a_csproj.resolve())
+        self.assertEqual(first[str(self.cs_a3)], resolved)
+        self.assertEqual(second, {str(self.cs_a1): resolved, str(self.cs_a2): resolved})
+
 
 class TestMapCsToProjectsParallel(unittest.TestCase):
     """Tests for the map_cs_to_projects_parallel orchestrator."""
@@ -236,3 +236,15 @@ class TestLoadPipelineCsvMerge:
 
         result = load_pipeline_csv(old_csv)
         assert result["MyApp"] == "my-pipeline"
+
+    def test_blank_and_short_rows_skipped(self, tmp_path):
+        csv_path = tmp_path / "pipeline_to_app_mapping.csv"
+        csv_path.write_text(
+            "pipeline_name,app_name,assembly_name,source\n"
+            "\n"
+            "pipeline-x\n"
+            "pipeline-y,AppY,,host_json\n"
+        )
+        from scatter.modes.setup import load_pipeline_csv
+
+        assert load_pipeline_csv(csv_path) == {"AppY": "pipeline-y"}
@@ -212,6 +212,13 @@ class TestCLIIntegration:
         args = parser.parse_args(["--graph", "--search-scope", "."])
         assert args.max_ai_calls is None
 
+    def test_summarize_workers_flag_parses(self):
+        from scatter.cli_parser import build_parser
+
+        parser = build_parser()
+        args = parser.parse_args(["--graph", "--search-scope", ".", "--summarize-workers", "3"])
+        assert args.summarize_workers == 3
+
     def test_config_loads_max_ai_calls_from_yaml(self, tmp_path):
         yaml_content = "ai:\n  max_ai_calls: 42\n"
         config_file = tmp_path / ".scatter.yaml"
@@ -38,6 +38,9 @@ def _fake_args(**overrides):
         cs_analysis_chunk_size=50,
         csproj_analysis_chunk_size=25,
         summarize_consumers=False,
+        summarize_workers=8,
+        no_summary_cache=False,
+        max_summarize_bytes=200_000,
         gemini_model=None,
         enable_hybrid_git=False,
         app_config_path=None,
@@ -8,11 +8,28 @@ import pytest
 from scatter.analysis import (
     ModeResult,
     _apply_graph_enrichment,
+    _rel_posix,
     run_git_analysis,
     run_target_analysis,
     run_sproc_analysis,
 )
 from scatter.analyzers.git_analyzer import BranchChanges
+from scatter.core.models import (
+    STAGE_CLASS,
+    STAGE_NAMESPACE,
+    FilterPipeline,
+    FilterStage,
+)
+
+
+def _namespace_pipeline(passed: int) -> FilterPipeline:
+    """Pipeline as returned by a class-less find_consumers() call."""
+    return FilterPipeline(
+        search_scope="/tmp/scope",
+        total_projects_scanned=5,
+        total_files_scanned=10,
+        stages=[FilterStage(name=STAGE_NAMESPACE, input_count=3, output_count=passed)],
+    )
 
 
 class TestModeResult:
@@ -23,6 +40,17 @@ class TestModeResult:
         assert r.graph_enriched is False
 
 
+class TestRelPosix:
+    def test_path_under_base(self):
+        assert _rel_posix(Path("/scope/App/App.csproj"), Path("/scope")) == "App/App.csproj"
+
+    def test_sibling_with_shared_prefix_is_not_relative(self):
+        assert _rel_posix(Path("/scope2/App.csproj"), Path("/scope")) == "/scope2/App.csproj"
+
+    def test_root_base(self):
+        assert _rel_posix(Path("/App/App.csproj"), Path("/")) == "App/App.csproj"
+
+
 class TestRunTargetAnalysis:
     @patch("scatter.analyzers.consumer_analyzer.find_consumers")
     @patch("scatter.scanners.project_scanner.derive_namespace", return_value="GalaxyWorks.Data")
@@ -122,7 +150,7 @@ class TestRunSprocAnalysis:
             "consumer_path": Path("/tmp/scope/C1/C1.csproj"),
             "relevant_files": [],
         }
-        mock_fc.return_value = ([consumer], MagicMock())
+        mock_fc.return_value = ([consumer], _namespace_pipeline(1))
 
         ctx = make_mode_context()
         result = run_sproc_analysis(ctx, "dbo.sp_Test", None)
@@ -162,6 +190,23 @@ class TestRunSprocAnalysis:
         call_args = mock_fc.call_args
         assert call_args[1]["class_name"] == "ClassA"
 
+    @patch("scatter.analyzers.consumer_analyzer.find_consumers")
+    @patch("scatter.scanners.project_scanner.derive_namespace", return_value="GW.Data")
+    @patch("scatter.scanners.sproc_scanner.find_cs_files_referencing_sproc")
+    def test_class_name_filter_skips_namespace_for_other_projects(
+        self, mock_sproc, mock_ns, mock_fc, make_mode_context
+    ):
+        mock_sproc.return_value = {
+            Path("/tmp/scope/GW/GW.csproj"): {"ClassA": [Path("/tmp/a.cs")]},
+            Path("/tmp/scope/Other/Other.csproj"): {"ClassB": [Path("/tmp/b.cs")]},
+        }
+        mock_fc.return_value = ([], MagicMock())
+
+        ctx = make_mode_context(class_name="ClassA")
+        run_sproc_analysis(ctx, "dbo.sp_Test", None)
+
+        mock_ns.assert_called_once_with(Path("/tmp/scope/GW/GW.csproj"))
+
 
 class TestRunGitAnalysis:
     @patch("scatter.analyzers.git_analyzer.analyze_branch_changes")
@@ -198,15 +243,19 @@ class TestRunGitAnalysis:
             changed_config_files=[],
         )
 
+        consumer_dir = tmp_path / "C1"
+        consumer_dir.mkdir()
+        consumer_file = consumer_dir / "Uses.cs"
+        consumer_file.write_text("var foo = new Foo();\nvar bar = new Bar();")
         consumer = {
             "consumer_name": "Consumer1",
-            "consumer_path": tmp_path / "C1" / "C1.csproj",
-            "relevant_files": [],
+            "consumer_path": consumer_dir / "C1.csproj",
+            "relevant_files": [consumer_file],
         }
-        mock_fc.return_value = ([consumer], MagicMock())
+        mock_fc.return_value = ([consumer], _namespace_pipeline(1))
 
         ctx = make_mode_context(search_scope=tmp_path)
-        run_git_analysis(
+        result = run_git_analysis(
             ctx,
             tmp_path,
             "feature/x",
@@ -214,10 +263,55 @@ class TestRunGitAnalysis:
             False,
         )
 
-        # find_consumers called once per type (Foo and Bar)
-        assert mock_fc.call_count == 2
+        # One namespace scan for the project, then Foo and Bar filtered locally
+        assert mock_fc.call_count == 1
+        assert mock_fc.call_args[0][3] is None
         # bridge called once per type that has consumers
         assert mock_bridge.call_count == 2
+        # The reported funnel still carries the class stage of a matched type
+        stages = result.filter_pipeline.stages
+        assert [s.name for s in stages] == [STAGE_NAMESPACE, STAGE_CLASS]
+        assert (stages[1].input_count, stages[1].output_count) == (1, 1)
+        assert result.filter_pipeline.class_filter == "Foo"
+        assert result.filter_pipeline.total_files_scanned == 11
+
+    @patch("scatter.compat.v1_bridge._build_consumer_results")
+    @patch("scatter.analyzers.consumer_analyzer.find_consumers")
+    @patch("scatter.scanners.project_scanner.derive_namespace", return_value="MyApp")
+    @patch("scatter.analyzers.git_analyzer.analyze_branch_changes")
+    def test_multi_type_skips_types_without_consumers(
+        self, mock_analyze, mock_ns, mock_fc, mock_bridge, make_mode_context, tmp_path
+    ):
+        proj_dir = tmp_path / "MyApp"
+        proj_dir.mkdir()
+        (proj_dir / "MyApp.csproj").write_text("<Project/>")
+        (proj_dir / "Foo.cs").write_text("public class Foo {}\npublic class Bar {}")
+
+        mock_analyze.return_value = BranchChanges(
+            project_changes={"MyApp/MyApp.csproj": ["MyApp/Foo.cs"]},
+            changed_config_files=[],
+        )
+
+        consumer_dir = tmp_path / "C1"
+        consumer_dir.mkdir()
+        consumer_file = consumer_dir / "Uses.cs"
+        consumer_file.write_text("var foo = new Foo();")
+        consumer = {
+            "consumer_name": "Consumer1",
+            "consumer_path": consumer_dir / "C1.csproj",
+            "relevant_files": [consumer_file],
+        }
+        mock_fc.return_value = ([consumer], _namespace_pipeline(1))
+
+        ctx = make_mode_context(search_scope=tmp_path)
+        run_git_analysis(ctx, tmp_path, "feature/x", "main", False)
+
+        # Only Foo is referenced by the consumer's namespace-matching file
+        assert mock_bridge.call_count == 1
+        assert mock_bridge.call_args.kwargs["triggering_info"] == "Foo"
+        assert mock_bridge.call_args.kwargs["final_consumers_data"][0]["relevant_files"] == [
+            consumer_file
+        ]
 
     @patch("scatter.analyzers.consumer_analyzer.find_consumers")
     @patch("scatter.scanners.project_scanner.derive_namespace", return_value="MyApp")
@@ -221,6 +221,19 @@ class TestParserModeFlag:
         assert "analysis.parser_mode" not in overrides
 
 
+class TestPositiveIntFlags:
+    @pytest.mark.parametrize("flag", ["--summarize-workers", "--max-summarize-bytes"])
+    def test_accepts_positive(self, flag):
+        args = build_parser().parse_args(["--graph", flag, "7"])
+        assert getattr(args, flag.lstrip("-").replace("-", "_")) == 7
+
+    @pytest.mark.parametrize("flag", ["--summarize-workers", "--max-summarize-bytes"])
+    @pytest.mark.parametrize("value", ["0", "-3", "abc"])
+    def test_rejects_zero_negative_and_non_int(self, flag, value):
+        with pytest.raises(SystemExit):
+            build_parser().parse_args(["--graph", flag, value])
+
+
 class TestRedactedCliKeys:
     def test_google_api_key_is_redacted(self):
         assert "google_api_key" in _REDACTED_CLI_KEYS
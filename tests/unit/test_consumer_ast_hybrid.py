@@ -247,3 +247,69 @@ class TestNonASCIIByteOffset:
         }
         result = _run_batch(content, config)
         assert result["has_match"] is False
+
+
+# ---------------------------------------------------------------------------
+# Fused consumer scan
+# ---------------------------------------------------------------------------
+
+
+class TestFusedConsumerScan:
+    """The 'consumer' analysis type runs namespace/class/method in one read."""
+
+    def _config(self, use_ast: bool = False) -> dict:
+        import re
+
+        return {
+            "analysis_type": "consumer",
+            "using_pattern": re.compile(rb"(?:^|;|\{)\s*using\s+MyApp\.Data\s*;", re.MULTILINE),
+            "class_name": "PortalDataService",
+            "class_pattern": re.compile(rb"\bPortalDataService\b"),
+            "method_name": "Save",
+            "method_pattern": re.compile(rb"\.\s*Save\s*\("),
+            "use_ast": use_ast,
+        }
+
+    def test_all_levels_match(self):
+        content = "using MyApp.Data;\nvar svc = new PortalDataService();\nsvc.Save(x);"
+        result = _run_batch(content, self._config())
+        assert result["has_match"] is True
+        assert result["class_match"] is True
+        assert result["method_match"] is True
+
+    def test_no_using_short_circuits(self):
+        content = "var svc = new PortalDataService();\nsvc.Save(x);"
+        result = _run_batch(content, self._config())
+        assert result["has_match"] is False
+        assert result["class_match"] is False
+        assert result["method_match"] is False
+
+    def test_missing_using_pattern_skips_namespace_check(self):
+        config = self._config()
+        config["using_pattern"] = None
+        content = "var svc = new PortalDataService();\nsvc.Save(x);"
+        result = _run_batch(content, config)
+        assert result["has_match"] is True
+        assert result["class_match"] is True
+        assert result["method_match"] is True
+
+    def test_method_requires_class(self):
+        content = "using MyApp.Data;\nother.Save(x);"
+        result = _run_batch(content, self._config())
+        assert result["has_match"] is True
+        assert result["class_match"] is False
+        assert result["method_match"] is False
+
+    def test_ast_filters_class_in_comment(self):
+        content = "using MyApp.Data;\n// PortalDataService is used elsewhere\nclass Foo { }"
+        result = _run_batch(content, self._config(use_ast=True))
+        assert result["has_match"] is True
+        assert result["class_match"] is False
+
+    def test_literal_prefilter_rejects_before_regex(self):
+        config = self._config()
+        config["literals"] = {"namespace": b"MyApp.Data", "class": b"Missing", "method": b"Save"}
+        content = "using MyApp.Data;\nvar svc = new PortalDataService();\nsvc.Save(x);"
+        result = _run_batch(content, config)
+        assert result["has_match"] is True
+        assert result["class_match"] is False
@@ -95,3 +95,11 @@ class TestEdgeCases:
 
     def test_empty_content_returns_none(self):
         assert find_enclosing_type_name("", 0) is None
+
+    def test_name_excludes_constraints_and_base_list(self):
+        code = (
+            "public class Repository<T>\n    where T : class\n    , IDisposable\n{\n"
+            "    void Save() { }\n}"
+        )
+        idx = code.index("void Save")
+        assert find_enclosing_type_name(code, idx) == "Repository"
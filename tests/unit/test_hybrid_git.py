@@ -1,6 +1,8 @@
 """Tests for Hybrid Git Analysis (Initiative 2) — LLM-enhanced diff analysis."""
 
-from unittest.mock import MagicMock
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
 from scatter import (
     get_affected_symbols_from_diff,
     get_diff_for_file,
@@ -124,3 +126,34 @@ class TestGetDiffForFile:
         """Returns None when repo path is invalid."""
         result = get_diff_for_file("/nonexistent/path", "file.cs", "main", "main")
         assert result is None
+
+
+class TestHybridTypeExtractionInGitAnalysis:
+    """Hybrid git mode sends each changed file's diff to the AI provider."""
+
+    def test_each_changed_file_extracted_once(self, tmp_path, make_mode_context):
+        from scatter.analysis import run_git_analysis
+        from scatter.analyzers.git_analyzer import BranchChanges
+
+        (tmp_path / "Proj").mkdir()
+        rel_paths = [f"Proj/File{i}.cs" for i in range(4)]
+        for rel in rel_paths:
+            (tmp_path / rel).write_text(SAMPLE_CS_CONTENT)
+
+        provider = MagicMock()
+        provider.extract_affected_symbols.side_effect = lambda content, diff, path: {
+            f"Type_{Path(path).stem}"
+        }
+        ctx = make_mode_context(ai_provider=provider, summarize_workers=4)
+        changes = BranchChanges(project_changes={"Proj/Proj.csproj": rel_paths})
+
+        with (
+            patch("scatter.analyzers.git_analyzer.analyze_branch_changes", return_value=changes),
+            patch("scatter.analyzers.git_analyzer.get_diff_for_file", return_value=SAMPLE_DIFF),
+            patch("scatter.analyzers.consumer_analyzer.find_consumers") as mock_find,
+        ):
+            run_git_analysis(ctx, tmp_path, "feature", "main", enable_hybrid=True)
+
+        assert provider.extract_affected_symbols.call_count == 4
+        # Target project .csproj does not exist, so no consumer lookups run
+        mock_find.assert_not_called()
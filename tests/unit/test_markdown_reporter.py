@@ -349,6 +349,24 @@ class TestBuildLegacyMarkdown:
         assert "## GalaxyWorks.Data" in md
         assert "## Other.Project" in md
 
+    def test_interleaved_targets_get_one_section_each(self):
+        data_a, data_b = _make_legacy_results()
+        other = {
+            "TargetProjectName": "Alpha.Project",
+            "TargetProjectPath": "src/Alpha/Alpha.csproj",
+            "TriggeringType": "N/A (Project Reference)",
+            "ConsumerProjectName": "SomeConsumer",
+            "ConsumerProjectPath": "src/Some/Some.csproj",
+            "ConsumingSolutions": [],
+            "PipelineName": None,
+        }
+        md = build_markdown([data_a, other, data_b])
+        assert md.count("## GalaxyWorks.Data") == 1
+        assert "## GalaxyWorks.Data (src/Data/Data.csproj) (2 consumer(s))" in md
+        assert md.count("## Alpha.Project") == 1
+        # Sections follow first appearance, not alphabetical order
+        assert md.index("## GalaxyWorks.Data") < md.index("## Alpha.Project")
+
     def test_table_columns(self):
         md = build_markdown(_make_legacy_results())
         assert "| Consumer | Path | Pipeline | Solutions |" in md
@@ -49,6 +49,9 @@ def _fake_args(**overrides):
         base_branch="main",
         app_config_path=None,
         summarize_consumers=False,
+        summarize_workers=8,
+        no_summary_cache=False,
+        max_summarize_bytes=200_000,
         enable_hybrid_git=False,
         google_api_key=None,
         max_workers=1,
@@ -3,7 +3,13 @@
 import pytest
 import git
 
-from scatter.analyzers.git_analyzer import _diff_type_sets, extract_pr_changed_types
+from scatter.analyzers.git_analyzer import (
+    _diff_type_sets,
+    _read_blob_content,
+    _read_diff_side,
+    extract_pr_changed_types,
+    find_project_file,
+)
 
 
 CS_INITIAL = "namespace MyProject\n{\n    public class Initial { }\n}\n"
@@ -269,6 +275,123 @@ class TestExtractPrChangedTypes:
         assert all(ct.owning_project == "MyProject" for ct in result) or result == []
 
 
+class TestFindProjectFile:
+    """find_project_file walks up the commit tree to the nearest .csproj."""
+
+    def test_nested_file_maps_to_nearest_csproj(self, repo_path):
+        repo = _init_repo(repo_path)
+        nested = repo_path / "MyProject" / "Services" / "Deep"
+        nested.mkdir(parents=True)
+        deep_cs = nested / "Deep.cs"
+        deep_cs.write_text("public class Deep { }\n")
+        repo.index.add([str(deep_cs)])
+        commit = repo.index.commit("Add nested file")
+
+        assert (
+            find_project_file(repo, commit, "MyProject/Services/Deep/Deep.cs")
+            == "MyProject/MyProject.csproj"
+        )
+        # Second lookup reuses the per-commit .csproj index
+        assert (
+            find_project_file(repo, commit, "MyProject/Services/Deep/Other.cs")
+            == "MyProject/MyProject.csproj"
+        )
+
+    def test_directory_match_is_case_insensitive(self, repo_path):
+        repo = _init_repo(repo_path)
+        commit = repo.head.commit
+        assert find_project_file(repo, commit, "myproject/Initial.cs") == (
+            "myproject/MyProject.csproj"
+        )
+
+    def test_missing_directory_returns_none(self, repo_path):
+        repo = _init_repo(repo_path)
+        commit = repo.head.commit
+        assert find_project_file(repo, commit, "scripts/Helper.cs") is None
+
+    def test_missing_directory_under_project_stops_search(self, repo_path):
+        # Like the tree walk, a directory absent from the commit is not
+        # attributed to the project above it.
+        repo = _init_repo(repo_path)
+        commit = repo.head.commit
+        assert find_project_file(repo, commit, "MyProject/Gone/Helper.cs") is None
+        assert find_project_file(repo, commit, "MyProject/Initial.cs/Nested.cs") is None
+
+    def test_submodule_directory_stops_search(self, repo_path):
+        repo = _init_repo(repo_path)
+        sha = repo.head.commit.hexsha
+        repo.git.update_index("--add", "--cacheinfo", f"160000,{sha},MyProject/External")
+        repo.git.commit("-m", "Add submodule")
+        commit = repo.head.commit
+
+        assert find_project_file(repo, commit, "MyProject/External/Lib.cs") is None
+        assert find_project_file(repo, commit, "MyProject/External/Src/Lib.cs") is None
+        assert find_project_file(repo, commit, "MyProject/Initial.cs") == (
+            "MyProject/MyProject.csproj"
+        )
+
+
+class TestReadBlobContent:
+    """_read_blob_content resolves repo-relative paths through the commit tree."""
+
+    def test_reads_nested_blob(self, repo_path):
+        repo = _init_repo(repo_path)
+        assert _read_blob_content(repo.head.commit, "MyProject/Initial.cs") == CS_INITIAL
+
+    def test_missing_or_non_blob_path_returns_none(self, repo_path):
+        repo = _init_repo(repo_path)
+        commit = repo.head.commit
+        assert _read_blob_content(commit, "MyProject/Missing.cs") is None
+        assert _read_blob_content(commit, "Other/Initial.cs") is None
+        assert _read_blob_content(commit, "MyProject") is None
+        assert _read_blob_content(commit, "MyProject/Initial.cs/Extra") is None
+
+    def test_shared_tree_children_reused_within_call(self, repo_path):
+        repo = _init_repo(repo_path)
+        commit = repo.head.commit
+        tree_children: dict = {}
+        _read_blob_content(commit, "MyProject/Initial.cs", tree_children)
+        assert set(tree_children) == {commit.tree.hexsha, (commit.tree / "MyProject").hexsha}
+
+        # Later lookups through the same trees are answered from the map
+        cached = dict(tree_children)
+        assert _read_blob_content(commit, "MyProject/MyProject.csproj", tree_children)
+        assert tree_children == cached
+
+    def test_lookup_does_not_keep_repo_alive(self, repo_path):
+        import gc
+        import weakref
+
+        repo = _init_repo(repo_path)
+        assert _read_blob_content(repo.head.commit, "MyProject/Initial.cs") == CS_INITIAL
+        repo_ref = weakref.ref(repo)
+        repo.close()
+        del repo
+        gc.collect()
+        assert repo_ref() is None
+
+
+class TestReadDiffSide:
+    """_read_diff_side reads diff blobs by SHA, falling back to the tree lookup."""
+
+    def test_reads_blob_carried_by_diff(self, repo_path):
+        repo = _init_repo(repo_path)
+        base = repo.head.commit
+        changed = CS_INITIAL.replace("Initial", "Renamed")
+        (repo_path / "MyProject" / "Initial.cs").write_text(changed)
+        repo.index.add([str(repo_path / "MyProject" / "Initial.cs")])
+        feature = repo.index.commit("Change")
+
+        (diff_item,) = base.diff(feature)
+        assert _read_diff_side(diff_item.a_blob, base, diff_item.a_path) == CS_INITIAL
+        assert _read_diff_side(diff_item.b_blob, feature, diff_item.b_path) == changed
+
+    def test_missing_blob_falls_back_to_tree(self, repo_path):
+        repo = _init_repo(repo_path)
+        commit = repo.head.commit
+        assert _read_diff_side(None, commit, "MyProject/Initial.cs") == CS_INITIAL
+
+
 class TestDiffTypeSets:
     """Standalone tests for _diff_type_sets."""
 
@@ -1,12 +1,17 @@
 """Tests for scatter.scanners.project_scanner — project file discovery and namespace derivation."""
 
+import ntpath
 from pathlib import Path
+from unittest.mock import patch
 
 
+from scatter.core.parallel import map_cs_to_projects_batch
+from scatter.scanners._helpers import clear_project_file_cache
 from scatter.scanners.project_scanner import (
     derive_namespace,
     find_project_file_on_disk,
     parse_csproj_all_references,
+    read_csproj_summary,
 )
 
 
@@ -48,6 +53,59 @@ class TestFindProjectFileOnDisk:
         # Just verify it doesn't crash and returns Path or None
         assert result is None or isinstance(result, Path)
 
+    def test_walked_directories_are_not_rescanned(self, tmp_path):
+        csproj = tmp_path / "Foo.csproj"
+        csproj.write_text("<Project/>")
+        deep = tmp_path / "a" / "b"
+        deep.mkdir(parents=True)
+        first = deep / "One.cs"
+        first.write_text("class One {}")
+        assert find_project_file_on_disk(first) == csproj.resolve()
+
+        # Every directory on the first walk is now cached, so resolving a
+        # sibling or a file in an intermediate directory never lists again.
+        with patch(
+            "scatter.scanners._helpers._first_csproj_name",
+            side_effect=AssertionError("rescanned"),
+        ):
+            assert find_project_file_on_disk(deep / "Two.cs") == csproj.resolve()
+            assert find_project_file_on_disk(tmp_path / "a" / "Three.cs") == csproj.resolve()
+            # The batch mapper shares the same cache.
+            assert map_cs_to_projects_batch(([str(deep / "Four.cs")],)) == {
+                str(deep / "Four.cs"): str(csproj.resolve())
+            }
+
+    def test_upper_case_extension_found_where_case_folds(self, tmp_path):
+        # On Windows a Foo.CSPROJ next to the file owns it; the walk must not
+        # climb past it to an outer project and cache that answer.
+        outer = tmp_path / "Outer.csproj"
+        outer.write_text("<Project/>")
+        sub = tmp_path / "Inner"
+        sub.mkdir()
+        inner = sub / "Inner.CSPROJ"
+        inner.write_text("<Project/>")
+        cs_file = sub / "Bar.cs"
+        cs_file.write_text("class Bar {}")
+
+        with patch("os.path.normcase", ntpath.normcase):
+            assert find_project_file_on_disk(cs_file) == inner.resolve()
+
+    def test_cleared_cache_sees_new_projects(self, tmp_path):
+        outer = tmp_path / "Outer.csproj"
+        outer.write_text("<Project/>")
+        sub = tmp_path / "Inner"
+        sub.mkdir()
+        cs_file = sub / "Bar.cs"
+        cs_file.write_text("class Bar {}")
+        assert find_project_file_on_disk(cs_file) == outer.resolve()
+
+        inner = sub / "Inner.csproj"
+        inner.write_text("<Project/>")
+        assert find_project_file_on_disk(cs_file) == outer.resolve()
+
+        clear_project_file_cache()
+        assert find_project_file_on_disk(cs_file) == inner.resolve()
+
 
 # ---------------------------------------------------------------------------
 # derive_namespace
@@ -99,6 +157,10 @@ class TestDeriveNamespace:
     def test_returns_none_for_missing_file(self, tmp_path):
         assert derive_namespace(tmp_path / "Missing.csproj") is None
 
+    def test_returns_none_for_directory(self, tmp_path):
+        (tmp_path / "Dir.csproj").mkdir()
+        assert derive_namespace(tmp_path / "Dir.csproj") is None
+
     def test_returns_none_for_bad_xml(self, tmp_path):
         csproj = tmp_path / "Bad.csproj"
         csproj.write_text("not xml at all {{{{")
@@ -118,6 +180,56 @@ class TestDeriveNamespace:
         assert derive_namespace(csproj) == "Legacy.Ns"
 
 
+# ---------------------------------------------------------------------------
+# read_csproj_summary
+# ---------------------------------------------------------------------------
+
+
+class TestReadCsprojSummary:
+    def test_sdk_style(self, tmp_path):
+        csproj = tmp_path / "Foo.csproj"
+        csproj.write_text(
+            '<Project Sdk="Microsoft.NET.Sdk">\n'
+            "  <PropertyGroup><AssemblyName> Foo.Api </AssemblyName></PropertyGroup>\n"
+            '  <ItemGroup><ProjectReference Include="..\\Bar\\Bar.csproj" /></ItemGroup>\n'
+            "</Project>"
+        )
+        summary = read_csproj_summary(csproj)
+        assert summary.root_namespace is None
+        assert summary.assembly_name == "Foo.Api"
+        assert summary.project_references == ("../Bar/Bar.csproj",)
+
+    def test_msbuild_namespace_preferred(self, tmp_path):
+        csproj = tmp_path / "Foo.csproj"
+        csproj.write_text(
+            '<Project xmlns="http://schemas.microsoft.com/developer/msbuild/2003">\n'
+            "  <PropertyGroup><RootNamespace>Legacy.Ns</RootNamespace></PropertyGroup>\n"
+            '  <ItemGroup><ProjectReference Include="../A/A.csproj" />'
+            '<ProjectReference Include="../B/B.csproj" /></ItemGroup>\n'
+            "</Project>"
+        )
+        summary = read_csproj_summary(csproj)
+        assert summary.root_namespace == "Legacy.Ns"
+        assert summary.project_references == ("../A/A.csproj", "../B/B.csproj")
+
+    def test_cached_until_file_changes(self, tmp_path):
+        import os
+
+        csproj = tmp_path / "Foo.csproj"
+        csproj.write_text(
+            "<Project><PropertyGroup><RootNamespace>A</RootNamespace></PropertyGroup></Project>"
+        )
+        first = read_csproj_summary(csproj)
+        assert read_csproj_summary(csproj) is first
+
+        csproj.write_text(
+            "<Project><PropertyGroup><RootNamespace>B</RootNamespace></PropertyGroup></Project>"
+        )
+        stat = csproj.stat()
+        os.utime(csproj, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert read_csproj_summary(csproj).root_namespace == "B"
+
+
 # ---------------------------------------------------------------------------
 # parse_csproj_all_references
 # ---------------------------------------------------------------------------
@@ -197,3 +309,25 @@ class TestParseCsprojAllReferences:
         )
         result = parse_csproj_all_references(csproj)
         assert result["project_references"] == ["../Sub/Bar/Bar.csproj"]
+
+    def test_first_element_wins_and_plain_tags_preferred(self, tmp_path):
+        csproj = tmp_path / "Mixed.csproj"
+        csproj.write_text(
+            '<Project xmlns:m="http://schemas.microsoft.com/developer/msbuild/2003">\n'
+            "  <PropertyGroup>\n"
+            "    <m:RootNamespace>Namespaced</m:RootNamespace>\n"
+            "    <AssemblyName>First</AssemblyName>\n"
+            "    <AssemblyName>Second</AssemblyName>\n"
+            "    <m:OutputType>Library</m:OutputType>\n"
+            "  </PropertyGroup>\n"
+            "  <ItemGroup>\n"
+            '    <m:ProjectReference Include="../Ns/Ns.csproj" />\n'
+            '    <ProjectReference Include="../Plain/Plain.csproj" />\n'
+            "  </ItemGroup>\n"
+            "</Project>"
+        )
+        result = parse_csproj_all_references(csproj)
+        assert result["root_namespace"] == "Namespaced"
+        assert result["assembly_name"] == "First"
+        assert result["output_type"] == "Library"
+        assert result["project_references"] == ["../Plain/Plain.csproj"]
@@ -165,6 +165,25 @@ class TestBranchChangesCollection:
         assert "Foo/Foo.csproj" in result.project_changes
         assert result.project_changes["Foo/Foo.csproj"] == ["Foo/Bar.cs"]
 
+    @patch("scatter.analyzers.git_analyzer.find_project_file")
+    @patch("scatter.analyzers.git_analyzer.git")
+    def test_project_resolved_once_per_directory(self, mock_git, mock_find):
+        mock_repo = MagicMock()
+        mock_git.Repo.return_value = mock_repo
+        base = MagicMock()
+        mock_repo.merge_base.return_value = [base]
+        base.diff.return_value = [
+            self._mock_diff_item(p, p, "M") for p in ("Foo/A.cs", "Foo/B.cs", "Bar/C.cs")
+        ]
+        mock_find.side_effect = lambda repo, commit, path: path.split("/")[0] + "/P.csproj"
+
+        result = analyze_branch_changes("/repo", "feature/x", "main")
+        assert mock_find.call_count == 2
+        assert result.project_changes == {
+            "Foo/P.csproj": ["Foo/A.cs", "Foo/B.cs"],
+            "Bar/P.csproj": ["Bar/C.cs"],
+        }
+
     @patch("scatter.analyzers.git_analyzer.find_project_file")
     @patch("scatter.analyzers.git_analyzer.git")
     def test_from_analyzer(self, mock_git, mock_find):
@@ -0,0 +1,102 @@
+"""Tests for the stored-procedure stage of analyze_cs_files_batch().
+
+Covers the byte-level sproc scan run in the workers: the literal prefilter,
+match offsets into decoded text, enclosing-type resolution and cached reads.
+"""
+
+import re
+import tempfile
+from pathlib import Path
+
+from scatter.core.parallel import analyze_cs_files_batch
+from scatter.scanners.sproc_scanner import find_cs_files_referencing_sproc
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+SPROC_PATTERN = re.compile(rb'["\'](?:[a-zA-Z_][a-zA-Z0-9_]*\.)?sp_GetUser["\']', re.I)
+
+
+def _scan(content: str, **config) -> dict:
+    """Write content to a temp file and run the sproc stage of analyze_cs_files_batch on it."""
+    with tempfile.NamedTemporaryFile(suffix=".cs", mode="w", delete=False, encoding="utf-8") as f:
+        f.write(content)
+        tmp = Path(f.name)
+    try:
+        analysis_config = {"analysis_type": "sproc", "sproc_pattern": SPROC_PATTERN, **config}
+        return analyze_cs_files_batch(([tmp], analysis_config))[tmp]
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# Sproc stage tests
+# ---------------------------------------------------------------------------
+
+
+class TestSprocWorkerScan:
+    def test_literal_prefilter_matches_unfiltered_scan(self):
+        """The sproc-name prefilter is case-insensitive and changes no results."""
+        for content, expected in (
+            ('var cmd = "DBO.SP_GETUSER";', True),
+            ('var cmd = "dbo.sp_Other";', False),
+        ):
+            unfiltered = _scan(content)
+            filtered = _scan(content, sproc_literal=b"sp_getuser")
+            assert filtered == unfiltered
+            assert filtered["has_match"] is expected
+
+    def test_match_offsets_index_decoded_text(self):
+        """Byte-level sproc matches report offsets into the decoded file."""
+        content = '// Ünïcödé comment\nvar cmd = "dbo.sp_GetUser";'
+        result = _scan(content)
+        assert result["matches"] == [('"dbo.sp_GetUser"', content.index('"dbo'))]
+
+    def test_match_offsets_accumulate_across_matches(self):
+        """Later matches keep decoded offsets when non-ASCII text sits between them."""
+        content = '// Ünï\nvar a = "sp_GetUser";\n// çödé\nvar b = "dbo.sp_GetUser";'
+        result = _scan(content)
+        assert result["matches"] == [
+            ('"sp_GetUser"', content.index('"sp_')),
+            ('"dbo.sp_GetUser"', content.index('"dbo')),
+        ]
+
+    def test_enclosing_type_resolved_in_worker(self):
+        """find_enclosing_type reports the class around the first sproc reference."""
+        content = 'public class UserRepository\n{\n    var cmd = "dbo.sp_GetUser";\n}\n'
+        result = _scan(content, find_enclosing_type=True)
+        assert result["enclosing_type"] == "UserRepository"
+
+    def test_cached_reads_pick_up_edited_files(self, tmp_path):
+        """Repeat scans reuse file bytes, but an edited file is read again."""
+        config = {"analysis_type": "sproc", "sproc_pattern": SPROC_PATTERN}
+        cs_file = tmp_path / "Repo.cs"
+        cs_file.write_text('var cmd = "dbo.sp_Other";')
+        before = analyze_cs_files_batch(([cs_file], config))[cs_file]
+        cs_file.write_text('var cmd = "dbo.sp_GetUser";')
+        after = analyze_cs_files_batch(([cs_file], config))[cs_file]
+
+        assert before["has_match"] is False
+        assert after["has_match"] is True
+
+    def test_custom_sproc_regex_keeps_unicode_semantics(self, tmp_path):
+        """User --sproc-regex-pattern values match as str patterns, not ASCII bytes."""
+        content = (
+            "namespace Demo\n{\n    public class Repo\n    {\n"
+            "        // Ünïcödé\n        Exec(Ünï_SP_GETUSER);\n    }\n}\n"
+        )
+        (tmp_path / "Demo.csproj").write_text("<Project/>")
+        (tmp_path / "Repo.cs").write_text(content, encoding="utf-8")
+        # Only str \w covers the accented prefix; bytes \w is ASCII-only
+        found = find_cs_files_referencing_sproc(
+            "dbo.sp_GetUser",
+            tmp_path,
+            custom_sproc_regex_pattern=r"\b\w+_{sproc_name_placeholder}\b",
+            disable_multiprocessing=True,
+        )
+
+        csproj = (tmp_path / "Demo.csproj").resolve()
+        assert list(found) == [csproj]
+        assert list(found[csproj]) == ["Repo"]
@@ -1,12 +1,19 @@
 """Tests for _summarize_consumer_files wiring in __main__.py."""
 
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 
-from scatter.analysis import _summarize_consumer_files
+import pytest
+
+from scatter.analysis import (
+    _SummaryQueue,
+    _emit_consumer_results,
+    _summarize_consumer_files,
+)
 from scatter.ai.base import AITaskType, AnalysisResult, classify_file_type
 from scatter.core.models import ConsumerResult
+from scatter.pipeline.resolver import PipelineResolver
 
 
 # ---------------------------------------------------------------------------
@@ -107,10 +114,14 @@ class TestSummarizeConsumerFiles:
 
         provider = MagicMock()
         provider.supports.return_value = True
-        provider.analyze.side_effect = [
-            AnalysisResult(response="Good does things."),
-            Exception("API timeout"),
-        ]
+
+        def _analyze(prompt, context, task_type):
+            # Keyed by file rather than call order: calls run on a thread pool
+            if "Bad.cs" in prompt:
+                raise Exception("API timeout")
+            return AnalysisResult(response="Good does things.")
+
+        provider.analyze.side_effect = _analyze
 
         _summarize_consumer_files(consumers, results, provider, tmp_path, 0)
 
@@ -187,16 +198,109 @@ class TestSummarizeConsumerFiles:
 
         provider = MagicMock()
         provider.supports.return_value = True
-        provider.analyze.side_effect = [
-            AnalysisResult(response="A summary"),
-            AnalysisResult(response="B summary"),
-        ]
+        provider.analyze.side_effect = lambda prompt, context, task_type: AnalysisResult(
+            response="A summary" if "A.cs" in prompt else "B summary"
+        )
 
         _summarize_consumer_files(consumers, results, provider, tmp_path, 0)
 
         assert results[0].consumer_file_summaries["A.cs"] == "A summary"
         assert results[1].consumer_file_summaries["B.cs"] == "B summary"
 
+    def test_many_files_summarized_concurrently(self, tmp_path):
+        """Every file is summarized once and summaries keep submission order."""
+        files = []
+        for i in range(20):
+            f = tmp_path / f"File{i:02d}.cs"
+            f.write_text(f"class File{i:02d} {{}}")
+            files.append(f)
+
+        consumers = [_make_consumer("A", files, base=tmp_path)]
+        results = [_make_result("A", search_scope=tmp_path)]
+        provider = _mock_provider(response="summary")
+
+        _summarize_consumer_files(consumers, results, provider, tmp_path, 0)
+
+        assert provider.analyze.call_count == 20
+        assert list(results[0].consumer_file_summaries) == [f.name for f in files]
+
+    def test_single_worker_runs_sequentially(self, tmp_path):
+        files = []
+        for i in range(3):
+            f = tmp_path / f"File{i}.cs"
+            f.write_text(f"class File{i} {{}}")
+            files.append(f)
+
+        consumers = [_make_consumer("A", files, base=tmp_path)]
+        results = [_make_result("A", search_scope=tmp_path)]
+        provider = _mock_provider(response="summary")
+
+        with patch("scatter.analysis.ThreadPoolExecutor") as mock_pool:
+            _summarize_consumer_files(consumers, results, provider, tmp_path, 0, max_workers=1)
+
+        mock_pool.assert_not_called()
+        assert len(results[0].consumer_file_summaries) == 3
+
+    def test_generated_and_oversized_files_skipped(self, tmp_path):
+        kept = tmp_path / "Service.cs"
+        kept.write_text("class Service {}")
+        designer = tmp_path / "Form1.Designer.cs"
+        designer.write_text("partial class Form1 {}")
+        generated = tmp_path / "View.g.cs"
+        generated.write_text("class View {}")
+        large = tmp_path / "Large.cs"
+        large.write_text("class Large {}" + " " * 100)
+
+        consumers = [_make_consumer("A", [kept, designer, generated, large], base=tmp_path)]
+        results = [_make_result("A", search_scope=tmp_path)]
+        provider = _mock_provider(response="summary")
+
+        _summarize_consumer_files(consumers, results, provider, tmp_path, 0, max_file_bytes=64)
+
+        assert list(results[0].consumer_file_summaries) == ["Service.cs"]
+        provider.analyze.assert_called_once()
+
+    def test_file_shared_by_consumers_summarized_once(self, tmp_path):
+        shared = tmp_path / "Shared.cs"
+        shared.write_text("class Shared {}")
+
+        consumers = [
+            _make_consumer("A", [shared], base=tmp_path),
+            _make_consumer("B", [shared], base=tmp_path),
+        ]
+        results = [
+            _make_result("A", search_scope=tmp_path),
+            _make_result("B", search_scope=tmp_path),
+        ]
+        provider = _mock_provider(response="shared summary")
+
+        _summarize_consumer_files(
+            consumers, results, provider, tmp_path, 0, use_summary_cache=False
+        )
+
+        provider.analyze.assert_called_once()
+        assert results[0].consumer_file_summaries == {"Shared.cs": "shared summary"}
+        assert results[1].consumer_file_summaries == {"Shared.cs": "shared summary"}
+
+    def test_prompt_uses_only_file_prefix(self, tmp_path):
+        from scatter.ai.base import MAX_SUMMARIZATION_CHARS
+
+        big = tmp_path / "Big.cs"
+        big.write_text("é" * (MAX_SUMMARIZATION_CHARS + 50) + "TAIL_MARKER")
+
+        consumers = [_make_consumer("A", [big], base=tmp_path)]
+        results = [_make_result("A", search_scope=tmp_path)]
+        provider = _mock_provider(response="summary")
+
+        _summarize_consumer_files(
+            consumers, results, provider, tmp_path, 0, use_summary_cache=False
+        )
+
+        prompt = provider.analyze.call_args[0][0]
+        assert "é" * MAX_SUMMARIZATION_CHARS in prompt
+        assert "é" * (MAX_SUMMARIZATION_CHARS + 1) not in prompt
+        assert "TAIL_MARKER" not in prompt
+
 
 class TestMethodFocusedSummarization:
     """Tests for method-focused prompt path (Phase 1 of METHOD_LEVEL_ANALYSIS_PLAN)."""
@@ -316,6 +420,109 @@ class TestMethodFocusedSummarization:
         assert "production code" in prompt_sent
 
 
+class TestQueuedSummarization:
+    """Summaries queued by _emit_consumer_results while later targets are scanned."""
+
+    def test_summaries_stay_with_their_target(self, tmp_path, make_mode_context):
+        file_a = tmp_path / "A.cs"
+        file_a.write_text("class A {}")
+        file_b = tmp_path / "B.cs"
+        file_b.write_text("class B {}")
+
+        provider = MagicMock()
+        provider.supports.return_value = True
+        provider.analyze.side_effect = lambda prompt, *_: AnalysisResult(
+            response="about A" if "A.cs" in prompt else "about B"
+        )
+        ctx = make_mode_context(
+            search_scope=tmp_path,
+            ai_provider=provider,
+            summarize_consumers=True,
+            use_summary_cache=False,
+        )
+        resolver = PipelineResolver({})
+        all_results: list = []
+
+        with _SummaryQueue() as summaries:
+            for target, cs_file in (("TargetA", file_a), ("TargetB", file_b)):
+                _emit_consumer_results(
+                    ctx,
+                    resolver,
+                    [_make_consumer("Consumer", [cs_file], base=tmp_path)],
+                    all_results,
+                    target,
+                    f"{target}/{target}.csproj",
+                    "SomeClass",
+                    class_name=None,
+                    method_name=None,
+                    summaries=summaries,
+                )
+
+        assert [r.consumer_file_summaries for r in all_results] == [
+            {"A.cs": "about A"},
+            {"B.cs": "about B"},
+        ]
+
+    def test_shared_cache_saved_once_per_run(self, tmp_path, make_mode_context):
+        files = []
+        for name in ("A", "B", "C"):
+            cs_file = tmp_path / f"{name}.cs"
+            cs_file.write_text(f"class {name} {{}}")
+            files.append(cs_file)
+
+        provider = MagicMock()
+        provider.supports.return_value = True
+        provider.analyze.return_value = AnalysisResult(response="summary")
+        ctx = make_mode_context(
+            search_scope=tmp_path, ai_provider=provider, summarize_consumers=True
+        )
+
+        with patch("scatter.analysis.SummaryCache.save", autospec=True) as save:
+            with _SummaryQueue(ctx) as summaries:
+                for i, cs_file in enumerate(files):
+                    _emit_consumer_results(
+                        ctx,
+                        PipelineResolver({}),
+                        [_make_consumer("Consumer", [cs_file], base=tmp_path)],
+                        [],
+                        f"Target{i}",
+                        f"Target{i}/Target{i}.csproj",
+                        "SomeClass",
+                        class_name=None,
+                        method_name=None,
+                        summaries=summaries,
+                    )
+                save.assert_not_called()
+
+        save.assert_called_once_with(ctx.summary_cache)
+        assert provider.analyze.call_count == 3
+
+    def test_job_failure_is_raised_on_exit(self):
+        def _fail():
+            raise RuntimeError("provider down")
+
+        with pytest.raises(RuntimeError, match="provider down"):
+            with _SummaryQueue() as summaries:
+                summaries.submit(_fail)
+
+    def test_error_in_block_wins_and_cancels_queued_jobs(self):
+        import threading
+
+        release = threading.Event()
+        ran = []
+
+        with pytest.raises(ValueError, match="scan failed"):
+            with _SummaryQueue() as summaries:
+                summaries.submit(release.wait)
+                summaries.submit(ran.append, "queued")
+                # Free the running job only after exit has cancelled the queue
+                threading.Timer(0.2, release.set).start()
+                raise ValueError("scan failed")
+
+        # The running job finished; the one still queued never started
+        assert ran == []
+
+
 class TestClassifyFileType:
     """Tests for the file type classifier."""
 
@@ -0,0 +1,168 @@
+"""Tests for the persistent AI summary cache."""
+
+from unittest.mock import MagicMock, patch
+
+from scatter.ai.base import AnalysisResult
+from scatter.analysis import _summarize_consumer_files
+from scatter.core.models import ConsumerResult
+from scatter.store.summary_cache import (
+    SummaryCache,
+    get_summary_cache_path,
+    summary_cache_key,
+)
+
+
+def _provider(response="summary"):
+    provider = MagicMock()
+    provider.name = "test-provider"
+    provider.model_name = "test-model"
+    provider.supports.return_value = True
+    provider.analyze.return_value = AnalysisResult(response=response)
+    return provider
+
+
+def _run(tmp_path, provider):
+    cs_file = tmp_path / "A" / "Service.cs"
+    consumer_path = tmp_path / "A" / "A.csproj"
+    consumers = [
+        {"consumer_name": "A", "consumer_path": consumer_path, "relevant_files": [cs_file]}
+    ]
+    results = [
+        ConsumerResult(
+            target_project_name="T",
+            target_project_path="T/T.csproj",
+            triggering_type="Svc",
+            consumer_project_name="A",
+            consumer_project_path="A/A.csproj",
+        )
+    ]
+    _summarize_consumer_files(consumers, results, provider, tmp_path, 0)
+    return results[0].consumer_file_summaries
+
+
+class TestSummaryCache:
+    def test_round_trip(self, tmp_path):
+        path = get_summary_cache_path(tmp_path)
+        cache = SummaryCache.load(path)
+        key = summary_cache_key("gemini", "gemini-2.5-flash", "prompt")
+        cache.put(key, "text")
+        cache.save()
+
+        assert SummaryCache.load(path).get(key) == "text"
+
+    def test_key_depends_on_provider_model_and_prompt(self):
+        base = summary_cache_key("gemini", "gemini-2.5-flash", "prompt")
+        assert base != summary_cache_key("wex", "gemini-2.5-flash", "prompt")
+        assert base != summary_cache_key("gemini", "gemini-2.5-pro", "prompt")
+        assert base != summary_cache_key("gemini", "gemini-2.5-flash", "prompt2")
+
+    def test_least_recently_used_entries_evicted_beyond_cap(self, tmp_path):
+        path = get_summary_cache_path(tmp_path)
+        cache = SummaryCache(path)
+        for key in ("a", "b", "c"):
+            cache.put(key, key.upper())
+        cache.save()
+
+        # Reading "a" in the next run makes "b" the oldest entry
+        cache = SummaryCache.load(path)
+        assert cache.get("a") == "A"
+        cache.put("d", "D")
+        with patch("scatter.store.summary_cache.MAX_ENTRIES", 3):
+            cache.save()
+
+        assert list(SummaryCache.load(path).entries) == ["c", "a", "d"]
+
+    def test_hits_already_newest_do_not_rewrite(self, tmp_path):
+        path = get_summary_cache_path(tmp_path)
+        cache = SummaryCache(path)
+        cache.put("a", "A")
+        cache.save()
+
+        cache = SummaryCache.load(path)
+        cache.get("a")
+        with patch("scatter.store.summary_cache.tempfile.mkstemp") as mkstemp:
+            cache.save()
+        mkstemp.assert_not_called()
+
+    def test_corrupt_file_starts_empty(self, tmp_path):
+        path = get_summary_cache_path(tmp_path)
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+        assert SummaryCache.load(path).entries == {}
+
+    def test_unchanged_file_not_resummarized(self, tmp_path):
+        (tmp_path / "A").mkdir()
+        (tmp_path / "A" / "Service.cs").write_text("class Service {}")
+
+        first = _provider("first")
+        assert _run(tmp_path, first) == {"A/Service.cs": "first"}
+
+        second = _provider("second")
+        assert _run(tmp_path, second) == {"A/Service.cs": "first"}
+        second.analyze.assert_not_called()
+
+    def test_other_model_resummarized(self, tmp_path):
+        (tmp_path / "A").mkdir()
+        (tmp_path / "A" / "Service.cs").write_text("class Service {}")
+        _run(tmp_path, _provider("first"))
+
+        second = _provider("second")
+        second.model_name = "other-model"
+        assert _run(tmp_path, second) == {"A/Service.cs": "second"}
+        second.analyze.assert_called_once()
+
+    def test_edited_file_resummarized(self, tmp_path):
+        (tmp_path / "A").mkdir()
+        cs_file = tmp_path / "A" / "Service.cs"
+        cs_file.write_text("class Service {}")
+        _run(tmp_path, _provider("first"))
+
+        cs_file.write_text("class Service { void Run() {} }")
+        second = _provider("second")
+        assert _run(tmp_path, second) == {"A/Service.cs": "second"}
+        second.analyze.assert_called_once()
+
+    def test_cache_bypass_neither_reads_nor_writes(self, tmp_path):
+        (tmp_path / "A").mkdir()
+        (tmp_path / "A" / "Service.cs").write_text("class Service {}")
+        _run(tmp_path, _provider("first"))
+
+        second = _provider("second")
+        consumers = [
+            {
+                "consumer_name": "A",
+                "consumer_path": tmp_path / "A" / "A.csproj",
+                "relevant_files": [tmp_path / "A" / "Service.cs"],
+            }
+        ]
+        _summarize_consumer_files(consumers, [], second, tmp_path, 0, use_summary_cache=False)
+        second.analyze.assert_called_once()
+
+        # The stored entry is still the first run's summary
+        third = _provider("third")
+        assert _run(tmp_path, third) == {"A/Service.cs": "first"}
+
+    def test_shared_cache_reused_across_calls_without_disk(self, tmp_path):
+        (tmp_path / "A").mkdir()
+        (tmp_path / "A" / "Service.cs").write_text("class Service {}")
+        run_cache = SummaryCache(get_summary_cache_path(tmp_path))
+        consumers = [
+            {
+                "consumer_name": "A",
+                "consumer_path": tmp_path / "A" / "A.csproj",
+                "relevant_files": [tmp_path / "A" / "Service.cs"],
+            }
+        ]
+
+        first = _provider("first")
+        _summarize_consumer_files(
+            consumers, [], first, tmp_path, 0, use_summary_cache=False, summary_cache=run_cache
+        )
+        second = _provider("second")
+        _summarize_consumer_files(
+            consumers, [], second, tmp_path, 0, use_summary_cache=False, summary_cache=run_cache
+        )
+
+        first.analyze.assert_called_once()
+        second.analyze.assert_not_called()
+        assert not get_summary_cache_path(tmp_path).exists()
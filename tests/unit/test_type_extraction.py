@@ -237,3 +237,12 @@ public record Baz(int X);
         code = "// public class Commented {"
         types = extract_type_names_from_content(code)
         assert "Commented" not in types
+
+    def test_file_without_declaration_keywords(self):
+        """Files with no type/delegate keywords short-circuit to an empty set."""
+        code = "using System;\nnamespace Foo.Bar { }\n"
+        assert extract_type_names_from_content(code) == set()
+
+    def test_delegate_only_file(self):
+        code = "public delegate void Handler(object sender);"
+        assert extract_type_names_from_content(code) == {"Handler"}